@@ -0,0 +1,156 @@
+"""Suíte de benchmarks da API de produtos.
+
+Popula o banco com uma massa de dados de tamanho configurável, mede cada
+endpoint do product_controller com um cliente ASGI em processo e workers
+concorrentes, mede as camadas de repositório, serviço e schemas isoladamente
+e grava os resultados em JSON. Com `--baseline`, compara a execução com um
+resultado anterior e termina com erro se alguma métrica piorar além de
+`--threshold`.
+
+Uso (com o banco de dados configurado em DB_URL):
+
+    PYTHONPATH=src python -m benchmarks run --rows 10000 --output atual.json
+    PYTHONPATH=src python -m benchmarks run --baseline base.json --threshold 0.2
+    PYTHONPATH=src python -m benchmarks compare base.json atual.json
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from app.core.database import get_engine
+from benchmarks import http_load, layers, seed
+from benchmarks.results import (
+    Regression,
+    Result,
+    compare,
+    load,
+    print_regressions,
+    print_results,
+    save,
+)
+
+SUITES = ("http", "repository", "service", "schemas")
+DATABASE_SUITES = {"http", "repository", "service"}
+
+
+async def run_suites(arguments: argparse.Namespace) -> list[Result]:
+    suites = arguments.suite or list(SUITES)
+    results: list[Result] = []
+
+    if "schemas" in suites:
+        results += await layers.run(
+            layers.schema_operations(), arguments.iterations, arguments.warmup
+        )
+
+    if not DATABASE_SUITES.intersection(suites):
+        return results
+
+    try:
+        await seed.clear()
+        seeded_ids = await seed.seed(arguments.rows)
+
+        if "repository" in suites:
+            results += await layers.run(
+                layers.repository_operations(seeded_ids),
+                arguments.iterations,
+                arguments.warmup,
+            )
+        if "service" in suites:
+            results += await layers.run(
+                layers.service_operations(seeded_ids),
+                arguments.iterations,
+                arguments.warmup,
+            )
+        if "http" in suites:
+            results += await http_load.run(
+                seeded_ids, arguments.requests, arguments.concurrency, arguments.warmup
+            )
+    finally:
+        if not arguments.keep_data:
+            await seed.clear()
+        await get_engine().dispose()
+
+    return results
+
+
+def run(arguments: argparse.Namespace) -> int:
+    results = asyncio.run(run_suites(arguments))
+    parameters = {
+        name: getattr(arguments, name)
+        for name in ("rows", "requests", "concurrency", "iterations", "warmup")
+    }
+    save(arguments.output, results, parameters)
+
+    baseline = load(arguments.baseline) if arguments.baseline else {}
+    print_results(results, baseline)
+    print(f"\nResultados gravados em {arguments.output}")
+
+    if not baseline:
+        return 0
+
+    current = {result.name: result for result in results}
+    return report(compare(baseline, current, arguments.threshold), arguments.threshold)
+
+
+def compare_files(arguments: argparse.Namespace) -> int:
+    baseline, current = load(arguments.baseline), load(arguments.current)
+    print_results(list(current.values()), baseline)
+
+    return report(compare(baseline, current, arguments.threshold), arguments.threshold)
+
+
+def report(regressions: list[Regression], threshold: float) -> int:
+    if not regressions:
+        print(f"\nNenhuma regressão acima de {threshold:.0%}.")
+        return 0
+
+    print_regressions(regressions, threshold)
+    return 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.splitlines()[0]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Executa os benchmarks")
+    run_parser.add_argument(
+        "--suite",
+        action="append",
+        choices=SUITES,
+        help="Suíte a executar (repetível); padrão: todas",
+    )
+    run_parser.add_argument("--rows", type=int, default=10_000)
+    run_parser.add_argument("--requests", type=int, default=500)
+    run_parser.add_argument("--concurrency", type=int, default=10)
+    run_parser.add_argument("--iterations", type=int, default=1_000)
+    run_parser.add_argument("--warmup", type=int, default=50)
+    run_parser.add_argument(
+        "--output", type=Path, default=Path("benchmarks/results/latest.json")
+    )
+    run_parser.add_argument("--baseline", type=Path)
+    run_parser.add_argument("--threshold", type=float, default=0.2)
+    run_parser.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="Mantém os produtos criados pelos benchmarks ao final",
+    )
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compara dois resultados gravados"
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.2)
+    compare_parser.set_defaults(handler=compare_files)
+
+    return parser
+
+
+if __name__ == "__main__":
+    arguments = build_parser().parse_args()
+    sys.exit(arguments.handler(arguments))
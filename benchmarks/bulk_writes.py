@@ -0,0 +1,133 @@
+"""Benchmark das operações em lote do BaseRepository contra o laço item a item.
+
+O laço item a item reproduz o custo de uma requisição por produto: uma sessão,
+um comando e um COMMIT para cada item. As operações em lote gravam tudo em uma
+única transação, em blocos.
+
+Uso (com o banco de dados configurado em DB_URL):
+
+    PYTHONPATH=src python -m benchmarks.bulk_writes --rows 50000
+"""
+
+import argparse
+import asyncio
+import sys
+from time import perf_counter
+from uuid import UUID
+
+from app.core.database import async_session_maker, get_engine
+from app.repositories import ProductRepository
+from app.schemas import ProductRequest, ProductUpdate
+
+NAME_PREFIX = "bench-bulk-"
+
+
+def build_requests(rows: int) -> list[ProductRequest]:
+    return [
+        ProductRequest(name=f"{NAME_PREFIX}{index}", price=10.0 + index, quantity=1)
+        for index in range(rows)
+    ]
+
+
+async def run_per_item(rows: int) -> dict[str, float]:
+    """Cria, atualiza e remove `rows` produtos, um COMMIT por item."""
+    timings: dict[str, float] = {}
+    product_ids: list[UUID] = []
+
+    started = perf_counter()
+    for request in build_requests(rows):
+        async with async_session_maker() as session:
+            product = await ProductRepository(session).save(request)
+            await session.commit()
+            product_ids.append(product.id)
+    timings["create"] = perf_counter() - started
+
+    started = perf_counter()
+    for product_id in product_ids:
+        async with async_session_maker() as session:
+            await ProductRepository(session).update(
+                product_id, ProductUpdate(price=1.0)
+            )
+            await session.commit()
+    timings["update"] = perf_counter() - started
+
+    started = perf_counter()
+    for product_id in product_ids:
+        async with async_session_maker() as session:
+            await ProductRepository(session).delete(product_id)
+            await session.commit()
+    timings["delete"] = perf_counter() - started
+
+    return timings
+
+
+async def run_bulk(rows: int, chunk_size: int) -> dict[str, float]:
+    """Cria, atualiza e remove `rows` produtos com as operações em lote."""
+    timings: dict[str, float] = {}
+    requests = build_requests(rows)
+
+    started = perf_counter()
+    async with async_session_maker() as session:
+        products = await ProductRepository(session).save_many(requests, chunk_size)
+        await session.commit()
+    timings["create"] = perf_counter() - started
+
+    product_ids = [product.id for product in products]
+    changes = ProductUpdate(price=1.0)
+
+    started = perf_counter()
+    async with async_session_maker() as session:
+        await ProductRepository(session).update_many(
+            [(product_id, changes) for product_id in product_ids], chunk_size
+        )
+        await session.commit()
+    timings["update"] = perf_counter() - started
+
+    started = perf_counter()
+    async with async_session_maker() as session:
+        await ProductRepository(session).delete_many(product_ids, chunk_size)
+        await session.commit()
+    timings["delete"] = perf_counter() - started
+
+    return timings
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    try:
+        per_item = await run_per_item(arguments.per_item_rows)
+        bulk = await run_bulk(arguments.rows, arguments.chunk_size)
+    finally:
+        await get_engine().dispose()
+
+    print(
+        f"{'operação':<10}{'item a item (linhas/s)':>26}{'lote (linhas/s)':>20}{'ganho':>10}"
+    )
+    failed = False
+
+    for operation in ("create", "update", "delete"):
+        per_item_rate = arguments.per_item_rows / per_item[operation]
+        bulk_rate = arguments.rows / bulk[operation]
+        speedup = bulk_rate / per_item_rate
+        failed |= speedup < arguments.min_speedup
+        print(
+            f"{operation:<10}{per_item_rate:>26,.0f}{bulk_rate:>20,.0f}{speedup:>9.1f}x"
+        )
+
+    if failed:
+        print(f"Ganho abaixo do mínimo de {arguments.min_speedup}x", file=sys.stderr)
+
+    return int(failed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument(
+        "--per-item-rows",
+        type=int,
+        default=2_000,
+        help="Amostra usada no laço item a item; a vazão é comparada em linhas/s",
+    )
+    parser.add_argument("--chunk-size", type=int, default=1_000)
+    parser.add_argument("--min-speedup", type=float, default=20.0)
+    sys.exit(asyncio.run(main(parser.parse_args())))
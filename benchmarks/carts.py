@@ -0,0 +1,179 @@
+"""Benchmark dos carrinhos de compras com 1, 50 e 500 itens.
+
+Para cada tamanho em `--lines`, monta um carrinho com produtos de teste e mede
+p50, p99 e requisições por segundo de `GET /carts/{id}` e do fechamento
+(`POST /carts/{id}/checkout`), que é reabastecido antes de cada rodada. Conta
+também os comandos SQL de cada leitura: devem ser sempre um, qualquer que
+seja a quantidade de itens.
+
+Uso (com o banco de dados configurado em DB_URL e as migrações aplicadas):
+
+    PYTHONPATH=src python -m benchmarks.carts --lines 1 50 500 --reads 500
+"""
+
+import argparse
+import asyncio
+import sys
+from time import perf_counter
+from uuid import UUID, uuid4
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, event
+
+from app.core.database import async_session_maker, get_engine, session_scope
+from app.main import app
+from app.models.client_model import ClientModel
+from app.repositories import CartRepository, ProductRepository
+from app.schemas import CartRequest, ProductRequest
+from benchmarks.results import Result, print_results, summarize
+from benchmarks.seed import NAME_PREFIX, clear
+
+STOCK = 1_000_000
+
+
+async def create_products(count: int) -> list[UUID]:
+    async with session_scope(async_session_maker) as session:
+        products = await ProductRepository(session).save_many(
+            [
+                ProductRequest(
+                    name=f"{NAME_PREFIX}cart-{index}",
+                    price=1.0 + index % 100,
+                    quantity=STOCK,
+                )
+                for index in range(count)
+            ],
+            chunk_size=1_000,
+        )
+
+    return [product.id for product in products]
+
+
+async def create_client() -> UUID:
+    """Cria um cliente de teste direto no banco, sem o hash da senha."""
+    client_id = uuid4()
+
+    async with session_scope(async_session_maker) as session:
+        session.add(
+            ClientModel(
+                id=client_id,
+                name=f"{NAME_PREFIX}cart",
+                cpf=str(client_id.int)[:11],
+                email=f"{client_id.hex}@bench.invalid",
+                password="-",
+                age=30,
+                sex="M",
+                address="-",
+            )
+        )
+
+    return client_id
+
+
+async def fill_cart(cart_id: UUID, product_ids: list[UUID]) -> None:
+    async with session_scope(async_session_maker) as session:
+        repository = CartRepository(session)
+
+        for product_id in product_ids:
+            await repository.save_item(cart_id, product_id, 1)
+
+
+async def create_cart(client_id: UUID, product_ids: list[UUID]) -> UUID:
+    async with session_scope(async_session_maker) as session:
+        cart = await CartRepository(session).save(CartRequest(client_id=client_id))
+
+    await fill_cart(cart.id, product_ids)
+
+    return cart.id
+
+
+async def measure(
+    client: AsyncClient, name: str, method: str, path: str, repeat: int
+) -> Result:
+    latencies_ms: list[float] = []
+    started = perf_counter()
+
+    for _ in range(repeat):
+        request_started = perf_counter()
+        response = await client.request(method, path)
+        response.raise_for_status()
+        latencies_ms.append((perf_counter() - request_started) * 1_000)
+
+    return summarize(name, latencies_ms, perf_counter() - started)
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    statements = 0
+    results: list[Result] = []
+    statements_per_read: dict[int, float] = {}
+
+    def count_statement(*_) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(get_engine().sync_engine, "before_cursor_execute", count_statement)
+
+    try:
+        product_ids = await create_products(max(arguments.lines))
+        client_id = await create_client()
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            for lines in arguments.lines:
+                cart_id = await create_cart(client_id, product_ids[:lines])
+
+                before = statements
+                results.append(
+                    await measure(
+                        client,
+                        f"GET /carts/{{id}} ({lines} itens)",
+                        "GET",
+                        f"/carts/{cart_id}",
+                        arguments.reads,
+                    )
+                )
+                statements_per_read[lines] = (statements - before) / arguments.reads
+
+                # O fechamento esvazia o carrinho; o reabastecimento entre as
+                # rodadas fica fora da medição.
+                checkouts_ms: list[float] = []
+                for _ in range(arguments.checkouts):
+                    started = perf_counter()
+                    response = await client.post(f"/carts/{cart_id}/checkout")
+                    response.raise_for_status()
+                    checkouts_ms.append((perf_counter() - started) * 1_000)
+                    await fill_cart(cart_id, product_ids[:lines])
+                results.append(
+                    summarize(
+                        f"POST /carts/{{id}}/checkout ({lines} itens)",
+                        checkouts_ms,
+                        sum(checkouts_ms) / 1_000,
+                    )
+                )
+    finally:
+        event.remove(get_engine().sync_engine, "before_cursor_execute", count_statement)
+        async with session_scope(async_session_maker) as session:
+            await session.execute(
+                delete(ClientModel).where(ClientModel.name == f"{NAME_PREFIX}cart")
+            )
+        await clear()
+        await get_engine().dispose()
+
+    print_results(results, {})
+    print(f"\n{'itens':>8}{'comandos SQL por leitura':>28}")
+    for lines, per_read in statements_per_read.items():
+        print(f"{lines:>8}{per_read:>28.2f}")
+
+    if any(per_read > 1 for per_read in statements_per_read.values()):
+        print("A leitura do carrinho executou mais de um comando SQL", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="+", default=[1, 50, 500])
+    parser.add_argument("--reads", type=int, default=500)
+    parser.add_argument("--checkouts", type=int, default=20)
+    sys.exit(asyncio.run(main(parser.parse_args())))
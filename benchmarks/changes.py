@@ -0,0 +1,124 @@
+"""Benchmark do feed de alterações com milhares de assinantes ociosos.
+
+Para cada quantidade em `--subscribers`, abre os streams SSE de um
+`ChangeBroadcaster` em um único event loop, como em um worker, e mede a
+memória alocada por assinante ocioso. Depois publica `--events` eventos, um
+por vez, e mede o tempo até todos os assinantes receberem cada um (p50 e p99)
+e os eventos entregues por segundo. O banco de dados não é usado.
+
+Uso (com DB_URL configurada, exigida pelas configurações):
+
+    PYTHONPATH=src python -m benchmarks.changes --subscribers 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from collections.abc import AsyncIterator
+from time import perf_counter
+
+from app.core.changes import STREAM_PREAMBLE, ChangeBroadcaster, ChangeEvent
+from benchmarks.results import Result, print_results, summarize
+
+# Longo o bastante para que nenhum comentário de heartbeat seja enviado.
+HEARTBEAT_SECONDS = 3_600.0
+EVENT_DATA = b'{"name":"bench","price":10.5,"quantity":3}'
+
+
+class FanOut:
+    """Conta as entregas de um evento e avisa quando todos o receberam."""
+
+    def __init__(self, subscribers: int) -> None:
+        self.subscribers = subscribers
+        self.remaining = subscribers
+        self.done = asyncio.Event()
+
+    def start(self) -> None:
+        self.remaining = self.subscribers
+        self.done.clear()
+
+    def delivered(self) -> None:
+        self.remaining -= 1
+
+        if not self.remaining:
+            self.done.set()
+
+
+async def consume(stream: AsyncIterator[bytes], fan_out: FanOut) -> None:
+    async for frame in stream:
+        if frame != STREAM_PREAMBLE:
+            fan_out.delivered()
+
+
+async def run(subscribers: int, events: int) -> tuple[Result, float]:
+    """Retorna o resultado da entrega e os bytes alocados por assinante."""
+    broadcaster = ChangeBroadcaster(
+        history_size=1_024,
+        buffer_size=256,
+        max_subscribers=subscribers,
+        heartbeat=HEARTBEAT_SECONDS,
+    )
+    fan_out = FanOut(subscribers)
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tasks = [
+        asyncio.create_task(consume(broadcaster.stream(), fan_out))
+        for _ in range(subscribers)
+    ]
+
+    while len(broadcaster.subscriptions) < subscribers:
+        await asyncio.sleep(0)
+
+    # Deixa todos os streams chegarem à espera por eventos.
+    await asyncio.sleep(0.1)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies_ms: list[float] = []
+    started = perf_counter()
+
+    for _ in range(events):
+        fan_out.start()
+        published = perf_counter()
+        broadcaster.publish([ChangeEvent.create("updated", EVENT_DATA)])
+        await fan_out.done.wait()
+        latencies_ms.append((perf_counter() - published) * 1_000)
+
+    elapsed = perf_counter() - started
+    broadcaster.close()
+    await asyncio.gather(*tasks)
+    result = summarize(f"fan-out ({subscribers} assinantes)", latencies_ms, elapsed)
+
+    return result, (after - before) / subscribers
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    results: list[Result] = []
+    memory: dict[int, float] = {}
+
+    for subscribers in arguments.subscribers:
+        result, per_subscriber = await run(subscribers, arguments.events)
+        results.append(result)
+        memory[subscribers] = per_subscriber
+
+    print_results(results, {})
+    print(f"\n{'assinantes':>12}{'KiB por assinante':>20}{'entregas/s':>14}")
+    for result, (subscribers, per_subscriber) in zip(
+        results, memory.items(), strict=True
+    ):
+        print(
+            f"{subscribers:>12}{per_subscriber / 1_024:>20.2f}"
+            f"{result.rps * subscribers:>14,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--subscribers", type=int, nargs="+", default=[100, 1_000, 10_000]
+    )
+    parser.add_argument("--events", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
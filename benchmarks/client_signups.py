@@ -0,0 +1,236 @@
+"""Latência das leituras de produtos durante uma rajada de cadastros de clientes.
+
+Mede o p50 e o p99 de `GET /products/{id}` com `--readers` leitores
+concorrentes em três rodadas: sem cadastros, durante uma rajada de
+`--signups` cadastros com o hash das senhas no pool configurado e, para
+comparação, durante a mesma rajada com o hash executado direto no event loop.
+Termina com erro se o p99 com o pool passar de `--max-ratio` vezes o p99 sem
+cadastros.
+
+Uso (com o banco de dados configurado em DB_URL e as migrações aplicadas):
+
+    PYTHONPATH=src python -m benchmarks.client_signups --signups 50
+"""
+
+import argparse
+import asyncio
+import sys
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
+from itertools import cycle
+from time import perf_counter
+from uuid import UUID
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
+
+from app.core import get_settings
+from app.core.database import async_session_maker, get_engine, session_scope
+from app.core.offload import BoundedExecutor, get_password_executor
+from app.core.security import hash_password
+from app.main import app
+from app.models.client_model import ClientModel
+from benchmarks.results import Result, summarize
+from benchmarks.seed import NAME_PREFIX, clear, seed
+
+
+class InlineExecutor(Executor):
+    """Executa cada tarefa na hora, na thread que a enviou (o event loop)."""
+
+    def submit[T](self, function: Callable[..., T], /, *args, **kwargs) -> Future[T]:
+        future: Future[T] = Future()
+        future.set_result(function(*args, **kwargs))
+
+        return future
+
+
+def build_cpf(number: int) -> str:
+    """Gera um CPF válido a partir dos nove primeiros dígitos."""
+    digits = [int(digit) for digit in f"{number:09d}"]
+
+    for position in (9, 10):
+        total = sum(
+            digit * (position + 1 - index)
+            for index, digit in enumerate(digits[:position])
+        )
+        digits.append(0 if total % 11 < 2 else 11 - total % 11)
+
+    return "".join(map(str, digits))
+
+
+def client_payload(index: int) -> dict[str, object]:
+    return {
+        "name": f"Cliente {index}",
+        "cpf": build_cpf(100_000_000 + index),
+        "email": f"{NAME_PREFIX}{index}@example.com",
+        "age": 30,
+        "sex": "F",
+        "address": "Rua do Benchmark, 1",
+        "password": f"Senha#{index:06d}",
+    }
+
+
+async def clear_clients() -> int:
+    """Remove os clientes criados pelo benchmark."""
+    async with session_scope(async_session_maker) as session:
+        result = await session.execute(
+            delete(ClientModel).where(ClientModel.email.startswith(NAME_PREFIX))
+        )
+
+    return result.rowcount
+
+
+async def read_products(
+    client: AsyncClient, product_ids: list[UUID], readers: int, stop: asyncio.Event
+) -> tuple[list[float], float]:
+    """Lê produtos até `stop` e retorna as latências e a duração da leitura."""
+    paths = cycle(f"/products/{product_id}" for product_id in product_ids)
+    latencies: list[float] = []
+
+    async def reader() -> None:
+        while not stop.is_set():
+            started = perf_counter()
+            response = await client.get(next(paths))
+            latencies.append((perf_counter() - started) * 1_000)
+            response.raise_for_status()
+
+    started = perf_counter()
+    async with asyncio.TaskGroup() as group:
+        for _ in range(readers):
+            group.create_task(reader())
+
+    return latencies, perf_counter() - started
+
+
+async def run_round(
+    client: AsyncClient,
+    name: str,
+    product_ids: list[UUID],
+    readers: int,
+    signups: range,
+    seconds: float,
+) -> tuple[Result, Counter[int]]:
+    """Mede as leituras enquanto os cadastros de `signups` são enviados juntos."""
+    stop = asyncio.Event()
+    reading = asyncio.create_task(read_products(client, product_ids, readers, stop))
+
+    statuses: Counter[int] = Counter()
+
+    try:
+        if signups:
+            responses = await asyncio.gather(
+                *(
+                    client.post("/clients/", json=client_payload(index))
+                    for index in signups
+                )
+            )
+            statuses.update(response.status_code for response in responses)
+        else:
+            await asyncio.sleep(seconds)
+    finally:
+        stop.set()
+        latencies, elapsed = await reading
+
+    return summarize(name, latencies, elapsed), statuses
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    signups = arguments.signups
+    rounds: list[tuple[Result, Counter[int]]] = []
+
+    try:
+        product_ids = await seed(arguments.rows, "signups")
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            # Aquece o cache de leitura e os workers do pool, para medir só a
+            # disputa pelo event loop.
+            await run_round(client, "aquecimento", product_ids, 1, range(0), 0.5)
+            await asyncio.gather(
+                *(
+                    get_password_executor().run(hash_password, "aquecimento")
+                    for _ in range(get_settings().PASSWORD_HASH_WORKERS)
+                )
+            )
+            rounds.append(
+                await run_round(
+                    client,
+                    "sem cadastros",
+                    product_ids,
+                    arguments.readers,
+                    range(0),
+                    arguments.baseline_seconds,
+                )
+            )
+            rounds.append(
+                await run_round(
+                    client,
+                    "hash no pool",
+                    product_ids,
+                    arguments.readers,
+                    range(signups),
+                    0,
+                )
+            )
+
+            if not arguments.skip_inline:
+                app.dependency_overrides[get_password_executor] = lambda: (
+                    BoundedExecutor("inline", InlineExecutor(), max_pending=signups)
+                )
+                try:
+                    rounds.append(
+                        await run_round(
+                            client,
+                            "hash no event loop",
+                            product_ids,
+                            arguments.readers,
+                            range(signups, 2 * signups),
+                            0,
+                        )
+                    )
+                finally:
+                    app.dependency_overrides.pop(get_password_executor)
+    finally:
+        await clear_clients()
+        await clear()
+        await get_engine().dispose()
+
+    print(
+        f"\n{'rodada':<22}{'leituras':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}"
+        f"{'cadastros':>12}"
+    )
+    for result, statuses in rounds:
+        accepted = f"{statuses[201]}/{statuses.total()}" if statuses else "-"
+        print(
+            f"{result.name:<22}{result.count:>10}{result.p50_ms:>10.2f}"
+            f"{result.p99_ms:>10.2f}{accepted:>12}"
+        )
+
+    (baseline, _), (offloaded, statuses) = rounds[:2]
+    print(f"\nrecusados com 503: {statuses[503]}")
+
+    if offloaded.p99_ms > baseline.p99_ms * arguments.max_ratio:
+        print(
+            f"p99 com o pool ({offloaded.p99_ms:.2f} ms) passou de "
+            f"{arguments.max_ratio}x o p99 sem cadastros ({baseline.p99_ms:.2f} ms)"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--signups", type=int, default=50)
+    parser.add_argument("--baseline-seconds", type=float, default=3.0)
+    parser.add_argument("--max-ratio", type=float, default=2.0)
+    parser.add_argument(
+        "--skip-inline",
+        action="store_true",
+        help="Não executa a rodada com o hash no event loop",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,134 @@
+"""Latência das primeiras requisições depois da inicialização do servidor.
+
+Inicia `python -m app.server` com um worker duas vezes: com o aquecimento
+da inicialização (padrão) e com `DB_POOL_WARMUP_CONNECTIONS=0`. Em cada
+execução, assim que `/health/ready` responde, envia `--requests` leituras
+`GET /products/{id}` com `--concurrency` conexões (a "partida a frio") e, em
+seguida, a mesma quantidade com IDs diferentes (o regime estável). Os IDs
+nunca se repetem, para que todas as leituras cheguem ao banco de dados.
+Termina com erro se, com o aquecimento, o p99 da partida a frio passar de
+`--max-ratio` vezes o p99 do regime estável.
+
+Uso (com o banco de dados configurado em DB_URL e as migrações aplicadas):
+
+    PYTHONPATH=src python -m benchmarks.cold_start --requests 200
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+from time import perf_counter
+
+from httpx import AsyncClient, Limits
+
+from benchmarks.results import Result, summarize
+from benchmarks.server_scaling import (
+    HOST,
+    SHUTDOWN_TIMEOUT,
+    cleanup,
+    prepare,
+    wait_until_ready,
+)
+
+
+async def fire(name: str, base_url: str, paths: list[str], concurrency: int) -> Result:
+    """Envia cada requisição de `paths` uma vez, com `concurrency` conexões."""
+    latencies: list[float] = []
+    pending = iter(paths)
+    limits = Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with AsyncClient(base_url=base_url, limits=limits) as client:
+
+        async def worker() -> None:
+            for path in pending:
+                started = perf_counter()
+                response = await client.get(path)
+                latencies.append((perf_counter() - started) * 1_000)
+                response.raise_for_status()
+
+        started = perf_counter()
+        async with asyncio.TaskGroup() as group:
+            for _ in range(concurrency):
+                group.create_task(worker())
+
+    return summarize(name, latencies, perf_counter() - started)
+
+
+def measure(
+    warm_up: bool, paths: list[str], arguments: argparse.Namespace
+) -> tuple[Result, Result]:
+    """Inicia o servidor e mede a partida a frio e o regime estável."""
+    base_url = f"http://{HOST}:{arguments.port}"
+    environment = {**os.environ, "LOG_LEVEL": "WARNING"}
+
+    if not warm_up:
+        environment["DB_POOL_WARMUP_CONNECTIONS"] = "0"
+
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "app.server",
+            "--host",
+            HOST,
+            "--port",
+            str(arguments.port),
+            "--workers",
+            "1",
+        ],
+        env=environment,
+    )
+
+    try:
+        wait_until_ready(base_url, server)
+        first, rest = paths[: arguments.requests], paths[arguments.requests :]
+        cold = asyncio.run(fire("a frio", base_url, first, arguments.concurrency))
+        steady = asyncio.run(fire("estável", base_url, rest, arguments.concurrency))
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(SHUTDOWN_TIMEOUT)
+
+    return cold, steady
+
+
+def main(arguments: argparse.Namespace) -> int:
+    # Cada execução usa IDs próprios, para não encontrar o cache preenchido.
+    product_ids = asyncio.run(prepare(4 * arguments.requests))
+    paths = [f"/products/{product_id}" for product_id in product_ids]
+    half = 2 * arguments.requests
+    results: dict[str, tuple[Result, Result]] = {}
+
+    try:
+        results["com aquecimento"] = measure(True, paths[:half], arguments)
+        results["sem aquecimento"] = measure(False, paths[half:], arguments)
+    finally:
+        asyncio.run(cleanup())
+
+    print(
+        f"\n{'execução':<18}{'p99 a frio (ms)':>17}{'p99 estável (ms)':>18}{'razão':>8}"
+    )
+    for name, (cold, steady) in results.items():
+        ratio = cold.p99_ms / steady.p99_ms if steady.p99_ms else 0.0
+        print(f"{name:<18}{cold.p99_ms:>17.2f}{steady.p99_ms:>18.2f}{ratio:>8.2f}")
+
+    cold, steady = results["com aquecimento"]
+    if cold.p99_ms > steady.p99_ms * arguments.max_ratio:
+        print(
+            f"p99 a frio ({cold.p99_ms:.2f} ms) passou de {arguments.max_ratio}x "
+            f"o p99 estável ({steady.p99_ms:.2f} ms)"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--max-ratio", type=float, default=1.5)
+    sys.exit(main(parser.parse_args()))
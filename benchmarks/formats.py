@@ -0,0 +1,111 @@
+"""Benchmark dos formatos e codificações de resposta da listagem de produtos.
+
+Para cada combinação de formato (JSON ou MessagePack) e codificação (sem
+compressão, gzip, brotli ou zstd), mede os bytes enviados, o tempo de CPU do
+servidor para serializar e comprimir a página e o tempo do cliente para
+descomprimir e decodificar a resposta.
+
+Não usa banco de dados; as linhas são instâncias transitórias do ProductModel.
+
+Uso:
+
+    PYTHONPATH=src python -m benchmarks.formats --rows 1000
+"""
+
+import argparse
+import json
+import zlib
+from collections.abc import Callable
+from functools import partial
+from statistics import median
+from time import process_time
+
+import brotli
+import msgpack
+import zstandard
+
+from app.core.compression import COMPRESSORS
+from app.core.responses import ModelJSONResponse, ModelMsgPackResponse, RowSerializer
+from app.schemas import ProductResponse
+from benchmarks.serialization import build_rows
+
+type Page = dict[str, object]
+
+FORMATS: dict[str, tuple[type[ModelJSONResponse], Callable[[bytes], object]]] = {
+    "json": (ModelJSONResponse, json.loads),
+    "msgpack": (ModelMsgPackResponse, msgpack.unpackb),
+}
+DECOMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "identity": lambda body: body,
+    "gzip": lambda body: zlib.decompress(body, 47),
+    "br": brotli.decompress,
+    "zstd": lambda body: zstandard.ZstdDecompressor().decompressobj().decompress(body),
+}
+
+
+def encode(page: Page, response_class: type[ModelJSONResponse], encoding: str) -> bytes:
+    body = response_class(page).body
+
+    if encoding == "identity":
+        return body
+
+    return COMPRESSORS[encoding]().finish(body)
+
+
+def decode_body(
+    body: bytes,
+    decode: Callable[[bytes], object],
+    decompress: Callable[[bytes], bytes],
+) -> object:
+    return decode(decompress(body))
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """Mediana do tempo de CPU do processo, em milissegundos."""
+    timings: list[float] = []
+
+    for _ in range(repeat):
+        started = process_time()
+        function()
+        timings.append((process_time() - started) * 1_000)
+
+    return median(timings)
+
+
+def main(arguments: argparse.Namespace) -> None:
+    page: Page = {
+        "items": RowSerializer(ProductResponse).to_dicts(build_rows(arguments.rows)),
+        "next_cursor": None,
+    }
+    expected = json.loads(ModelJSONResponse(page).body)
+
+    print(
+        f"{'formato':<10}{'codificação':<13}{'bytes':>10}{'servidor (ms)':>15}"
+        f"{'cliente (ms)':>14}"
+    )
+    for format_name, (response_class, decode) in FORMATS.items():
+        for encoding, decompress in DECOMPRESSORS.items():
+            body = encode(page, response_class, encoding)
+
+            if decode_body(body, decode, decompress) != expected:
+                raise SystemExit(
+                    f"{format_name}/{encoding} gerou um conteúdo diferente."
+                )
+
+            server = measure(
+                partial(encode, page, response_class, encoding), arguments.repeat
+            )
+            client = measure(
+                partial(decode_body, body, decode, decompress), arguments.repeat
+            )
+            print(
+                f"{format_name:<10}{encoding:<13}{len(body):>10}{server:>15.3f}"
+                f"{client:>14.3f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    main(parser.parse_args())
@@ -0,0 +1,217 @@
+"""Carga HTTP nos endpoints de produtos, com cliente ASGI em processo.
+
+Cada cenário dispara um número fixo de requisições contra a aplicação por meio
+do `httpx.ASGITransport`, sem rede nem servidor, com vários workers
+concorrentes. Mede a latência de cada requisição e o throughput do cenário.
+"""
+
+import asyncio
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from itertools import cycle
+from time import perf_counter
+from typing import Any
+from uuid import UUID
+
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from benchmarks.results import Result, summarize
+from benchmarks.seed import build_products, seed
+
+type RequestSpec = tuple[str, str, dict[str, Any]]
+
+BULK_SIZE = 100
+BATCH_GET_SIZE = 40
+
+
+@dataclass(slots=True)
+class Scenario:
+    """Endpoint exercitado por um cenário de carga."""
+
+    name: str
+    build: Callable[[int], RequestSpec]
+    expected_status: int = 200
+    max_requests: int | None = None
+
+
+def _product_payload(index: int, label: str) -> dict[str, Any]:
+    return build_products(1, f"{label}-{index}")[0].model_dump()
+
+
+async def build_scenarios(seeded_ids: list[UUID], requests: int) -> list[Scenario]:
+    """Monta os cenários de todos os endpoints do product_controller.
+
+    Os cenários de remoção recebem produtos próprios, para não apagar a
+    massa de dados usada pelas leituras.
+    """
+    read_ids = cycle(seeded_ids)
+    delete_ids = iter(await seed(requests, "del"))
+    bulk_delete_ids = iter(await seed(requests * BULK_SIZE, "bdel"))
+
+    def next_ids(ids: Iterator[UUID], count: int) -> list[str]:
+        return [str(next(ids)) for _ in range(count)]
+
+    return [
+        Scenario(
+            "POST /products",
+            lambda index: (
+                "POST",
+                "/products/",
+                {"json": _product_payload(index, "p")},
+            ),
+            expected_status=201,
+        ),
+        Scenario(
+            "GET /products/{id}",
+            lambda _: ("GET", f"/products/{next(read_ids)}", {}),
+        ),
+        Scenario(
+            "GET /products/{id} If-None-Match",
+            lambda _: (
+                "GET",
+                f"/products/{next(read_ids)}",
+                {"headers": {"If-None-Match": "*"}},
+            ),
+            expected_status=304,
+        ),
+        Scenario(
+            "POST /products/batch-get",
+            lambda _: (
+                "POST",
+                "/products/batch-get",
+                {"json": {"ids": next_ids(read_ids, BATCH_GET_SIZE)}},
+            ),
+        ),
+        Scenario(
+            "GET /products",
+            lambda _: ("GET", "/products/", {"params": {"limit": 50}}),
+        ),
+        Scenario(
+            "GET /products If-None-Match",
+            lambda _: (
+                "GET",
+                "/products/",
+                {"params": {"limit": 50}, "headers": {"If-None-Match": "*"}},
+            ),
+            expected_status=304,
+        ),
+        Scenario(
+            "GET /products?filtros",
+            lambda _: (
+                "GET",
+                "/products/",
+                {
+                    "params": {
+                        "limit": 50,
+                        "sort_by": "price",
+                        "order": "desc",
+                        "min_price": 100,
+                        "max_quantity": 500,
+                    }
+                },
+            ),
+        ),
+        Scenario(
+            "PATCH /products/{id}",
+            lambda index: (
+                "PATCH",
+                f"/products/{next(read_ids)}",
+                {"json": {"quantity": 1 + index % 1_000}},
+            ),
+        ),
+        Scenario(
+            "DELETE /products/{id}",
+            lambda _: ("DELETE", f"/products/{next(delete_ids)}", {}),
+            expected_status=204,
+        ),
+        Scenario(
+            "POST /products/bulk",
+            lambda index: (
+                "POST",
+                "/products/bulk",
+                {
+                    "json": {
+                        "items": [
+                            item.model_dump()
+                            for item in build_products(BULK_SIZE, f"b{index}")
+                        ]
+                    }
+                },
+            ),
+        ),
+        Scenario(
+            "PATCH /products/bulk",
+            lambda index: (
+                "PATCH",
+                "/products/bulk",
+                {
+                    "json": {
+                        "items": [
+                            {"id": product_id, "price": 1.0 + index % 100}
+                            for product_id in next_ids(read_ids, BULK_SIZE)
+                        ]
+                    }
+                },
+            ),
+        ),
+        Scenario(
+            "DELETE /products/bulk",
+            lambda _: (
+                "DELETE",
+                "/products/bulk",
+                {"json": {"ids": next_ids(bulk_delete_ids, BULK_SIZE)}},
+            ),
+        ),
+        Scenario(
+            "GET /products/export",
+            lambda _: ("GET", "/products/export", {}),
+            max_requests=20,
+        ),
+    ]
+
+
+async def drive(
+    client: AsyncClient, scenario: Scenario, requests: int, concurrency: int
+) -> Result:
+    """Executa um cenário com `concurrency` workers dividindo as requisições."""
+    total = min(requests, scenario.max_requests or requests)
+    indexes = iter(range(total))
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        for index in indexes:
+            method, url, options = scenario.build(index)
+            started = perf_counter()
+            response = await client.request(method, url, **options)
+            latencies.append((perf_counter() - started) * 1_000)
+
+            if response.status_code != scenario.expected_status:
+                raise RuntimeError(
+                    f"{scenario.name}: status {response.status_code} "
+                    f"(esperado {scenario.expected_status}): {response.text[:200]}"
+                )
+
+    started = perf_counter()
+    async with asyncio.TaskGroup() as group:
+        for _ in range(concurrency):
+            group.create_task(worker())
+
+    return summarize(f"http {scenario.name}", latencies, perf_counter() - started)
+
+
+async def run(
+    seeded_ids: list[UUID], requests: int, concurrency: int, warmup: int
+) -> list[Result]:
+    """Executa todos os cenários HTTP, cada um após um aquecimento."""
+    results: list[Result] = []
+    scenarios = await build_scenarios(seeded_ids, requests + warmup)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for scenario in scenarios:
+            if warmup:
+                await drive(client, scenario, warmup, concurrency)
+            results.append(await drive(client, scenario, requests, concurrency))
+
+    return results
@@ -0,0 +1,113 @@
+"""Benchmark de inserção com chaves primárias UUIDv4 e UUIDv7.
+
+Para cada estratégia, cria uma tabela com as colunas de `tb_products` e grava
+`--rows` linhas em blocos de `--batch-size`, cada bloco com COPY e o próprio
+COMMIT. Mostra a vazão total, a vazão no último décimo das linhas (quando o
+índice já é grande) e o tamanho final da tabela e do índice da chave
+primária. Com UUIDv4, cada inserção cai em uma folha aleatória do índice;
+com UUIDv7, sempre na última.
+
+Uso (com o banco de dados configurado em DB_URL):
+
+    PYTHONPATH=src python -m benchmarks.id_locality --rows 5000000
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from time import perf_counter
+from uuid import UUID, uuid4
+
+from asyncpg import Connection
+
+from app.core.database import get_engine
+from app.core.ids import uuid7
+
+STRATEGIES: dict[str, Callable[[], UUID]] = {"uuid4": uuid4, "uuid7": uuid7}
+TABLE_PREFIX = "bench_ids_"
+COLUMNS = ["id", "name", "price", "quantity"]
+MIB = 1024 * 1024
+
+
+async def run_strategy(
+    connection: Connection, strategy: str, rows: int, batch_size: int
+) -> dict[str, float]:
+    """Insere `rows` linhas com os IDs da estratégia e mede vazão e tamanhos."""
+    table = f"{TABLE_PREFIX}{strategy}"
+    generate = STRATEGIES[strategy]
+    await connection.execute(f"DROP TABLE IF EXISTS {table}")
+    await connection.execute(
+        f"CREATE TABLE {table} (id uuid PRIMARY KEY, name varchar(25) NOT NULL, "
+        "price double precision NOT NULL, quantity integer NOT NULL)"
+    )
+
+    elapsed = tail_elapsed = 0.0
+    tail_start = rows - rows // 10
+
+    for start in range(0, rows, batch_size):
+        size = min(batch_size, rows - start)
+        records = [
+            (generate(), f"bench-id-{start + index}", 1.5, 1) for index in range(size)
+        ]
+
+        started = perf_counter()
+        await connection.copy_records_to_table(table, records=records, columns=COLUMNS)
+        batch_elapsed = perf_counter() - started
+
+        elapsed += batch_elapsed
+        if start >= tail_start:
+            tail_elapsed += batch_elapsed
+
+    sizes = await connection.fetchrow(
+        "SELECT pg_relation_size($1::regclass) AS heap, "
+        "pg_relation_size($2::regclass) AS index",
+        table,
+        f"{table}_pkey",
+    )
+
+    return {
+        "rate": rows / elapsed,
+        "tail_rate": (rows - tail_start) / tail_elapsed if tail_elapsed else 0.0,
+        "heap_mib": sizes["heap"] / MIB,
+        "index_mib": sizes["index"] / MIB,
+    }
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    results: dict[str, dict[str, float]] = {}
+
+    try:
+        async with get_engine().connect() as connection:
+            connection = await connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            raw_connection = await connection.get_raw_connection()
+            driver = raw_connection.driver_connection
+
+            try:
+                for strategy in STRATEGIES:
+                    results[strategy] = await run_strategy(
+                        driver, strategy, arguments.rows, arguments.batch_size
+                    )
+            finally:
+                for table in (f"{TABLE_PREFIX}{strategy}" for strategy in STRATEGIES):
+                    await driver.execute(f"DROP TABLE IF EXISTS {table}")
+    finally:
+        await get_engine().dispose()
+
+    print(
+        f"{'estratégia':<12}{'linhas/s':>12}{'último 10% (linhas/s)':>24}"
+        f"{'tabela (MiB)':>14}{'índice PK (MiB)':>17}"
+    )
+    for strategy, result in results.items():
+        print(
+            f"{strategy:<12}{result['rate']:>12,.0f}{result['tail_rate']:>24,.0f}"
+            f"{result['heap_mib']:>14.1f}{result['index_mib']:>17.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    asyncio.run(main(parser.parse_args()))
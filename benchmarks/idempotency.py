@@ -0,0 +1,145 @@
+"""Benchmark das chaves de idempotência sob tempestades de retentativas.
+
+Mede p50, p99 e requisições por segundo de `POST /products/` sem chave, com
+uma chave nova por requisição e repetindo uma chave já usada, caso em que a
+resposta gravada é devolvida sem executar a escrita. Depois dispara
+`--concurrency` requisições simultâneas com a mesma chave, `--storms` vezes, e
+confere que cada tempestade criou um único produto.
+
+Uso (com o banco de dados configurado em DB_URL e as migrações aplicadas):
+
+    PYTHONPATH=src python -m benchmarks.idempotency --requests 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import sys
+from time import perf_counter
+from uuid import uuid4
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, func, select
+
+from app.core.database import async_session_maker, get_engine, session_scope
+from app.main import app
+from app.models import IdempotencyKeyModel, ProductModel
+from benchmarks.results import Result, print_results, summarize
+from benchmarks.seed import NAME_PREFIX, clear
+
+KEY_PREFIX = "bench-"
+
+
+def product(index: int) -> dict[str, object]:
+    return {"name": f"{NAME_PREFIX}idempotency-{index}", "price": 10.5, "quantity": 3}
+
+
+async def post(
+    client: AsyncClient, body: dict[str, object], key: str | None
+) -> tuple[float, str]:
+    """Envia a criação e retorna a latência em ms e o ID do produto criado."""
+    headers = {"Idempotency-Key": key} if key else {}
+    started = perf_counter()
+    response = await client.post("/products/", json=body, headers=headers)
+    response.raise_for_status()
+
+    return (perf_counter() - started) * 1_000, response.json()["id"]
+
+
+async def measure(
+    client: AsyncClient, name: str, requests: int, key: str | None, fresh: bool
+) -> Result:
+    latencies_ms: list[float] = []
+    started = perf_counter()
+
+    for index in range(requests):
+        request_key = f"{key}-{index}" if key and fresh else key
+        latency_ms, _ = await post(client, product(index), request_key)
+        latencies_ms.append(latency_ms)
+
+    return summarize(name, latencies_ms, perf_counter() - started)
+
+
+async def count_products(name: str) -> int:
+    async with session_scope(async_session_maker, read_only=True) as session:
+        result = await session.execute(
+            select(func.count()).where(ProductModel.name == name)
+        )
+
+    return result.scalar_one()
+
+
+async def storm(client: AsyncClient, index: int, concurrency: int) -> int:
+    """Repete a mesma criação em paralelo e retorna quantos produtos ela criou."""
+    body = product(1_000_000 + index)
+    key = f"{KEY_PREFIX}storm-{uuid4()}"
+    await asyncio.gather(*(post(client, body, key) for _ in range(concurrency)))
+
+    return await count_products(body["name"])
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    results: list[Result] = []
+    duplicated = 0
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            # Garante que a chave repetida já tenha a resposta gravada.
+            await post(client, product(0), f"{KEY_PREFIX}replay")
+
+            results.append(
+                await measure(
+                    client,
+                    "POST /products/ (sem chave)",
+                    arguments.requests,
+                    None,
+                    False,
+                )
+            )
+            results.append(
+                await measure(
+                    client,
+                    "POST /products/ (chave nova)",
+                    arguments.requests,
+                    f"{KEY_PREFIX}{uuid4()}",
+                    True,
+                )
+            )
+            results.append(
+                await measure(
+                    client,
+                    "POST /products/ (repetição)",
+                    arguments.requests,
+                    f"{KEY_PREFIX}replay",
+                    False,
+                )
+            )
+
+            for index in range(arguments.storms):
+                duplicated += await storm(client, index, arguments.concurrency) - 1
+    finally:
+        async with session_scope(async_session_maker) as session:
+            await session.execute(
+                delete(IdempotencyKeyModel).where(
+                    IdempotencyKeyModel.key.startswith(KEY_PREFIX)
+                )
+            )
+        await clear()
+        await get_engine().dispose()
+
+    print_results(results, {})
+    print(
+        f"\n{arguments.storms} tempestades de {arguments.concurrency} requisições: "
+        f"{duplicated} execuções duplicadas"
+    )
+
+    return 1 if duplicated else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--storms", type=int, default=10)
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,124 @@
+"""Benchmark da importação de produtos com COPY e upsert.
+
+Gera arquivos CSV ou NDJSON em blocos, sem montá-los em memória, e os importa
+com `ProductService.import_products` para cada tamanho em `--rows`. Mostra a
+vazão em linhas/s e o pico de memória alocada (tracemalloc), que deve ficar
+estável conforme o arquivo cresce. Por fim, os produtos importados são
+removidos.
+
+Uso (com o banco de dados configurado em DB_URL e as migrações aplicadas):
+
+    PYTHONPATH=src python -m benchmarks.imports --rows 10000 100000 --format csv
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tracemalloc
+from collections.abc import AsyncIterator
+from time import perf_counter
+
+from sqlalchemy import delete
+
+from app.core import get_cache, get_settings
+from app.core.database import async_session_maker, get_engine, session_scope
+from app.models import ProductModel
+from app.schemas import ExportFormat
+from app.services import ProductService
+
+NAME_PREFIX = "bench-import-"
+LINES_PER_CHUNK = 1_000
+
+
+def encode_line(index: int, import_format: ExportFormat) -> str:
+    name = f"{NAME_PREFIX}{index}"
+    price = 10.0 + index % 1_000
+
+    if import_format is ExportFormat.CSV:
+        return f"{name},{price},{index % 100}\n"
+
+    return json.dumps({"name": name, "price": price, "quantity": index % 100}) + "\n"
+
+
+async def generate(rows: int, import_format: ExportFormat) -> AsyncIterator[bytes]:
+    """Gera o arquivo de importação em blocos de LINES_PER_CHUNK linhas."""
+    if import_format is ExportFormat.CSV:
+        yield b"name,price,quantity\n"
+
+    for start in range(0, rows, LINES_PER_CHUNK):
+        yield "".join(
+            encode_line(index, import_format)
+            for index in range(start, min(start + LINES_PER_CHUNK, rows))
+        ).encode()
+
+
+async def run_import(
+    rows: int, import_format: ExportFormat, batch_size: int
+) -> tuple[float, float]:
+    """Importa `rows` produtos e retorna a vazão e o pico de memória em MiB."""
+    tracemalloc.start()
+    started = perf_counter()
+
+    async with session_scope(async_session_maker) as session:
+        result = await ProductService(session, get_cache()).import_products(
+            generate(rows, import_format), import_format, batch_size
+        )
+
+    elapsed = perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if result.inserted != rows:
+        raise SystemExit(f"Esperadas {rows} inserções, obtidas {result.inserted}.")
+
+    return rows / elapsed, peak / 1024 / 1024
+
+
+async def clear() -> None:
+    async with session_scope(async_session_maker) as session:
+        await session.execute(
+            delete(ProductModel).where(ProductModel.name.startswith(NAME_PREFIX))
+        )
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    results: list[tuple[int, float, float]] = []
+
+    try:
+        for rows in arguments.rows:
+            rate, peak = await run_import(rows, arguments.format, arguments.batch_size)
+            results.append((rows, rate, peak))
+            await clear()
+    finally:
+        await clear()
+        await get_engine().dispose()
+
+    print(f"{'linhas':>10}{'linhas/s':>14}{'pico de memória (MiB)':>24}")
+    for rows, rate, peak in results:
+        print(f"{rows:>10,}{rate:>14,.0f}{peak:>24.1f}")
+
+    slowest = min(rate for _, rate, _ in results)
+    if slowest < arguments.min_rate:
+        print(
+            f"Vazão abaixo do mínimo de {arguments.min_rate:,.0f} linhas/s",
+            file=sys.stderr,
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 500_000]
+    )
+    parser.add_argument(
+        "--format", type=ExportFormat, choices=list(ExportFormat), default="csv"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=get_settings().IMPORT_BATCH_SIZE
+    )
+    parser.add_argument("--min-rate", type=float, default=20_000.0)
+    sys.exit(asyncio.run(main(parser.parse_args())))
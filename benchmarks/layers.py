@@ -0,0 +1,140 @@
+"""Micro-benchmarks das camadas de repositório, serviço e schemas.
+
+Cada cenário chama uma única operação da camada, em sequência, para isolar o
+seu custo do restante da pilha HTTP. Os cenários de repositório e de serviço
+abrem uma sessão por chamada, como uma requisição faria.
+"""
+
+from collections.abc import Awaitable, Callable
+from itertools import cycle
+from time import perf_counter
+from uuid import UUID, uuid4
+
+from app.core import get_cache
+from app.core.database import async_session_maker, session_scope
+from app.core.responses import RowSerializer
+from app.models import ProductModel
+from app.repositories import ProductRepository
+from app.schemas import (
+    ProductFilter,
+    ProductQueryParams,
+    ProductRequest,
+    ProductResponse,
+    SortOrder,
+)
+from app.services import ProductService
+from benchmarks.results import Result, summarize
+
+type Operation = Callable[[], Awaitable[object]]
+
+PAGE_SIZE = 50
+
+
+async def measure(name: str, operation: Operation, iterations: int) -> Result:
+    """Executa a operação `iterations` vezes e agrega as latências."""
+    latencies: list[float] = []
+
+    started = perf_counter()
+    for _ in range(iterations):
+        call_started = perf_counter()
+        await operation()
+        latencies.append((perf_counter() - call_started) * 1_000)
+
+    return summarize(name, latencies, perf_counter() - started)
+
+
+def repository_operations(seeded_ids: list[UUID]) -> dict[str, Operation]:
+    ids = cycle(seeded_ids)
+    price_filter = ProductRepository.build_filters(
+        ProductFilter(min_price=100, max_quantity=500)
+    )
+
+    async def find_by_id() -> None:
+        async with session_scope(async_session_maker, read_only=True) as session:
+            await ProductRepository(session).find_by_id(next(ids))
+
+    async def find_all() -> None:
+        async with session_scope(async_session_maker, read_only=True) as session:
+            await ProductRepository(session).find_all(limit=PAGE_SIZE)
+
+    async def find_all_filtered() -> None:
+        async with session_scope(async_session_maker, read_only=True) as session:
+            await ProductRepository(session).find_all(
+                *price_filter,
+                limit=PAGE_SIZE,
+                sort_by="price",
+                order=SortOrder.DESC,
+            )
+
+    return {
+        "repository find_by_id": find_by_id,
+        "repository find_all": find_all,
+        "repository find_all filtrado": find_all_filtered,
+    }
+
+
+def service_operations(seeded_ids: list[UUID]) -> dict[str, Operation]:
+    ids = cycle(seeded_ids)
+    query_params = ProductQueryParams(limit=PAGE_SIZE)
+
+    async def get_product_json() -> None:
+        async with session_scope(async_session_maker, read_only=True) as session:
+            await ProductService(session, get_cache()).get_product_json(next(ids))
+
+    async def list_all_products() -> None:
+        async with session_scope(async_session_maker, read_only=True) as session:
+            await ProductService(session, get_cache()).list_all_products(query_params)
+
+    return {
+        "service get_product_json": get_product_json,
+        "service list_all_products": list_all_products,
+    }
+
+
+def schema_operations() -> dict[str, Operation]:
+    payload = {"name": "bench-schema", "price": 10.5, "quantity": 3}
+    rows = [
+        ProductModel(id=uuid4(), name=f"bench-{index}", price=1.5, quantity=1)
+        for index in range(PAGE_SIZE)
+    ]
+    response = ProductResponse.model_validate(rows[0])
+    serializer = RowSerializer(ProductResponse)
+
+    async def validate_request() -> None:
+        ProductRequest.model_validate(payload)
+
+    async def validate_query_params() -> None:
+        ProductQueryParams.model_validate(
+            {"limit": PAGE_SIZE, "sort_by": "price", "min_price": 1, "max_price": 9}
+        )
+
+    async def validate_orm_page() -> None:
+        [ProductResponse.model_validate(row) for row in rows]
+
+    async def project_orm_page() -> None:
+        serializer.to_dicts(rows)
+
+    async def dump_response() -> None:
+        response.model_dump_json()
+
+    return {
+        "schema ProductRequest validate": validate_request,
+        "schema ProductQueryParams validate": validate_query_params,
+        f"schema ProductResponse x{PAGE_SIZE} do ORM": validate_orm_page,
+        f"schema RowSerializer x{PAGE_SIZE}": project_orm_page,
+        "schema ProductResponse dump_json": dump_response,
+    }
+
+
+async def run(
+    operations: dict[str, Operation], iterations: int, warmup: int
+) -> list[Result]:
+    """Executa os cenários de uma camada, cada um após um aquecimento."""
+    results: list[Result] = []
+
+    for name, operation in operations.items():
+        if warmup:
+            await measure(name, operation, warmup)
+        results.append(await measure(name, operation, iterations))
+
+    return results
@@ -0,0 +1,66 @@
+"""Benchmark da leitura por ID em sessões transacionais e somente leitura.
+
+Mede a latência de `find_by_id` no mesmo caminho usado por GET /products/{id}:
+abrir a sessão, consultar e encerrá-la. A sessão transacional executa
+BEGIN/COMMIT; a somente leitura usa autocommit e não faz COMMIT.
+
+Uso (com o banco de dados configurado em DB_URL):
+
+    PYTHONPATH=src python -m benchmarks.read_only_sessions --iterations 5000
+"""
+
+import argparse
+import asyncio
+from statistics import quantiles
+from time import perf_counter
+from uuid import UUID
+
+from app.core.database import async_session_maker, get_engine, session_scope
+from app.repositories import ProductRepository
+from app.schemas import ProductRequest
+
+
+async def measure(product_id: UUID, iterations: int, read_only: bool) -> list[float]:
+    latencies: list[float] = []
+
+    for _ in range(iterations):
+        started = perf_counter()
+        async with session_scope(async_session_maker, read_only=read_only) as session:
+            await ProductRepository(session).find_by_id(product_id)
+        latencies.append((perf_counter() - started) * 1_000)
+
+    return latencies
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    async with session_scope(async_session_maker) as session:
+        product = await ProductRepository(session).save(
+            ProductRequest(name="bench-read-only", price=1.0, quantity=1)
+        )
+
+    try:
+        await measure(product.id, arguments.warmup, read_only=False)
+        results = {
+            "transacional": await measure(
+                product.id, arguments.iterations, read_only=False
+            ),
+            "somente leitura": await measure(
+                product.id, arguments.iterations, read_only=True
+            ),
+        }
+    finally:
+        async with session_scope(async_session_maker) as session:
+            await ProductRepository(session).delete(product.id)
+        await get_engine().dispose()
+
+    print(f"{'sessão':<18}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    for name, latencies in results.items():
+        percentiles = quantiles(latencies, n=100)
+        print(f"{name:<18}{percentiles[49]:>10.3f}{percentiles[98]:>10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5_000)
+    parser.add_argument("--warmup", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
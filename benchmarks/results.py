@@ -0,0 +1,149 @@
+"""Resultados dos benchmarks: agregação, persistência em JSON e comparação."""
+
+import json
+import platform
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from statistics import quantiles
+
+TRACKED_PACKAGES = ("fastapi", "starlette", "sqlalchemy", "pydantic", "asyncpg")
+
+
+@dataclass(slots=True)
+class Result:
+    """Métricas de um cenário de benchmark."""
+
+    name: str
+    count: int
+    p50_ms: float
+    p99_ms: float
+    rps: float
+
+
+@dataclass(slots=True)
+class Regression:
+    """Métrica que piorou além do limite em relação à execução base."""
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+
+
+def summarize(name: str, latencies_ms: list[float], elapsed_seconds: float) -> Result:
+    """Calcula p50, p99 e requisições por segundo de um cenário."""
+    if len(latencies_ms) < 2:
+        p50 = p99 = latencies_ms[0] if latencies_ms else 0.0
+    else:
+        percentiles = quantiles(latencies_ms, n=100, method="inclusive")
+        p50, p99 = percentiles[49], percentiles[98]
+
+    return Result(
+        name=name,
+        count=len(latencies_ms),
+        p50_ms=p50,
+        p99_ms=p99,
+        rps=len(latencies_ms) / elapsed_seconds if elapsed_seconds else 0.0,
+    )
+
+
+def environment() -> dict[str, str]:
+    """Versões do Python e das bibliotecas que influenciam os resultados."""
+    versions = {"python": platform.python_version()}
+    for package in TRACKED_PACKAGES:
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            continue
+
+    return versions
+
+
+def save(path: Path, results: list[Result], parameters: dict[str, object]) -> None:
+    """Grava os resultados de uma execução em JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "environment": environment(),
+        "parameters": parameters,
+        "results": {result.name: asdict(result) for result in results},
+    }
+    path.write_text(json.dumps(document, indent=2, ensure_ascii=False) + "\n")
+
+
+def load(path: Path) -> dict[str, Result]:
+    """Lê os resultados gravados por `save`."""
+    document = json.loads(path.read_text())
+    return {name: Result(**data) for name, data in document["results"].items()}
+
+
+def compare(
+    baseline: dict[str, Result], current: dict[str, Result], threshold: float
+) -> list[Regression]:
+    """Lista os cenários cujo p50 subiu ou cujo throughput caiu além do limite.
+
+    O p99 é exibido, mas não reprova a execução: com poucas amostras ele
+    oscila demais para servir de critério.
+    """
+    regressions: list[Regression] = []
+
+    for name, result in current.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+
+        if reference.p50_ms and result.p50_ms / reference.p50_ms - 1 > threshold:
+            regressions.append(
+                Regression(
+                    name,
+                    "p50_ms",
+                    reference.p50_ms,
+                    result.p50_ms,
+                    result.p50_ms / reference.p50_ms - 1,
+                )
+            )
+        if result.rps and reference.rps / result.rps - 1 > threshold:
+            regressions.append(
+                Regression(
+                    name,
+                    "rps",
+                    reference.rps,
+                    result.rps,
+                    result.rps / reference.rps - 1,
+                )
+            )
+
+    return regressions
+
+
+def print_results(results: list[Result], baseline: dict[str, Result]) -> None:
+    """Exibe a tabela de resultados, com a variação do p50 quando houver base."""
+    print(
+        f"{'cenário':<40}{'n':>7}{'p50 (ms)':>11}{'p99 (ms)':>11}"
+        f"{'req/s':>10}{'Δp50':>9}"
+    )
+    for result in results:
+        reference = baseline.get(result.name)
+        change = (
+            f"{(result.p50_ms / reference.p50_ms - 1) * 100:+.0f}%"
+            if reference and reference.p50_ms
+            else "-"
+        )
+        print(
+            f"{result.name:<40}{result.count:>7}{result.p50_ms:>11.3f}"
+            f"{result.p99_ms:>11.3f}{result.rps:>10.1f}{change:>9}"
+        )
+
+
+def print_regressions(regressions: list[Regression], threshold: float) -> None:
+    """Exibe as regressões encontradas na comparação."""
+    print(f"\n{len(regressions)} regressão(ões) acima de {threshold:.0%}:")
+    for regression in regressions:
+        print(
+            f"  {regression.name} [{regression.metric}]: "
+            f"{regression.baseline:.3f} -> {regression.current:.3f} "
+            f"({regression.change:+.0%})"
+        )
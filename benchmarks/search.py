@@ -0,0 +1,147 @@
+"""Benchmark da busca de produtos pelo nome em uma tabela grande.
+
+Popula tb_products com `--rows` produtos gerados no próprio servidor e mede
+`ProductRepository.search` nos modos prefix, contains e fulltext, com termos
+seletivos e aleatórios. Falha se o p50 de algum modo passar de `--target-ms`.
+
+A busca fulltext ordena por relevância todas as linhas encontradas, então
+termos muito frequentes (por exemplo, só "mouse") custam proporcionalmente à
+quantidade de resultados.
+
+Uso (com o banco de dados configurado em DB_URL e as migrações aplicadas):
+
+    PYTHONPATH=src python -m benchmarks.search --rows 5000000
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+from collections.abc import Callable
+from statistics import quantiles
+from time import perf_counter
+
+from sqlalchemy import func, select, text
+
+from app.core.database import async_session_maker, get_engine, session_scope
+from app.models import ProductModel
+from app.repositories import ProductRepository
+from app.schemas import ProductSearchMode
+from benchmarks.seed import NAME_PREFIX, clear
+
+WORDS = (
+    "Notebook", "Mouse", "Teclado", "Monitor", "Cadeira", "Mesa", "Headset",
+    "Webcam", "Caneta", "Caderno", "Mochila", "Garrafa", "Fone", "Tablet",
+    "Celular", "Camera", "Lampada", "Cabo", "Carregador", "Roteador",
+)  # fmt: skip
+SEED_BATCH_SIZE = 500_000
+
+SEED_STATEMENT = text(
+    """
+    INSERT INTO tb_products (id, name, price, quantity)
+    SELECT
+        gen_random_uuid(),
+        CAST(:prefix AS text)
+            || (CAST(:words AS text[]))[1 + i % cardinality(CAST(:words AS text[]))]
+            || ' ' || i,
+        1 + (i * 7919) % 10000 / 10.0,
+        1 + (i * 104729) % 1000
+    FROM generate_series(CAST(:start AS bigint), CAST(:stop AS bigint) - 1) AS i
+    """
+)
+
+
+def word(index: int) -> str:
+    return WORDS[index % len(WORDS)]
+
+
+TERMS: dict[ProductSearchMode, Callable[[int], str]] = {
+    ProductSearchMode.PREFIX: lambda i: f"{NAME_PREFIX}{word(i)} {i}",
+    ProductSearchMode.CONTAINS: lambda i: f"{word(i)[1:].lower()} {i}",
+    ProductSearchMode.FULLTEXT: lambda i: f"{word(i)} {i}",
+}
+
+
+async def seed(rows: int) -> None:
+    async with session_scope(async_session_maker) as session:
+        existing = await session.scalar(
+            select(func.count()).where(ProductModel.name.startswith(NAME_PREFIX))
+        )
+
+    for start in range(existing, rows, SEED_BATCH_SIZE):
+        stop = min(start + SEED_BATCH_SIZE, rows)
+        async with session_scope(async_session_maker) as session:
+            await session.execute(
+                SEED_STATEMENT,
+                {
+                    "prefix": NAME_PREFIX,
+                    "words": list(WORDS),
+                    "start": start,
+                    "stop": stop,
+                },
+            )
+        print(f"{stop} produtos carregados", flush=True)
+
+    async with get_engine().connect() as connection:
+        await connection.execute(text("ANALYZE tb_products"))
+        await connection.commit()
+
+
+async def measure(
+    mode: ProductSearchMode, rows: int, iterations: int, limit: int
+) -> list[float]:
+    latencies: list[float] = []
+    generator = random.Random(42)
+
+    for _ in range(iterations):
+        term = TERMS[mode](generator.randrange(rows))
+        started = perf_counter()
+        async with session_scope(async_session_maker, read_only=True) as session:
+            await ProductRepository(session).search(term, mode, limit)
+        latencies.append((perf_counter() - started) * 1_000)
+
+    return latencies
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    failed = False
+
+    try:
+        await seed(arguments.rows)
+
+        print(f"\n{'modo':<10}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+        for mode in ProductSearchMode:
+            await measure(mode, arguments.rows, arguments.warmup, arguments.limit)
+            percentiles = quantiles(
+                await measure(
+                    mode, arguments.rows, arguments.iterations, arguments.limit
+                ),
+                n=100,
+            )
+            failed |= percentiles[49] > arguments.target_ms
+            print(f"{mode:<10}{percentiles[49]:>10.3f}{percentiles[98]:>10.3f}")
+    finally:
+        if not arguments.keep_data:
+            await clear()
+        await get_engine().dispose()
+
+    if failed:
+        print(f"\nAo menos um modo ficou acima de {arguments.target_ms} ms no p50.")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--iterations", type=int, default=1_000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--target-ms", type=float, default=10.0)
+    parser.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="Mantém os produtos carregados para as próximas execuções",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,44 @@
+"""Carga e limpeza dos produtos usados pelos benchmarks."""
+
+from uuid import UUID
+
+from sqlalchemy import delete
+
+from app.core.database import async_session_maker, session_scope
+from app.models import ProductModel
+from app.repositories import ProductRepository
+from app.schemas import ProductRequest
+
+NAME_PREFIX = "bench-"
+
+
+def build_products(count: int, label: str = "seed") -> list[ProductRequest]:
+    """Gera produtos determinísticos, com preços e quantidades variados."""
+    return [
+        ProductRequest(
+            name=f"{NAME_PREFIX}{label}-{index}",
+            price=round(1.0 + (index * 7919) % 10_000 / 10, 2),
+            quantity=1 + (index * 104_729) % 1_000,
+        )
+        for index in range(count)
+    ]
+
+
+async def seed(count: int, label: str = "seed", chunk_size: int = 1_000) -> list[UUID]:
+    """Insere `count` produtos e retorna os seus IDs."""
+    async with session_scope(async_session_maker) as session:
+        products = await ProductRepository(session).save_many(
+            build_products(count, label), chunk_size
+        )
+
+    return [product.id for product in products]
+
+
+async def clear() -> int:
+    """Remove todos os produtos criados pelos benchmarks."""
+    async with session_scope(async_session_maker) as session:
+        result = await session.execute(
+            delete(ProductModel).where(ProductModel.name.startswith(NAME_PREFIX))
+        )
+
+    return result.rowcount
@@ -0,0 +1,94 @@
+"""Benchmark da serialização da listagem de produtos.
+
+Compara o caminho padrão do FastAPI (modelo por linha, revalidação pelo
+`response_model` e `json.dumps`) com a ModelJSONResponse sobre modelos já
+validados e com a projeção direta das linhas pelo RowSerializer.
+
+Não usa banco de dados; as linhas são instâncias transitórias do ProductModel.
+
+Uso:
+
+    PYTHONPATH=src python -m benchmarks.serialization --rows 10000
+"""
+
+import argparse
+import json
+from collections.abc import Callable
+from statistics import median
+from time import perf_counter
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from app.core.responses import ModelJSONResponse, RowSerializer
+from app.models import ProductModel
+from app.schemas import Page, ProductResponse
+
+
+def build_rows(count: int) -> list[ProductModel]:
+    return [
+        ProductModel(
+            id=uuid4(), name=f"produto-{index}", price=index + 1.5, quantity=index + 1
+        )
+        for index in range(count)
+    ]
+
+
+def fastapi_default(rows: list[ProductModel]) -> bytes:
+    items = [ProductResponse.model_validate(row) for row in rows]
+    adapter = TypeAdapter(Page[ProductResponse])
+    page = adapter.validate_python({"items": items, "next_cursor": None})
+    content = adapter.dump_python(page, mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def validated_models(rows: list[ProductModel]) -> bytes:
+    items = [ProductResponse.model_validate(row) for row in rows]
+    return ModelJSONResponse({"items": items, "next_cursor": None}).body
+
+
+def projected_rows(rows: list[ProductModel]) -> bytes:
+    items = RowSerializer(ProductResponse).to_dicts(rows)
+    return ModelJSONResponse({"items": items, "next_cursor": None}).body
+
+
+def measure(
+    serialize: Callable[[list[ProductModel]], bytes],
+    rows: list[ProductModel],
+    repeat: int,
+) -> float:
+    timings: list[float] = []
+
+    for _ in range(repeat):
+        started = perf_counter()
+        serialize(rows)
+        timings.append((perf_counter() - started) * 1_000)
+
+    return median(timings)
+
+
+def main(arguments: argparse.Namespace) -> None:
+    rows = build_rows(arguments.rows)
+    strategies = {
+        "padrão do FastAPI": fastapi_default,
+        "modelos validados": validated_models,
+        "projeção de linhas": projected_rows,
+    }
+
+    expected = json.loads(fastapi_default(rows))
+    for name, serialize in strategies.items():
+        if json.loads(serialize(rows)) != expected:
+            raise SystemExit(f"A estratégia '{name}' gerou um JSON diferente.")
+
+    baseline = measure(fastapi_default, rows, arguments.repeat)
+    print(f"{'estratégia':<22}{'mediana (ms)':>14}{'ganho':>8}")
+    for name, serialize in strategies.items():
+        elapsed = measure(serialize, rows, arguments.repeat)
+        print(f"{name:<22}{elapsed:>14.2f}{baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    main(parser.parse_args())
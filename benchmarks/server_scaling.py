@@ -0,0 +1,195 @@
+"""Escalabilidade do servidor de produção com a quantidade de workers.
+
+Para cada valor de `--workers`, inicia `python -m app.server` em uma porta
+local, aguarda o servidor responder e mede o throughput e a latência de
+`GET /products/{id}` por HTTP real durante `--seconds` segundos. A carga é
+gerada por `--client-processes` processos, cada um com `--concurrency`
+conexões keep-alive, para que o cliente não seja o gargalo. Ao final, o
+servidor é encerrado com SIGTERM e precisa terminar sem erro.
+
+Com o gerador de carga na mesma máquina, os números só escalam enquanto
+sobram núcleos para os clientes; para medições definitivas, rode o
+gerador em outra máquina.
+
+Uso (com o banco de dados configurado em DB_URL e as migrações aplicadas):
+
+    PYTHONPATH=src python -m benchmarks.server_scaling --workers 1 2 4
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import cycle
+from time import perf_counter, sleep
+from uuid import UUID
+
+from httpx import AsyncClient, Client, HTTPError, Limits
+
+from app.core.database import get_engine
+from benchmarks.results import Result, summarize
+from benchmarks.seed import clear, seed
+
+HOST = "127.0.0.1"
+STARTUP_TIMEOUT = 60.0
+SHUTDOWN_TIMEOUT = 60.0
+
+
+async def _drive(
+    base_url: str, paths: list[str], concurrency: int, seconds: float
+) -> list[float]:
+    latencies: list[float] = []
+    next_path = cycle(paths).__next__
+    limits = Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with AsyncClient(base_url=base_url, limits=limits) as client:
+        deadline = perf_counter() + seconds
+
+        async def worker() -> None:
+            while perf_counter() < deadline:
+                started = perf_counter()
+                response = await client.get(next_path())
+                latencies.append((perf_counter() - started) * 1_000)
+                response.raise_for_status()
+
+        async with asyncio.TaskGroup() as group:
+            for _ in range(concurrency):
+                group.create_task(worker())
+
+    return latencies
+
+
+def drive(
+    base_url: str, paths: list[str], concurrency: int, seconds: float
+) -> list[float]:
+    """Gera carga por `seconds` segundos; executado em um processo cliente."""
+    return asyncio.run(_drive(base_url, paths, concurrency, seconds))
+
+
+def wait_until_ready(base_url: str, server: subprocess.Popen) -> None:
+    deadline = perf_counter() + STARTUP_TIMEOUT
+
+    with Client(base_url=base_url) as client:
+        while perf_counter() < deadline:
+            if server.poll() is not None:
+                raise SystemExit(f"O servidor encerrou com código {server.poll()}.")
+            try:
+                if client.get("/health/ready").status_code == 200:
+                    return
+            except HTTPError:
+                pass
+            sleep(0.2)
+
+    raise SystemExit("O servidor não respondeu a tempo.")
+
+
+def measure(workers: int, paths: list[str], arguments: argparse.Namespace) -> Result:
+    """Inicia o servidor com `workers` processos e mede a carga sobre ele."""
+    base_url = f"http://{HOST}:{arguments.port}"
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "app.server",
+            "--host",
+            HOST,
+            "--port",
+            str(arguments.port),
+            "--workers",
+            str(workers),
+        ],
+        env={**os.environ, "LOG_LEVEL": "WARNING"},
+    )
+
+    try:
+        wait_until_ready(base_url, server)
+
+        with ProcessPoolExecutor(
+            max_workers=arguments.client_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+
+            def run(seconds: float) -> tuple[list[float], float]:
+                started = perf_counter()
+                clients = [
+                    pool.submit(drive, base_url, paths, arguments.concurrency, seconds)
+                    for _ in range(arguments.client_processes)
+                ]
+                latencies = [
+                    latency for client in clients for latency in client.result()
+                ]
+
+                return latencies, perf_counter() - started
+
+            # O aquecimento preenche o cache de leitura de cada worker.
+            run(arguments.warmup)
+            latencies, elapsed = run(arguments.seconds)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(SHUTDOWN_TIMEOUT)
+
+    # Depois de encerrar, o uvicorn repassa o SIGTERM recebido ao próprio processo.
+    if server.returncode not in (0, -signal.SIGTERM):
+        raise SystemExit(f"O servidor encerrou com código {server.returncode}.")
+
+    return summarize(f"{workers} worker(s)", latencies, elapsed)
+
+
+async def prepare(rows: int) -> list[UUID]:
+    try:
+        return await seed(rows, "scaling")
+    finally:
+        await get_engine().dispose()
+
+
+async def cleanup() -> None:
+    try:
+        await clear()
+    finally:
+        await get_engine().dispose()
+
+
+def main(arguments: argparse.Namespace) -> None:
+    product_ids = asyncio.run(prepare(arguments.rows))
+    paths = [f"/products/{product_id}" for product_id in product_ids]
+    results: list[Result] = []
+
+    try:
+        for workers in arguments.workers:
+            results.append(measure(workers, paths, arguments))
+    finally:
+        asyncio.run(cleanup())
+
+    base_rps = results[0].rps / arguments.workers[0]
+    print(
+        f"\n{'workers':<14}{'req/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}"
+        f"{'eficiência':>12}"
+    )
+    for workers, result in zip(arguments.workers, results):
+        efficiency = result.rps / (base_rps * workers) if base_rps else 0.0
+        print(
+            f"{result.name:<14}{result.rps:>10.1f}{result.p50_ms:>10.2f}"
+            f"{result.p99_ms:>10.2f}{efficiency:>12.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="Quantidades de workers medidas, em ordem",
+    )
+    parser.add_argument("--rows", type=int, default=1_000)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--client-processes", type=int, default=2)
+    main(parser.parse_args())
@@ -0,0 +1,155 @@
+"""Perfil da inicialização: importações e tempo até a primeira requisição.
+
+Importa `app.main` em `--repeat` processos novos com `python -X importtime`
+e mostra a mediana do tempo próprio e do acumulado dos módulos mais lentos e
+o tempo próprio somado por pacote. Em seguida, a menos que `--imports-only`
+seja usado, inicia `python -m app.server` com um worker `--runs` vezes e mede
+o tempo até `/health/ready` responder 200 e até a primeira `GET /products/`
+ser respondida.
+
+Uso (com DB_URL configurada; a medição do servidor exige as migrações):
+
+    PYTHONPATH=src python -m benchmarks.startup --top 25
+"""
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+from collections import defaultdict
+from statistics import median
+from time import perf_counter, sleep
+
+from httpx import Client, HTTPError
+
+from benchmarks.server_scaling import HOST, SHUTDOWN_TIMEOUT, STARTUP_TIMEOUT
+
+TARGET = "app.main"
+POLL_INTERVAL = 0.01
+
+
+def profile_imports() -> dict[str, tuple[float, float]]:
+    """Importa a aplicação em um processo novo e retorna os tempos em ms.
+
+    Para cada módulo, retorna o tempo próprio e o acumulado (com os módulos
+    que ele importou).
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, tuple[float, float]] = {}
+
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        own, cumulative, module = line.removeprefix("import time:").split("|")
+        timings[module.strip()] = (int(own) / 1_000, int(cumulative) / 1_000)
+
+    return timings
+
+
+def median_timings(
+    runs: list[dict[str, tuple[float, float]]],
+) -> dict[str, tuple[float, float]]:
+    modules = {module for timings in runs for module in timings}
+
+    return {
+        module: (
+            median(timings.get(module, (0.0, 0.0))[0] for timings in runs),
+            median(timings.get(module, (0.0, 0.0))[1] for timings in runs),
+        )
+        for module in modules
+    }
+
+
+def time_to_first_request(port: int) -> tuple[float, float]:
+    """Inicia o servidor e retorna, em ms, o tempo até ficar pronto e responder."""
+    base_url = f"http://{HOST}:{port}"
+    started = perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "app.server",
+            "--host",
+            HOST,
+            "--port",
+            str(port),
+            "--workers",
+            "1",
+        ],
+        env={**os.environ, "LOG_LEVEL": "WARNING"},
+    )
+
+    try:
+        with Client(base_url=base_url) as client:
+            while True:
+                if (code := server.poll()) is not None:
+                    raise SystemExit(f"O servidor encerrou com código {code}.")
+                if perf_counter() - started > STARTUP_TIMEOUT:
+                    raise SystemExit("O servidor não respondeu a tempo.")
+                try:
+                    if client.get("/health/ready").status_code == 200:
+                        break
+                except HTTPError:
+                    pass
+                sleep(POLL_INTERVAL)
+
+            ready = perf_counter() - started
+            client.get("/products/", params={"limit": 1}).raise_for_status()
+            first_request = perf_counter() - started
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(SHUTDOWN_TIMEOUT)
+
+    return ready * 1_000, first_request * 1_000
+
+
+def main(arguments: argparse.Namespace) -> None:
+    timings = median_timings([profile_imports() for _ in range(arguments.repeat)])
+    packages: dict[str, float] = defaultdict(float)
+
+    for module, (own, _) in timings.items():
+        packages[module.partition(".")[0]] += own
+
+    print(f"importação de {TARGET}: {timings[TARGET][1]:.1f} ms\n")
+    print(f"{'módulo':<52}{'próprio (ms)':>14}{'acumulado (ms)':>16}")
+    for module, (own, cumulative) in sorted(
+        timings.items(), key=lambda item: item[1][0], reverse=True
+    )[: arguments.top]:
+        print(f"{module:<52}{own:>14.2f}{cumulative:>16.2f}")
+
+    print(f"\n{'pacote':<52}{'próprio (ms)':>14}")
+    for package, own in sorted(
+        packages.items(), key=lambda item: item[1], reverse=True
+    )[: arguments.top]:
+        print(f"{package:<52}{own:>14.2f}")
+
+    if arguments.imports_only:
+        return
+
+    measurements = [
+        time_to_first_request(arguments.port) for _ in range(arguments.runs)
+    ]
+    ready_ms, first_request_ms = (median(values) for values in zip(*measurements))
+    print(f"\npronto (/health/ready): {ready_ms:.1f} ms")
+    print(f"primeira requisição: {first_request_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument(
+        "--imports-only",
+        action="store_true",
+        help="Não inicia o servidor; mede apenas a importação",
+    )
+    main(parser.parse_args())
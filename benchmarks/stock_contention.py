@@ -0,0 +1,143 @@
+"""Reservas concorrentes de estoque sobre produtos muito disputados.
+
+Dispara `--reservers` reservas simultâneas de uma unidade contra um único
+produto com `--stock` unidades, depois reservas em lote sobre dois produtos
+enviados em ordens diferentes e, por fim, a mesma carga espalhada por produtos
+distintos, e mostra o throughput de cada rodada. As garantias de que nenhuma
+reserva passa do estoque ficam nos testes em `tests/test_stock_contention.py`.
+
+Uso (com o banco de dados configurado em DB_URL e as migrações aplicadas):
+
+    PYTHONPATH=src python -m benchmarks.stock_contention --reservers 500
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from time import perf_counter
+from uuid import UUID
+
+from httpx import ASGITransport, AsyncClient
+
+from app.core.database import async_session_maker, get_engine, session_scope
+from app.main import app
+from app.repositories import ProductRepository
+from app.schemas import ProductRequest
+from benchmarks.seed import NAME_PREFIX, clear
+
+
+@dataclass(slots=True)
+class Outcome:
+    """Resultado de uma rodada de reservas concorrentes."""
+
+    name: str
+    statuses: Counter[int]
+    elapsed: float
+
+    @property
+    def accepted(self) -> int:
+        return self.statuses[200]
+
+    @property
+    def rps(self) -> float:
+        return self.statuses.total() / self.elapsed if self.elapsed else 0.0
+
+
+async def create_products(count: int, stock: int, label: str) -> list[UUID]:
+    async with session_scope(async_session_maker) as session:
+        products = await ProductRepository(session).save_many(
+            [
+                ProductRequest(
+                    name=f"{NAME_PREFIX}{label}-{index}", price=1.0, quantity=stock
+                )
+                for index in range(count)
+            ],
+            chunk_size=1_000,
+        )
+
+    return [product.id for product in products]
+
+
+async def fire(
+    client: AsyncClient, name: str, requests: list[tuple[str, dict]]
+) -> Outcome:
+    started = perf_counter()
+    responses = await asyncio.gather(
+        *(client.post(path, json=payload) for path, payload in requests)
+    )
+
+    return Outcome(
+        name,
+        Counter(response.status_code for response in responses),
+        perf_counter() - started,
+    )
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    reservers, stock = arguments.reservers, arguments.stock
+    outcomes: list[Outcome] = []
+    generator = random.Random(42)
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            (hot_id,) = await create_products(1, stock, "hot")
+            outcome = await fire(
+                client,
+                "produto disputado",
+                [(f"/products/{hot_id}/reserve", {"quantity": 1})] * reservers,
+            )
+            outcomes.append(outcome)
+
+            pair = await create_products(2, stock, "pair")
+            batches = []
+            for _ in range(reservers):
+                items = [{"id": str(product_id), "quantity": 1} for product_id in pair]
+                generator.shuffle(items)
+                batches.append(("/products/reserve", {"items": items}))
+            outcomes.append(await fire(client, "lote com dois produtos", batches))
+
+            spread = await create_products(reservers, 1, "spread")
+            outcome = await fire(
+                client,
+                "produtos distintos",
+                [
+                    (f"/products/{product_id}/reserve", {"quantity": 1})
+                    for product_id in spread
+                ],
+            )
+            outcomes.append(outcome)
+    finally:
+        if not arguments.keep_data:
+            await clear()
+        await get_engine().dispose()
+
+    print(f"\n{'rodada':<24}{'aceitas':>10}{'409':>8}{'req/s':>12}")
+    for outcome in outcomes:
+        print(
+            f"{outcome.name:<24}{outcome.accepted:>10}"
+            f"{outcome.statuses[409]:>8}{outcome.rps:>12.1f}"
+        )
+
+    hot, distinct = outcomes[0], outcomes[-1]
+    if distinct.rps:
+        ratio = hot.rps / distinct.rps
+        print(f"\nproduto disputado: {ratio:.0%} do throughput de produtos distintos")
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reservers", type=int, default=500)
+    parser.add_argument("--stock", type=int, default=100)
+    parser.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="Mantém os produtos criados ao final da execução",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -6,11 +6,11 @@ from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
-from app.core import settings
+from app.core import get_settings
 from app.models import Base
 
 config = context.config
-config.set_main_option("sqlalchemy.url", settings.DB_URL)
+config.set_main_option("sqlalchemy.url", get_settings().DB_URL)
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
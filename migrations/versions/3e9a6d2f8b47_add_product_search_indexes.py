@@ -0,0 +1,67 @@
+"""Adiciona os índices da busca de produtos pelo nome
+
+Revision ID: 3e9a6d2f8b47
+Revises: 8c4f0a3e6b21
+Create Date: 2026-10-18 14:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e9a6d2f8b47"
+down_revision: str | Sequence[str] | None = "8c4f0a3e6b21"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY não bloqueia as escritas na tabela durante a criação, mas
+    # não pode rodar dentro de uma transação.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tb_products_name_c_id",
+            "tb_products",
+            [sa.text('(name COLLATE "C")'), "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_tb_products_name_trgm",
+            "tb_products",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_tb_products_name_search_vector",
+            "tb_products",
+            [sa.text("to_tsvector('simple'::regconfig, name)")],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name in (
+            "ix_tb_products_name_search_vector",
+            "ix_tb_products_name_trgm",
+            "ix_tb_products_name_c_id",
+        ):
+            op.drop_index(
+                index_name,
+                table_name="tb_products",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
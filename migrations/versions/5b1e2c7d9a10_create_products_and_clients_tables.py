@@ -0,0 +1,67 @@
+"""Cria as tabelas de produtos e clientes
+
+Revision ID: 5b1e2c7d9a10
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e2c7d9a10"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tb_products",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("name", sa.String(length=25), nullable=False),
+        sa.Column("price", sa.Float(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "tb_clients",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("name", sa.String(length=30), nullable=False),
+        sa.Column("cpf", sa.String(length=11), nullable=False),
+        sa.Column("email", sa.String(length=100), nullable=False),
+        sa.Column("password", sa.String(length=255), nullable=False),
+        sa.Column("age", sa.Integer(), nullable=False),
+        sa.Column("sex", sa.CHAR(length=1), nullable=False),
+        sa.Column("address", sa.String(length=100), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_tb_clients_cpf", "tb_clients", ["cpf"], unique=True)
+    op.create_index("ix_tb_clients_email", "tb_clients", ["email"], unique=True)
+    op.create_index("ix_tb_clients_created_at", "tb_clients", ["created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tb_clients_created_at", table_name="tb_clients")
+    op.drop_index("ix_tb_clients_email", table_name="tb_clients")
+    op.drop_index("ix_tb_clients_cpf", table_name="tb_clients")
+    op.drop_table("tb_clients")
+    op.drop_table("tb_products")
@@ -0,0 +1,31 @@
+"""Adiciona índices compostos para a paginação keyset de produtos
+
+Revision ID: 8c4f0a3e6b21
+Revises: 5b1e2c7d9a10
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4f0a3e6b21"
+down_revision: str | Sequence[str] | None = "5b1e2c7d9a10"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_tb_products_name_id", "tb_products", ["name", "id"])
+    op.create_index("ix_tb_products_price_id", "tb_products", ["price", "id"])
+    op.create_index("ix_tb_products_quantity_id", "tb_products", ["quantity", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tb_products_quantity_id", table_name="tb_products")
+    op.drop_index("ix_tb_products_price_id", table_name="tb_products")
+    op.drop_index("ix_tb_products_name_id", table_name="tb_products")
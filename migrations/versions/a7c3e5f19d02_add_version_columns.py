@@ -0,0 +1,39 @@
+"""Adiciona a coluna de versão para o controle de concorrência otimista
+
+Revision ID: a7c3e5f19d02
+Revises: 3e9a6d2f8b47
+Create Date: 2026-10-18 15:20:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e5f19d02"
+down_revision: str | Sequence[str] | None = "3e9a6d2f8b47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("tb_products", "tb_clients")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Com um default constante, o PostgreSQL adiciona a coluna sem reescrever
+    # a tabela.
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "version", sa.Integer(), server_default=sa.text("1"), nullable=False
+            ),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_column(table, "version")
@@ -0,0 +1,75 @@
+"""Cria as tabelas de carrinhos de compras e dos seus itens
+
+Revision ID: e7a2c9d41f58
+Revises: d4b8f1a26c93
+Create Date: 2026-10-18 18:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a2c9d41f58"
+down_revision: str | Sequence[str] | None = "d4b8f1a26c93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tb_shopping_carts",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("client_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["client_id"], ["tb_clients.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tb_shopping_carts_client_id", "tb_shopping_carts", ["client_id"]
+    )
+    op.create_table(
+        "tb_shopping_cart_items",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("cart_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("product_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["cart_id"], ["tb_shopping_carts.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["product_id"], ["tb_products.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cart_id", "product_id"),
+    )
+    op.create_index(
+        "ix_tb_shopping_cart_items_product_id",
+        "tb_shopping_cart_items",
+        ["product_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_tb_shopping_cart_items_product_id", table_name="tb_shopping_cart_items"
+    )
+    op.drop_table("tb_shopping_cart_items")
+    op.drop_index("ix_tb_shopping_carts_client_id", table_name="tb_shopping_carts")
+    op.drop_table("tb_shopping_carts")
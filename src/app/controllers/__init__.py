@@ -1,3 +1,29 @@
-from .product_controller import router
+from typing import TYPE_CHECKING
 
-__all__ = ["router"]
\ No newline at end of file
+from app.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .cart_controller import router as cart_router
+    from .client_controller import router as client_router
+    from .health_controller import router as health_router
+    from .metrics_controller import router as metrics_router
+    from .product_controller import router as product_router
+
+__all__ = [
+    "cart_router",
+    "client_router",
+    "health_router",
+    "metrics_router",
+    "product_router",
+]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "cart_router": "cart_controller:router",
+        "client_router": "client_controller:router",
+        "health_router": "health_controller:router",
+        "metrics_router": "metrics_controller:router",
+        "product_router": "product_controller:router",
+    },
+)
@@ -0,0 +1,121 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from app.core import get_cache, get_db_session
+from app.core.responses import ModelJSONResponse
+from app.schemas import (
+    CartCheckoutResponse,
+    CartItemRequest,
+    CartRequest,
+    CartResponse,
+)
+from app.services import CartService, ProductService
+
+router = APIRouter()
+
+DbSessionDep = Annotated[AsyncSession, Depends(get_db_session, scope="function")]
+
+
+def get_cart_service(
+    db_session: DbSessionDep,
+) -> CartService:
+    """Dependency para injetar o CartService."""
+    return CartService(db_session, ProductService(db_session, get_cache()))
+
+
+CartServiceDep = Annotated[CartService, Depends(get_cart_service)]
+
+
+@router.post(
+    path="/",
+    summary="Cria um carrinho de compras",
+    description="Cria um carrinho vazio para um cliente",
+    status_code=status.HTTP_201_CREATED,
+    response_model=CartResponse,
+)
+async def create_cart(
+    cart_request: CartRequest,
+    service: CartServiceDep,
+):
+    """Cria um carrinho de compras."""
+    return ModelJSONResponse(
+        await service.create_cart(cart_request),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.get(
+    path="/{cart_id}",
+    summary="Busca um carrinho pelo ID",
+    description=(
+        "Retorna os itens com o preço e o estoque atuais dos produtos, os totais "
+        "e se o estoque cobre todos os itens, calculados em uma única consulta"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=CartResponse,
+)
+async def get_cart(
+    cart_id: UUID,
+    service: CartServiceDep,
+):
+    """Busca um carrinho pelo ID."""
+    return ModelJSONResponse(await service.get_cart(cart_id))
+
+
+@router.put(
+    path="/{cart_id}/items/{product_id}",
+    summary="Inclui ou altera um item do carrinho",
+    description=(
+        "Inclui o produto no carrinho ou substitui a quantidade dele. O estoque "
+        "só é conferido e baixado no fechamento"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=CartResponse,
+)
+async def set_cart_item(
+    cart_id: UUID,
+    product_id: UUID,
+    item_request: CartItemRequest,
+    service: CartServiceDep,
+):
+    """Inclui ou altera um item do carrinho."""
+    return ModelJSONResponse(await service.set_item(cart_id, product_id, item_request))
+
+
+@router.delete(
+    path="/{cart_id}/items/{product_id}",
+    summary="Remove um item do carrinho",
+    description="Remove o produto do carrinho e retorna o carrinho atualizado",
+    status_code=status.HTTP_200_OK,
+    response_model=CartResponse,
+)
+async def remove_cart_item(
+    cart_id: UUID,
+    product_id: UUID,
+    service: CartServiceDep,
+):
+    """Remove um item do carrinho."""
+    return ModelJSONResponse(await service.remove_item(cart_id, product_id))
+
+
+@router.post(
+    path="/{cart_id}/checkout",
+    summary="Fecha o carrinho",
+    description=(
+        "Baixa o estoque de todos os itens em uma única transação e esvazia o "
+        "carrinho. Se algum produto não tiver a quantidade pedida, nada é "
+        "baixado e a resposta é 409 com os itens sem estoque"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=CartCheckoutResponse,
+)
+async def checkout_cart(
+    cart_id: UUID,
+    service: CartServiceDep,
+):
+    """Fecha o carrinho."""
+    return ModelJSONResponse(await service.checkout(cart_id))
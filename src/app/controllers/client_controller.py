@@ -0,0 +1,84 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from app.core import get_db_session
+from app.core.offload import BoundedExecutor, get_password_executor
+from app.core.responses import ModelJSONResponse
+from app.schemas import ClientRequest, ClientResponse, ClientUpdate
+from app.services import ClientService
+
+router = APIRouter()
+
+DbSessionDep = Annotated[AsyncSession, Depends(get_db_session, scope="function")]
+
+SATURATED_RESPONSES = {
+    status.HTTP_503_SERVICE_UNAVAILABLE: {
+        "description": "Pool de hash de senhas saturado; tente após o Retry-After"
+    },
+}
+
+
+def get_client_service(
+    db_session: DbSessionDep,
+    password_executor: Annotated[BoundedExecutor, Depends(get_password_executor)],
+) -> ClientService:
+    """Dependency para injetar o ClientService."""
+    return ClientService(db_session, password_executor)
+
+
+ClientServiceDep = Annotated[ClientService, Depends(get_client_service)]
+
+
+@router.post(
+    path="/",
+    summary="Cria um novo cliente",
+    description="Cadastra um cliente, guardando apenas o hash Argon2 da senha",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ClientResponse,
+    responses=SATURATED_RESPONSES,
+)
+async def create_client(
+    client_request: ClientRequest,
+    service: ClientServiceDep,
+):
+    """Cria um novo cliente."""
+    return ModelJSONResponse(
+        await service.create_client(client_request),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.get(
+    path="/{client_id}",
+    summary="Busca um cliente pelo ID",
+    description="Retorna os dados de um cliente, sem a senha",
+    status_code=status.HTTP_200_OK,
+    response_model=ClientResponse,
+)
+async def get_client_by_id(
+    client_id: UUID,
+    service: ClientServiceDep,
+):
+    """Busca um cliente pelo ID."""
+    return ModelJSONResponse(await service.get_client_by_id(client_id))
+
+
+@router.patch(
+    path="/{client_id}",
+    summary="Atualiza um cliente",
+    description="Atualiza e-mail, senha, idade ou endereço de um cliente",
+    status_code=status.HTTP_200_OK,
+    response_model=ClientResponse,
+    responses=SATURATED_RESPONSES,
+)
+async def update_client(
+    client_id: UUID,
+    client_update: ClientUpdate,
+    service: ClientServiceDep,
+):
+    """Atualiza um cliente."""
+    return ModelJSONResponse(await service.update_client(client_id, client_update))
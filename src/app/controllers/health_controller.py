@@ -0,0 +1,62 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, Request
+from starlette import status
+
+from app.core import get_cache
+from app.core.database import get_pool_stats
+from app.core.responses import ModelJSONResponse
+from app.schemas import (
+    CacheStatsResponse,
+    DatabaseHealthResponse,
+    ReadinessResponse,
+)
+
+router = APIRouter()
+
+
+@router.get(
+    path="/ready",
+    summary="Consulta se o processo está pronto",
+    description=(
+        "Responde 200 depois que o aquecimento da inicialização termina e 503 "
+        "antes disso ou durante o encerramento"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=ReadinessResponse,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+)
+async def get_readiness(request: Request):
+    """Indica se o processo aceita tráfego."""
+    ready = getattr(request.app.state, "ready", False)
+
+    return ModelJSONResponse(
+        {"ready": ready},
+        status_code=(
+            status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+    )
+
+
+@router.get(
+    path="/cache",
+    summary="Consulta as estatísticas do cache",
+    description="Retorna os contadores de acertos, faltas e remoções do cache",
+    status_code=status.HTTP_200_OK,
+    response_model=CacheStatsResponse,
+)
+async def get_cache_stats():
+    """Retorna as estatísticas do cache de leitura do processo."""
+    return asdict(await get_cache().stats())
+
+
+@router.get(
+    path="/db",
+    summary="Consulta o estado dos pools de conexões",
+    description="Retorna as conexões em uso, ociosas e em overflow de cada engine",
+    status_code=status.HTTP_200_OK,
+    response_model=DatabaseHealthResponse,
+)
+async def get_database_health():
+    """Retorna o estado dos pools de conexões do processo."""
+    return {"pools": [asdict(pool_stats) for pool_stats in get_pool_stats()]}
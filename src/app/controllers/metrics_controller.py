@@ -0,0 +1,24 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from starlette import status
+
+from app.core.metrics import metrics_registry
+
+router = APIRouter()
+
+
+@router.get(
+    path="/metrics",
+    summary="Exporta as métricas da aplicação",
+    description=(
+        "Retorna, no formato de texto do Prometheus, os histogramas de duração, "
+        "tempo de banco e consultas SQL por rota"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_class=PlainTextResponse,
+)
+async def get_metrics():
+    """Retorna as métricas do processo no formato do Prometheus."""
+    return PlainTextResponse(
+        metrics_registry.render(), media_type="text/plain; version=0.0.4"
+    )
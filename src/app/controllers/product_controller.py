@@ -1,21 +1,152 @@
+from hashlib import sha256
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from app.core import get_db_session
-from app.schemas import ProductRequest, ProductResponse, ProductUpdate
-from app.services import ProductService
+from app.core import get_cache, get_db_session, get_settings, read_only, transactional
+from app.core.changes import get_change_broadcaster
+from app.core.etags import make_etag, none_match, parse_if_match
+from app.core.responses import ModelJSONResponse, negotiate_response_class
+from app.exceptions import ExecutorSaturatedException
+from app.schemas import (
+    BulkMode,
+    ExportFormat,
+    Page,
+    ProductBatchGet,
+    ProductBatchGetResponse,
+    ProductBulkCreate,
+    ProductBulkDelete,
+    ProductBulkResponse,
+    ProductBulkUpdate,
+    ProductImportResponse,
+    ProductQueryParams,
+    ProductRequest,
+    ProductResponse,
+    ProductSearchParams,
+    ProductUpdate,
+    StockRequest,
+    StockReservation,
+    StockReservationItem,
+)
+from app.services import IdempotencyService, ProductService
 
 router = APIRouter()
 
+DbSessionDep = Annotated[AsyncSession, Depends(get_db_session, scope="function")]
+StreamingDbSessionDep = Annotated[
+    AsyncSession, Depends(get_db_session, scope="request")
+]
+
+BulkModeQuery = Annotated[
+    BulkMode,
+    Query(
+        description=(
+            "`atomic` grava o lote em uma única transação; `per_chunk` grava "
+            "cada bloco de forma independente e reporta o resultado por bloco"
+        )
+    ),
+]
+IfMatchHeader = Annotated[
+    str | None,
+    Header(
+        description=(
+            "ETag obtida na leitura do produto. A escrita só acontece se o "
+            "produto não tiver sido alterado desde então; caso contrário, 412"
+        )
+    ),
+]
+AcceptHeader = Annotated[
+    str | None,
+    Header(
+        description=(
+            "`application/msgpack` para receber a página em MessagePack em vez de JSON"
+        )
+    ),
+]
+MSGPACK_RESPONSES = {
+    status.HTTP_200_OK: {"content": {"application/msgpack": {}}},
+}
+ChunkSizeQuery = Annotated[
+    int | None,
+    Query(description="Quantidade de itens por comando SQL", ge=1, le=10_000),
+]
+IdempotencyKeyHeader = Annotated[
+    str | None,
+    Header(
+        description=(
+            "Chave única da escrita. Repetida com a mesma requisição, devolve "
+            "a resposta gravada sem executar a escrita de novo; com outra "
+            "requisição, 422"
+        ),
+        min_length=1,
+        max_length=255,
+    ),
+]
+
 
 def get_product_service(
-    db_session: AsyncSession = Depends(get_db_session),
+    db_session: DbSessionDep,
 ) -> ProductService:
     """Dependency para injetar o ProductService."""
-    return ProductService(db_session)
+    return ProductService(db_session, get_cache())
+
+
+ProductServiceDep = Annotated[ProductService, Depends(get_product_service)]
+
+
+def get_streaming_product_service(
+    db_session: StreamingDbSessionDep,
+) -> ProductService:
+    """Dependency do ProductService para respostas lidas da sessão no envio.
+
+    A sessão só é fechada depois que o corpo em stream termina de ser enviado.
+    """
+    return ProductService(db_session, get_cache())
+
+
+StreamingProductServiceDep = Annotated[
+    ProductService, Depends(get_streaming_product_service)
+]
+
+
+async def get_idempotency_service(
+    request: Request,
+    db_session: DbSessionDep,
+    idempotency_key: IdempotencyKeyHeader = None,
+) -> IdempotencyService:
+    """Dependency para injetar o IdempotencyService com a chave da requisição."""
+    fingerprint = ""
+
+    if idempotency_key is not None:
+        fingerprint = sha256(
+            b"\0".join(
+                (
+                    request.method.encode(),
+                    request.url.path.encode(),
+                    request.url.query.encode(),
+                    await request.body(),
+                )
+            )
+        ).hexdigest()
+
+    return IdempotencyService(db_session, idempotency_key, fingerprint)
+
+
+IdempotencyServiceDep = Annotated[IdempotencyService, Depends(get_idempotency_service)]
+
+
+def _not_modified(
+    if_none_match: str | None, headers: dict[str, str]
+) -> Response | None:
+    """Resposta 304 quando o If-None-Match corresponde à ETag dos cabeçalhos."""
+    if none_match(if_none_match, headers["ETag"]):
+        return None
+
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
 
 @router.post(
@@ -27,63 +158,483 @@ def get_product_service(
 )
 async def create_product(
     product_request: ProductRequest,
-    service: ProductService = Depends(get_product_service),
+    idempotency: IdempotencyServiceDep,
+    service: ProductServiceDep,
 ):
     """Cria um novo produto."""
-    return await service.create_product(product_request)
+    if response := await idempotency.replay():
+        return response
+
+    return await idempotency.save(
+        ModelJSONResponse(
+            await service.create_product(product_request),
+            status_code=status.HTTP_201_CREATED,
+        )
+    )
+
+
+@router.post(
+    path="/bulk",
+    summary="Cria produtos em lote",
+    description="Cria vários produtos com INSERT multi-linha, em blocos",
+    status_code=status.HTTP_200_OK,
+    response_model=ProductBulkResponse,
+)
+async def bulk_create_products(
+    bulk_create: ProductBulkCreate,
+    idempotency: IdempotencyServiceDep,
+    service: ProductServiceDep,
+    mode: BulkModeQuery = BulkMode.ATOMIC,
+    chunk_size: ChunkSizeQuery = None,
+):
+    """Cria produtos em lote."""
+    if response := await idempotency.replay():
+        return response
+
+    return await idempotency.save(
+        ModelJSONResponse(
+            await service.bulk_create_products(
+                bulk_create, mode, chunk_size or get_settings().BULK_CHUNK_SIZE
+            )
+        )
+    )
+
+
+@router.patch(
+    path="/bulk",
+    summary="Atualiza produtos em lote",
+    description="Atualiza o preço e/ou a quantidade de vários produtos, em blocos",
+    status_code=status.HTTP_200_OK,
+    response_model=ProductBulkResponse,
+)
+async def bulk_update_products(
+    bulk_update: ProductBulkUpdate,
+    idempotency: IdempotencyServiceDep,
+    service: ProductServiceDep,
+    mode: BulkModeQuery = BulkMode.ATOMIC,
+    chunk_size: ChunkSizeQuery = None,
+):
+    """Atualiza produtos em lote."""
+    if response := await idempotency.replay():
+        return response
+
+    return await idempotency.save(
+        ModelJSONResponse(
+            await service.bulk_update_products(
+                bulk_update, mode, chunk_size or get_settings().BULK_CHUNK_SIZE
+            )
+        )
+    )
+
+
+@router.delete(
+    path="/bulk",
+    summary="Deleta produtos em lote",
+    description="Remove vários produtos pelos seus IDs, em blocos",
+    status_code=status.HTTP_200_OK,
+    response_model=ProductBulkResponse,
+)
+async def bulk_delete_products(
+    bulk_delete: ProductBulkDelete,
+    idempotency: IdempotencyServiceDep,
+    service: ProductServiceDep,
+    mode: BulkModeQuery = BulkMode.ATOMIC,
+    chunk_size: ChunkSizeQuery = None,
+):
+    """Deleta produtos em lote."""
+    if response := await idempotency.replay():
+        return response
+
+    return await idempotency.save(
+        ModelJSONResponse(
+            await service.bulk_delete_products(
+                bulk_delete, mode, chunk_size or get_settings().BULK_CHUNK_SIZE
+            )
+        )
+    )
+
+
+@router.post(
+    path="/reserve",
+    summary="Reserva estoque de vários produtos",
+    description=(
+        "Decrementa o estoque de vários produtos em um único comando. Se algum "
+        "deles não tiver a quantidade pedida, nenhuma reserva é feita e a "
+        "resposta é 409 com os itens sem estoque"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=list[ProductResponse],
+)
+async def reserve_stock(
+    reservation: StockReservation,
+    idempotency: IdempotencyServiceDep,
+    service: ProductServiceDep,
+):
+    """Reserva estoque de vários produtos."""
+    if response := await idempotency.replay():
+        return response
+
+    return await idempotency.save(
+        ModelJSONResponse(await service.reserve_stock(reservation.items))
+    )
+
+
+@router.post(
+    path="/release",
+    summary="Libera estoque de vários produtos",
+    description="Devolve ao estoque quantidades reservadas de vários produtos",
+    status_code=status.HTTP_200_OK,
+    response_model=list[ProductResponse],
+)
+async def release_stock(
+    reservation: StockReservation,
+    idempotency: IdempotencyServiceDep,
+    service: ProductServiceDep,
+):
+    """Libera estoque de vários produtos."""
+    if response := await idempotency.replay():
+        return response
+
+    return await idempotency.save(
+        ModelJSONResponse(await service.release_stock(reservation.items))
+    )
+
+
+@router.post(
+    path="/batch-get",
+    summary="Busca vários produtos pelo ID",
+    description=(
+        "Retorna os produtos na ordem dos IDs enviados, com `found: false` para "
+        "os inexistentes. Os produtos fora do cache são lidos com uma única "
+        "consulta"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=ProductBatchGetResponse,
+)
+@read_only
+async def batch_get_products(
+    batch_get: ProductBatchGet,
+    service: ProductServiceDep,
+):
+    """Busca vários produtos pelo ID."""
+    return ModelJSONResponse(await service.get_products_batch_json(batch_get.ids))
+
+
+@router.get(
+    path="/export",
+    summary="Exporta o catálogo de produtos",
+    description=(
+        "Transmite todos os produtos em NDJSON ou CSV, em blocos lidos de um "
+        "cursor no servidor, sem carregar o catálogo inteiro em memória"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+@transactional
+async def export_products(
+    service: StreamingProductServiceDep,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = (
+        ExportFormat.NDJSON
+    ),
+):
+    """Exporta o catálogo completo de produtos."""
+    return StreamingResponse(
+        service.export_products(export_format),
+        media_type=export_format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="products.{export_format}"'
+        },
+    )
+
+
+@router.post(
+    path="/import",
+    summary="Importa produtos de um arquivo",
+    description=(
+        "Lê um CSV com cabeçalho ou um NDJSON à medida que o corpo chega, valida "
+        "as linhas em blocos, grava cada bloco com COPY e o mescla no catálogo "
+        "com upsert pelo `id`: linhas com um ID existente atualizam o produto, "
+        "as demais criam produtos novos. Linhas inválidas são recusadas e "
+        "reportadas sem interromper a importação"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=ProductImportResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_products(
+    request: Request,
+    service: ProductServiceDep,
+    import_format: Annotated[ExportFormat, Query(alias="format")] = (
+        ExportFormat.NDJSON
+    ),
+    batch_size: Annotated[
+        int | None,
+        Query(description="Linhas validadas e gravadas por vez", ge=1, le=50_000),
+    ] = None,
+):
+    """Importa produtos de um arquivo CSV ou NDJSON."""
+    return ModelJSONResponse(
+        await service.import_products(
+            request.stream(),
+            import_format,
+            batch_size or get_settings().IMPORT_BATCH_SIZE,
+        )
+    )
+
+
+@router.get(
+    path="/search",
+    summary="Busca produtos pelo nome",
+    description=(
+        "Busca produtos por prefixo do nome, por trecho do nome sem diferenciar "
+        "maiúsculas ou por texto completo ordenado por relevância. Use "
+        "`next_cursor` para obter a próxima página"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=Page[ProductResponse],
+    responses=MSGPACK_RESPONSES,
+)
+async def search_products(
+    search_params: Annotated[ProductSearchParams, Query()],
+    service: ProductServiceDep,
+    accept: AcceptHeader = None,
+):
+    """Busca produtos pelo nome de forma paginada."""
+    response_class = negotiate_response_class(accept)
+
+    return response_class(
+        await service.search_products(search_params), headers={"Vary": "Accept"}
+    )
+
+
+@router.get(
+    path="/changes",
+    summary="Acompanha as alterações dos produtos",
+    description=(
+        "Stream Server-Sent Events com um evento `created`, `updated` ou "
+        "`deleted` por produto alterado. Com `Last-Event-ID`, reenvia os "
+        "eventos perdidos desde a desconexão; um evento `reset` indica que "
+        "eventos se perderam e os produtos devem ser recarregados. Assinantes "
+        "que não acompanham os eventos são desconectados"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {"text/event-stream": {}}},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "description": "Limite de assinantes do processo atingido"
+        },
+    },
+)
+async def stream_product_changes(
+    last_event_id: Annotated[
+        str | None,
+        Header(
+            description=(
+                "ID do último evento recebido, enviado pelo navegador ao reconectar"
+            )
+        ),
+    ] = None,
+):
+    """Acompanha as alterações dos produtos por Server-Sent Events."""
+    broadcaster = get_change_broadcaster()
+
+    if broadcaster.full:
+        raise ExecutorSaturatedException("changes")
+
+    return StreamingResponse(
+        broadcaster.stream(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
     path="/{product_id}",
     summary="Consulta um produto pelo ID",
-    description="Retorna os dados de um produto específico pelo seu ID",
+    description=(
+        "Retorna os dados de um produto específico pelo seu ID, com a ETag da "
+        "versão atual. Com `If-None-Match` igual a essa ETag, responde 304 "
+        "sem corpo"
+    ),
     status_code=status.HTTP_200_OK,
     response_model=ProductResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Produto inalterado"}},
 )
 async def get_product_by_id(
     product_id: UUID,
-    service: ProductService = Depends(get_product_service),
+    service: ProductServiceDep,
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
     """Busca um produto pelo ID."""
-    return await service.get_product_by_id(product_id)
+    payload, version = await service.get_product_json(product_id)
+    marker = await service.get_products_marker()
+    # O Last-Modified da coleção é um limite superior válido para o produto.
+    headers = marker.headers(get_settings().CACHE_CONTROL_PRODUCT_DETAIL) | {
+        "ETag": make_etag(version)
+    }
+
+    if response := _not_modified(if_none_match, headers):
+        return response
+
+    return ModelJSONResponse(payload, headers=headers)
 
 
 @router.get(
     path="/",
-    summary="Consulta todos os produtos",
-    description="Retorna uma lista com todos os produtos cadastrados",
+    summary="Consulta os produtos",
+    description=(
+        "Retorna uma página de produtos, com filtros por prefixo do nome, "
+        "faixa de preço e de quantidade. Use `next_cursor` para obter a "
+        "próxima página. A ETag muda a cada alteração em qualquer produto; "
+        "com `If-None-Match` igual a ela, responde 304 sem consultar a listagem"
+    ),
     status_code=status.HTTP_200_OK,
-    response_model=list[ProductResponse],
+    response_model=Page[ProductResponse],
+    responses={
+        **MSGPACK_RESPONSES,
+        status.HTTP_304_NOT_MODIFIED: {"description": "Produtos inalterados"},
+    },
 )
-async def list_all_products(service: ProductService = Depends(get_product_service)):
-    """Lista todos os produtos."""
-    return await service.list_all_products()
+async def list_all_products(
+    query_params: Annotated[ProductQueryParams, Query()],
+    service: ProductServiceDep,
+    if_none_match: Annotated[str | None, Header()] = None,
+    accept: AcceptHeader = None,
+):
+    """Lista os produtos de forma paginada."""
+    response_class = negotiate_response_class(accept)
+    cache_control = get_settings().CACHE_CONTROL_PRODUCT_LIST
+    variant = response_class.etag_variant
+
+    # O marcador em cache responde a maior parte das revalidações sem tocar no
+    # banco; a ETag da resposta completa usa o marcador lido antes dos dados.
+    if if_none_match is not None:
+        marker = await service.get_products_marker()
+        headers = marker.headers(cache_control, variant) | {"Vary": "Accept"}
+
+        if response := _not_modified(if_none_match, headers):
+            return response
+
+    marker = await service.get_products_marker(fresh=True)
+    headers = marker.headers(cache_control, variant) | {"Vary": "Accept"}
+
+    if response := _not_modified(if_none_match, headers):
+        return response
+
+    return response_class(
+        await service.list_all_products(query_params), headers=headers
+    )
 
 
 @router.patch(
     path="/{product_id}",
     summary="Atualiza um produto pelo ID",
-    description="Atualiza o preço e/ou a quantidade de um produto existente",
+    description=(
+        "Atualiza o preço e/ou a quantidade de um produto existente. Envie a "
+        "ETag lida em `If-Match` para não sobrescrever alterações concorrentes"
+    ),
     status_code=status.HTTP_200_OK,
     response_model=ProductResponse,
 )
 async def update_product(
     product_id: UUID,
     product_update: ProductUpdate,
-    service: ProductService = Depends(get_product_service),
+    idempotency: IdempotencyServiceDep,
+    service: ProductServiceDep,
+    if_match: IfMatchHeader = None,
 ):
     """Atualiza preço e/ou quantidade de um produto."""
-    return await service.update_product(product_id, product_update)
+    if response := await idempotency.replay():
+        return response
+
+    product, version = await service.update_product(
+        product_id, product_update, parse_if_match(if_match)
+    )
+
+    return await idempotency.save(
+        ModelJSONResponse(product, headers={"ETag": make_etag(version)})
+    )
+
+
+@router.post(
+    path="/{product_id}/reserve",
+    summary="Reserva estoque de um produto",
+    description=(
+        "Decrementa o estoque do produto somente se houver a quantidade pedida; "
+        "caso contrário, responde 409"
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=ProductResponse,
+)
+async def reserve_product_stock(
+    product_id: UUID,
+    stock_request: StockRequest,
+    idempotency: IdempotencyServiceDep,
+    service: ProductServiceDep,
+):
+    """Reserva estoque de um produto."""
+    if response := await idempotency.replay():
+        return response
+
+    (product,) = await service.reserve_stock(
+        [StockReservationItem(id=product_id, quantity=stock_request.quantity)]
+    )
+
+    return await idempotency.save(ModelJSONResponse(product))
+
+
+@router.post(
+    path="/{product_id}/release",
+    summary="Libera estoque de um produto",
+    description="Devolve ao estoque uma quantidade reservada do produto",
+    status_code=status.HTTP_200_OK,
+    response_model=ProductResponse,
+)
+async def release_product_stock(
+    product_id: UUID,
+    stock_request: StockRequest,
+    idempotency: IdempotencyServiceDep,
+    service: ProductServiceDep,
+):
+    """Libera estoque de um produto."""
+    if response := await idempotency.replay():
+        return response
+
+    (product,) = await service.release_stock(
+        [StockReservationItem(id=product_id, quantity=stock_request.quantity)]
+    )
+
+    return await idempotency.save(ModelJSONResponse(product))
 
 
 @router.delete(
     path="/{product_id}",
     summary="Deleta um produto pelo ID",
-    description="Remove um produto do sistema pelo seu ID",
+    description=(
+        "Remove um produto do sistema pelo seu ID. Com `If-Match`, só remove "
+        "se o produto não tiver sido alterado"
+    ),
     status_code=status.HTTP_204_NO_CONTENT,
 )
 async def delete_product(
-    product_id: UUID, service: ProductService = Depends(get_product_service)
+    product_id: UUID,
+    idempotency: IdempotencyServiceDep,
+    service: ProductServiceDep,
+    if_match: IfMatchHeader = None,
 ):
     """Deleta um produto."""
-    await service.delete_product(product_id)
+    if response := await idempotency.replay():
+        return response
+
+    await service.delete_product(product_id, parse_if_match(if_match))
+
+    return await idempotency.save(Response(status_code=status.HTTP_204_NO_CONTENT))
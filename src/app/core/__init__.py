@@ -1,4 +1,37 @@
-from .settings import settings
-from .database import get_db_session
+from typing import TYPE_CHECKING
 
-__all__ = ["settings", "get_db_session"]
\ No newline at end of file
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .cache import get_cache
+    from .database import (
+        get_db_session,
+        on_commit,
+        read_only,
+        transactional,
+        use_primary,
+    )
+    from .settings import get_settings
+
+__all__ = [
+    "get_cache",
+    "get_db_session",
+    "get_settings",
+    "on_commit",
+    "read_only",
+    "transactional",
+    "use_primary",
+]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "get_settings": "settings",
+        "get_db_session": "database",
+        "on_commit": "database",
+        "read_only": "database",
+        "transactional": "database",
+        "use_primary": "database",
+        "get_cache": "cache",
+    },
+)
@@ -0,0 +1,254 @@
+"""Camada de cache read-through com backends plugáveis."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, replace
+from functools import cache
+from time import monotonic
+
+from app.core.settings import get_settings
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Contadores de uso do cache."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int | None = None
+
+
+class CacheBackend(ABC):
+    """Interface de armazenamento usada pelo ReadThroughCache.
+
+    Backends compartilhados (Redis, Memcached etc.) devem implementar estes
+    métodos armazenando os valores como bytes opacos.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Retorna o valor armazenado ou None quando ausente ou expirado."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Armazena o valor por `ttl` segundos."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove o valor, se existir."""
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, bytes]:
+        """Retorna os valores presentes entre as chaves.
+
+        Backends remotos podem sobrescrever com uma única ida ao servidor
+        (MGET, por exemplo).
+        """
+        values: dict[str, bytes] = {}
+
+        for key in keys:
+            value = await self.get(key)
+
+            if value is not None:
+                values[key] = value
+
+        return values
+
+    async def stats(self) -> CacheStats:
+        """Contadores mantidos pelo backend (remoções, expirações e tamanho)."""
+        return CacheStats()
+
+
+class InMemoryCache(CacheBackend):
+    """Backend em memória do processo com política LRU e expiração por TTL."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._evictions = 0
+        self._expirations = 0
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= monotonic():
+            del self._entries[key]
+            self._expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def stats(self) -> CacheStats:
+        return CacheStats(
+            evictions=self._evictions,
+            expirations=self._expirations,
+            size=len(self._entries),
+        )
+
+
+class ReadThroughCache:
+    """Cache read-through com proteção contra stampede e invalidação precisa.
+
+    Apenas uma corrotina por chave executa o carregamento; as demais aguardam
+    e reutilizam o valor preenchido. Uma invalidação feita durante um
+    carregamento impede que o valor carregado, possivelmente antigo, seja
+    gravado no cache.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._waiters: dict[str, int] = {}
+        self._invalidated: set[str] = set()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[bytes | None]],
+        ttl: float | None = None,
+    ) -> bytes | None:
+        """Retorna o valor em cache ou o carrega com `loader` e o armazena.
+
+        Valores None retornados pelo `loader` não são armazenados. `ttl`
+        substitui o tempo de vida padrão do cache para esta chave.
+        """
+        value = await self.backend.get(key)
+
+        if value is not None:
+            self._hits += 1
+            return value
+
+        async with self._locked(key):
+            value = await self.backend.get(key)
+
+            if value is not None:
+                self._hits += 1
+                self._coalesced += 1
+                return value
+
+            self._misses += 1
+            self._invalidated.discard(key)
+            value = await loader()
+
+            if value is not None and key not in self._invalidated:
+                await self.backend.set(key, value, ttl or self.ttl)
+
+            return value
+
+    async def get_many_or_load(
+        self,
+        keys: Iterable[str],
+        loader: Callable[[list[str]], Awaitable[dict[str, bytes]]],
+        ttl: float | None = None,
+    ) -> dict[str, bytes]:
+        """Versão em lote do `get_or_load`: carrega as faltas com uma chamada.
+
+        O `loader` recebe as chaves ausentes do cache e retorna os valores
+        que encontrou; as chaves sem valor ficam fora do resultado. Chaves já
+        em carregamento por outra corrotina, individual ou em lote, aguardam
+        esse carregamento em vez de carregá-las de novo.
+        """
+        keys = list(dict.fromkeys(keys))
+        values = await self.backend.get_many(keys)
+        self._hits += len(values)
+        missing = [key for key in keys if key not in values]
+
+        if not missing:
+            return values
+
+        async with AsyncExitStack() as stack:
+            # Em ordem, para que dois lotes nunca esperem um pelo outro.
+            for key in sorted(missing):
+                await stack.enter_async_context(self._locked(key))
+
+            filled = await self.backend.get_many(missing)
+            self._hits += len(filled)
+            self._coalesced += len(filled)
+            values.update(filled)
+            missing = [key for key in missing if key not in filled]
+
+            if not missing:
+                return values
+
+            self._misses += len(missing)
+            self._invalidated.difference_update(missing)
+            loaded = await loader(missing)
+
+            for key, value in loaded.items():
+                if key not in self._invalidated:
+                    await self.backend.set(key, value, ttl or self.ttl)
+
+            values.update(loaded)
+
+        return values
+
+    async def invalidate(self, *keys: str) -> None:
+        """Remove as chaves e descarta carregamentos em andamento para elas."""
+        for key in keys:
+            if key in self._locks:
+                self._invalidated.add(key)
+
+            await self.backend.delete(key)
+
+    @asynccontextmanager
+    async def _locked(self, key: str) -> AsyncIterator[None]:
+        """Detém o carregamento da chave; o lock some quando ninguém o espera."""
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+
+        try:
+            async with lock:
+                yield
+        finally:
+            self._waiters[key] -= 1
+
+            if not self._waiters[key]:
+                del self._waiters[key]
+                del self._locks[key]
+                self._invalidated.discard(key)
+
+    async def stats(self) -> CacheStats:
+        """Contadores de acertos, faltas e remoções do cache."""
+        return replace(
+            await self.backend.stats(),
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._coalesced,
+        )
+
+
+@cache
+def get_cache() -> ReadThroughCache:
+    """Retorna o cache da aplicação, compartilhado pelo processo."""
+    settings = get_settings()
+    return ReadThroughCache(
+        InMemoryCache(max_entries=settings.CACHE_MAX_ENTRIES),
+        ttl=settings.CACHE_TTL_SECONDS,
+    )
@@ -0,0 +1,316 @@
+"""Difusão das alterações de produtos para os assinantes do feed de eventos.
+
+Cada processo tem um `ChangeBroadcaster`. Sem a ponte do PostgreSQL, as
+escritas publicam os eventos nele após o COMMIT; com `CHANGES_NOTIFY`, as
+escritas enviam os eventos com NOTIFY na própria transação e cada processo os
+recebe por LISTEN, na ordem dos COMMITs, e os publica no seu broadcaster.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Literal
+
+from pydantic_core import from_json, to_json
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.ids import uuid7
+from app.core.settings import get_settings
+
+logger = logging.getLogger("app.changes")
+
+ChangeAction = Literal["created", "updated", "deleted", "reset"]
+
+# O PostgreSQL limita o payload do NOTIFY a 8000 bytes.
+NOTIFY_PAYLOAD_LIMIT = 7_900
+RECONNECT_DELAY_SECONDS = 1.0
+MAX_RECONNECT_DELAY_SECONDS = 30.0
+# Enviado no início do stream: o navegador reconecta após 3 segundos.
+STREAM_PREAMBLE = b"retry: 3000\n\n"
+HEARTBEAT_FRAME = b": ping\n\n"
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    """Alteração publicada no feed, com o quadro SSE codificado uma única vez."""
+
+    id: str
+    action: ChangeAction
+    data: bytes
+    frame: bytes = field(repr=False)
+
+    @classmethod
+    def create(
+        cls, action: ChangeAction, data: bytes = b"{}", event_id: str | None = None
+    ) -> "ChangeEvent":
+        event_id = event_id or str(uuid7())
+        frame = b"id: %s\nevent: %s\ndata: %s\n\n" % (
+            event_id.encode(),
+            action.encode(),
+            data,
+        )
+
+        return cls(event_id, action, data, frame)
+
+
+def encode_notifications(events: Sequence[ChangeEvent]) -> list[str]:
+    """Agrupa os eventos em payloads de NOTIFY dentro do limite do PostgreSQL."""
+    payloads: list[str] = []
+    items: list[bytes] = []
+    size = 2
+
+    for event in events:
+        item = b'{"id":%s,"action":"%s","data":%s}' % (
+            to_json(event.id),
+            event.action.encode(),
+            event.data,
+        )
+
+        if items and size + len(item) + 1 > NOTIFY_PAYLOAD_LIMIT:
+            payloads.append(f"[{b','.join(items).decode()}]")
+            items, size = [], 2
+
+        items.append(item)
+        size += len(item) + 1
+
+    if items:
+        payloads.append(f"[{b','.join(items).decode()}]")
+
+    return payloads
+
+
+def decode_notification(payload: str) -> list[ChangeEvent]:
+    """Reconstrói os eventos de um payload de NOTIFY, preservando os IDs."""
+    return [
+        ChangeEvent.create(item["action"], to_json(item["data"]), item["id"])
+        for item in from_json(payload)
+    ]
+
+
+class Subscription:
+    """Eventos pendentes de um assinante, entregues pelo stream SSE."""
+
+    __slots__ = ("beat", "closed", "pending", "wakeup")
+
+    def __init__(self) -> None:
+        self.pending: deque[ChangeEvent] = deque()
+        self.wakeup = asyncio.Event()
+        self.beat = False
+        self.closed = False
+
+    def push(self, event: ChangeEvent) -> None:
+        self.pending.append(event)
+        self.wakeup.set()
+
+    def heartbeat(self) -> None:
+        self.beat = True
+        self.wakeup.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self.wakeup.set()
+
+
+class ChangeBroadcaster:
+    """Distribui os eventos publicados para os assinantes do processo.
+
+    Guarda os últimos `history_size` eventos para retomar streams pelo
+    `Last-Event-ID`. Cada assinante acumula no máximo `buffer_size` eventos
+    pendentes: quem não acompanha é desconectado, para que um cliente lento não
+    faça a memória crescer, e pode retomar do último evento recebido.
+
+    Um único timer envia os heartbeats de todos os assinantes; um assinante
+    ocioso custa apenas a corrotina do stream e a sua fila.
+    """
+
+    def __init__(
+        self,
+        history_size: int,
+        buffer_size: int,
+        max_subscribers: int,
+        heartbeat: float,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self.heartbeat = heartbeat
+        self.history: deque[ChangeEvent] = deque(maxlen=history_size)
+        self.subscriptions: set[Subscription] = set()
+        self.published = 0
+        self.dropped = 0
+        self._heartbeat_task: asyncio.Task | None = None
+
+    @property
+    def full(self) -> bool:
+        """Indica se o limite de assinantes do processo foi atingido."""
+        return len(self.subscriptions) >= self.max_subscribers
+
+    def publish(self, events: Iterable[ChangeEvent]) -> None:
+        """Guarda os eventos no histórico e os entrega a todos os assinantes."""
+        for event in events:
+            self.history.append(event)
+            self.published += 1
+
+            for subscription in list(self.subscriptions):
+                if len(subscription.pending) >= self.buffer_size:
+                    self._drop(subscription)
+                else:
+                    subscription.push(event)
+
+    def reset(self) -> None:
+        """Descarta o histórico e avisa os assinantes que eventos se perderam.
+
+        Os clientes devem recarregar os produtos ao receber um evento `reset`.
+        """
+        self.history.clear()
+        self.publish([ChangeEvent.create("reset")])
+
+    def subscribe(self, last_event_id: str | None = None) -> Subscription:
+        """Registra um assinante, reenviando o que ele perdeu desde `last_event_id`.
+
+        Se o evento não estiver mais no histórico, o assinante recebe primeiro
+        um evento `reset`.
+        """
+        subscription = Subscription()
+
+        if last_event_id is not None:
+            for event in self._replay(last_event_id):
+                subscription.push(event)
+
+        self.subscriptions.add(subscription)
+
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._send_heartbeats())
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self.subscriptions.discard(subscription)
+
+    def close(self) -> None:
+        """Encerra os streams de todos os assinantes."""
+        for subscription in self.subscriptions:
+            subscription.close()
+
+        self.subscriptions.clear()
+
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+
+    async def stream(self, last_event_id: str | None = None) -> AsyncIterator[bytes]:
+        """Gera o stream SSE de um assinante.
+
+        Sem eventos, um comentário é enviado a cada `heartbeat` segundos: ele
+        mantém a conexão viva em proxies e faz uma conexão já fechada pelo
+        cliente ser detectada.
+        """
+        subscription = self.subscribe(last_event_id)
+
+        try:
+            yield STREAM_PREAMBLE
+
+            while not subscription.closed:
+                await subscription.wakeup.wait()
+                subscription.wakeup.clear()
+                frames = b"".join(event.frame for event in subscription.pending)
+                subscription.pending.clear()
+
+                if not frames and subscription.beat:
+                    frames = HEARTBEAT_FRAME
+
+                subscription.beat = False
+
+                if frames:
+                    yield frames
+        finally:
+            self.unsubscribe(subscription)
+
+    def _replay(self, last_event_id: str) -> list[ChangeEvent]:
+        events = list(self.history)
+
+        for index in range(len(events) - 1, -1, -1):
+            if events[index].id == last_event_id:
+                return events[index + 1 :]
+
+        return [ChangeEvent.create("reset")]
+
+    async def _send_heartbeats(self) -> None:
+        """Acorda todos os assinantes a cada `heartbeat`, enquanto houver algum."""
+        try:
+            while self.subscriptions:
+                await asyncio.sleep(self.heartbeat)
+
+                for subscription in self.subscriptions:
+                    subscription.heartbeat()
+        finally:
+            self._heartbeat_task = None
+
+    def _drop(self, subscription: Subscription) -> None:
+        self.subscriptions.discard(subscription)
+        subscription.close()
+        self.dropped += 1
+
+
+@cache
+def get_change_broadcaster() -> ChangeBroadcaster:
+    """Retorna o broadcaster das alterações, compartilhado pelo processo."""
+    settings = get_settings()
+    return ChangeBroadcaster(
+        history_size=settings.CHANGES_HISTORY_SIZE,
+        buffer_size=settings.CHANGES_SUBSCRIBER_BUFFER,
+        max_subscribers=settings.CHANGES_MAX_SUBSCRIBERS,
+        heartbeat=settings.CHANGES_HEARTBEAT_SECONDS,
+    )
+
+
+async def listen_for_changes(broadcaster: ChangeBroadcaster) -> None:
+    """Recebe por LISTEN os eventos de todos os processos e os publica localmente.
+
+    Usa uma conexão própria, fora do pool. Se a conexão cair, reconecta com
+    espera crescente e publica um `reset`, já que eventos podem ter se perdido
+    nesse intervalo. Roda até ser cancelada.
+    """
+    settings = get_settings()
+    channel = settings.CHANGES_NOTIFY_CHANNEL
+    engine = create_async_engine(settings.DB_URL, poolclass=NullPool)
+    delay = RECONNECT_DELAY_SECONDS
+    connected_before = False
+
+    def on_notification(_connection, _pid, _channel, payload: str) -> None:
+        try:
+            broadcaster.publish(decode_notification(payload))
+        except ValueError:
+            logger.exception(json.dumps({"event": "change_notification_invalid"}))
+
+    try:
+        while True:
+            try:
+                async with engine.connect() as connection:
+                    raw_connection = await connection.get_raw_connection()
+                    driver_connection = raw_connection.driver_connection
+                    terminated = asyncio.Event()
+                    driver_connection.add_termination_listener(
+                        lambda _, event=terminated: event.set()
+                    )
+                    await driver_connection.add_listener(channel, on_notification)
+
+                    if connected_before:
+                        broadcaster.reset()
+
+                    connected_before = True
+                    delay = RECONNECT_DELAY_SECONDS
+                    logger.info(json.dumps({"event": "change_listener_connected"}))
+                    await terminated.wait()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(json.dumps({"event": "change_listener_failed"}))
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+    finally:
+        await engine.dispose()
@@ -1,23 +1,380 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import contextvars
+import os
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import cache
+from itertools import count
+from time import monotonic
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from sqlalchemy import Engine, Select, event, make_url, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
-from app.core.settings import settings
+from app.core.metrics import instrument_engine
+from app.core.settings import get_settings
 
-engine = create_async_engine(url=settings.DB_URL, echo=False)
 
-async_session_maker = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+def create_engine_from_settings(url: str) -> AsyncEngine:
+    """Cria um engine com os parâmetros de pool definidos nas configurações."""
+    settings = get_settings()
+    connect_args = {}
 
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args["prepared_statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency que fornece uma sessão no banco de dados."""
-    async with async_session_maker() as session:
+    engine = create_async_engine(
+        url=url,
+        echo=False,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        connect_args=connect_args,
+    )
+    instrument_engine(engine)
+
+    return engine
+
+
+class ReplicaRouter:
+    """Escolhe o engine usado por cada sessão: primário ou uma réplica saudável.
+
+    Uma réplica que falha na verificação de saúde, ou que perde a conexão
+    durante um comando, deixa de receber sessões até a próxima verificação
+    bem-sucedida. Sem réplicas saudáveis, as leituras vão para o primário.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine],
+        strategy: str,
+        check_interval: float,
+        check_timeout: float,
+    ) -> None:
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self._unhealthy: set[AsyncEngine] = set()
+        self._autocommit_engines: dict[AsyncEngine, Engine] = {}
+        self._counter = count()
+        self._next_check = 0.0
+        self._check_task: asyncio.Task | None = None
+
+        for replica in self.replicas:
+            event.listen(replica.sync_engine, "handle_error", self._on_replica_error)
+
+    def choose_replica(self) -> AsyncEngine:
+        """Retorna a réplica da próxima sessão de leitura."""
+        healthy = [
+            replica for replica in self.replicas if replica not in self._unhealthy
+        ]
+
+        if not healthy:
+            return self.primary
+
+        if self.strategy == "least_connections":
+            return min(healthy, key=lambda replica: replica.pool.checkedout())
+
+        return healthy[next(self._counter) % len(healthy)]
+
+    def get_sync_engine(self, engine: AsyncEngine, autocommit: bool) -> Engine:
+        """Retorna o engine síncrono usado pela sessão, em autocommit se pedido.
+
+        A variante em autocommit compartilha o pool do engine original e não
+        abre transação, eliminando o BEGIN/COMMIT das sessões somente leitura.
+        """
+        if not autocommit:
+            return engine.sync_engine
+
+        if engine not in self._autocommit_engines:
+            self._autocommit_engines[engine] = engine.sync_engine.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+
+        return self._autocommit_engines[engine]
+
+    def is_healthy(self, replica: AsyncEngine) -> bool:
+        """Indica se a réplica está recebendo sessões de leitura."""
+        return replica not in self._unhealthy
+
+    def schedule_health_check(self) -> None:
+        """Dispara a verificação das réplicas em segundo plano, quando vencida."""
+        if not self.replicas or monotonic() < self._next_check:
+            return
+
+        if self._check_task is None or self._check_task.done():
+            self._next_check = monotonic() + self.check_interval
+            # Contexto vazio: as consultas da verificação não devem entrar nas
+            # métricas da requisição que a disparou.
+            self._check_task = asyncio.create_task(
+                self.check_health(), context=contextvars.Context()
+            )
+
+    async def check_health(self) -> None:
+        """Executa SELECT 1 em cada réplica e atualiza o estado de saúde."""
+        for replica in self.replicas:
+            try:
+                async with asyncio.timeout(self.check_timeout):
+                    async with replica.connect() as connection:
+                        await connection.execute(text("SELECT 1"))
+            except (OSError, SQLAlchemyError):
+                self._unhealthy.add(replica)
+            else:
+                self._unhealthy.discard(replica)
+
+    @property
+    def engines(self) -> list[AsyncEngine]:
+        """O primário seguido das réplicas."""
+        return [self.primary, *self.replicas]
+
+    async def dispose(self) -> None:
+        """Fecha as conexões de todos os engines e a verificação em andamento."""
+        if self._check_task is not None:
+            self._check_task.cancel()
+            self._check_task = None
+
+        for pooled_engine in self.engines:
+            await pooled_engine.dispose()
+
+    def reset_after_fork(self) -> None:
+        """Descarta, no processo filho, as conexões e o estado herdados do pai.
+
+        Conexões abertas não podem ser usadas por dois processos. Com
+        `close=False`, o filho apenas abandona as conexões do pai, que
+        continuam funcionando para ele, e abre as suas sob demanda.
+        """
+        for pooled_engine in self.engines:
+            pooled_engine.sync_engine.dispose(close=False)
+
+        self._autocommit_engines.clear()
+        self._unhealthy.clear()
+        self._next_check = 0.0
+        self._check_task = None
+
+    def _on_replica_error(self, context: ExceptionContext) -> None:
+        if context.is_disconnect or context.connection is None:
+            for replica in self.replicas:
+                if replica.sync_engine is context.engine:
+                    self._unhealthy.add(replica)
+
+
+@cache
+def get_replica_router() -> ReplicaRouter:
+    """Cria, no primeiro uso, os engines do primário e das réplicas.
+
+    Importar o módulo não carrega o driver do banco nem cria os pools; isso
+    acontece no aquecimento da inicialização ou na primeira sessão.
+    """
+    settings = get_settings()
+    return ReplicaRouter(
+        primary=create_engine_from_settings(settings.DB_URL),
+        replicas=[
+            create_engine_from_settings(url) for url in settings.DB_READ_REPLICA_URLS
+        ],
+        strategy=settings.DB_REPLICA_STRATEGY,
+        check_interval=settings.DB_REPLICA_CHECK_INTERVAL,
+        check_timeout=settings.DB_REPLICA_CHECK_TIMEOUT,
+    )
+
+
+def get_engine() -> AsyncEngine:
+    """Retorna o engine do banco primário, criando-o no primeiro uso."""
+    return get_replica_router().primary
+
+
+def _reset_after_fork() -> None:
+    if get_replica_router.cache_info().currsize:
+        get_replica_router().reset_after_fork()
+
+
+# Servidores que carregam a aplicação antes do fork (gunicorn --preload, por
+# exemplo) criariam workers compartilhando as conexões do processo pai.
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+USE_PRIMARY_KEY = "use_primary"
+WROTE_KEY = "wrote"
+READ_ONLY_KEY = "read_only"
+AUTOCOMMIT_KEY = "autocommit"
+REPLICA_KEY = "replica"
+READ_ONLY_ATTRIBUTE = "__read_only__"
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RoutingSession(Session):
+    """Sessão que envia leituras às réplicas e escritas ao primário.
+
+    Depois da primeira escrita, todos os comandos da sessão passam a usar o
+    primário, garantindo que a requisição leia o que acabou de gravar. Em
+    sessões somente leitura, as leituras usam conexões em autocommit; em
+    sessões em autocommit, todos os comandos as usam.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        if self._flushing or not _is_read(clause):
+            self.info[WROTE_KEY] = True
+
+        wrote = self.info.get(WROTE_KEY, False)
+        replica_router = get_replica_router()
+
+        if wrote or self.info.get(USE_PRIMARY_KEY):
+            engine = replica_router.primary
+        else:
+            if REPLICA_KEY not in self.info:
+                self.info[REPLICA_KEY] = replica_router.choose_replica()
+
+            engine = self.info[REPLICA_KEY]
+
+        autocommit = self.info.get(AUTOCOMMIT_KEY, False) or (
+            self.info.get(READ_ONLY_KEY, False) and not wrote
+        )
+
+        return replica_router.get_sync_engine(engine, autocommit)
+
+
+def _is_read(clause) -> bool:
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+def use_primary(session: AsyncSession) -> None:
+    """Faz os próximos comandos da sessão usarem o banco primário."""
+    session.info[USE_PRIMARY_KEY] = True
+
+
+async_session_maker = sessionmaker(
+    class_=AsyncSession, sync_session_class=RoutingSession, expire_on_commit=False
+)
+
+AFTER_COMMIT_KEY = "after_commit"
+
+
+@dataclass(slots=True)
+class PoolStats:
+    """Estado instantâneo do pool de conexões de um engine."""
+
+    name: str
+    healthy: bool
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+
+
+def get_pool_stats() -> list[PoolStats]:
+    """Retorna o estado dos pools do primário e das réplicas de leitura."""
+    replica_router = get_replica_router()
+    engines = {"primary": replica_router.primary} | {
+        f"replica-{index}": replica
+        for index, replica in enumerate(replica_router.replicas)
+    }
+
+    return [
+        PoolStats(
+            name=name,
+            healthy=replica_router.is_healthy(pooled_engine),
+            size=pooled_engine.pool.size(),
+            checked_in=pooled_engine.pool.checkedin(),
+            checked_out=pooled_engine.pool.checkedout(),
+            overflow=max(pooled_engine.pool.overflow(), 0),
+            max_overflow=get_settings().DB_MAX_OVERFLOW,
+        )
+        for name, pooled_engine in engines.items()
+    ]
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Agenda uma corrotina para rodar depois do COMMIT da sessão.
+
+    Os callbacks são descartados se a transação for desfeita.
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+
+def read_only(endpoint: Callable) -> Callable:
+    """Marca um endpoint como somente leitura, mesmo fora de GET/HEAD/OPTIONS.
+
+    A sessão do endpoint lê em autocommit e não executa COMMIT ao final.
+    """
+    setattr(endpoint, READ_ONLY_ATTRIBUTE, True)
+
+    return endpoint
+
+
+def transactional(endpoint: Callable) -> Callable:
+    """Marca um endpoint de leitura para rodar dentro de uma transação.
+
+    Necessário, por exemplo, para cursores no servidor, que o PostgreSQL só
+    permite dentro de uma transação.
+    """
+    setattr(endpoint, READ_ONLY_ATTRIBUTE, False)
+
+    return endpoint
+
+
+def is_read_only_request(request: Request) -> bool:
+    """Indica se a requisição só lê dados, pelo marcador da rota ou pelo método."""
+    endpoint = request.scope.get("endpoint")
+    marker = getattr(endpoint, READ_ONLY_ATTRIBUTE, None)
+
+    if marker is not None:
+        return marker
+
+    return request.method in READ_ONLY_METHODS
+
+
+@asynccontextmanager
+async def session_scope(
+    session_maker: sessionmaker, read_only: bool = False, autocommit: bool = False
+) -> AsyncIterator[AsyncSession]:
+    """Abre uma sessão com COMMIT ao final, ou ROLLBACK em caso de erro.
+
+    Sessões somente leitura não executam COMMIT, a menos que tenham escrito.
+    Em autocommit, cada comando é confirmado sozinho e libera os bloqueios
+    ao terminar, sem BEGIN nem COMMIT; serve a escritas de um único comando.
+    """
+    async with session_maker(
+        info={READ_ONLY_KEY: read_only, AUTOCOMMIT_KEY: autocommit}
+    ) as session:
         try:
             yield session
-            await session.commit()
+
+            if not read_only or session.info.get(WROTE_KEY):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
         finally:
+            after_commit = session.info.pop(AFTER_COMMIT_KEY, [])
             await session.close()
+
+        for callback in after_commit:
+            await callback()
+
+
+async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    """Dependency que fornece uma sessão no banco de dados.
+
+    Leituras são roteadas para as réplicas e escritas para o primário.
+    Requisições somente leitura dispensam a transação e o COMMIT.
+
+    Declare com `Depends(get_db_session, scope="function")`: assim o COMMIT e
+    os callbacks de `on_commit` terminam antes do envio da resposta, e uma
+    falha no COMMIT chega ao cliente. Só respostas em stream que leem da
+    sessão durante o envio devem manter o escopo da requisição.
+    """
+    get_replica_router().schedule_health_check()
+
+    async with session_scope(
+        async_session_maker, read_only=is_read_only_request(request)
+    ) as session:
+        yield session
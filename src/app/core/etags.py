@@ -0,0 +1,99 @@
+"""ETags derivadas da coluna de versão das entidades e das coleções."""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime
+
+WEAK_PREFIX = "W/"
+ANY_ETAG = "*"
+
+
+def make_etag(version: int, variant: str | None = None) -> str:
+    """Monta a ETag forte de uma entidade a partir da sua versão.
+
+    `variant` distingue representações diferentes da mesma versão, como
+    JSON e MessagePack.
+    """
+    if variant:
+        return f'"{version}-{variant}"'
+
+    return f'"{version}"'
+
+
+def _split(header: str) -> list[str]:
+    return [etag.strip() for etag in header.split(",") if etag.strip()]
+
+
+def none_match(if_none_match: str | None, etag: str) -> bool:
+    """Indica se a resposta deve ser enviada, segundo o If-None-Match.
+
+    A comparação é fraca: W/"3" corresponde a "3".
+    """
+    if if_none_match is None:
+        return True
+
+    etags = _split(if_none_match)
+
+    if ANY_ETAG in etags:
+        return False
+
+    return etag.removeprefix(WEAK_PREFIX) not in {
+        candidate.removeprefix(WEAK_PREFIX) for candidate in etags
+    }
+
+
+def parse_if_match(if_match: str | None) -> list[int] | None:
+    """Converte o If-Match nas versões aceitas para a escrita.
+
+    Retorna None quando qualquer versão serve (cabeçalho ausente ou `*`).
+    ETags fracas são aceitas: o CompressionMiddleware enfraquece a ETag das
+    respostas comprimidas, mas ela continua identificando a mesma versão.
+    ETags desconhecidas não correspondem a nenhuma versão.
+    """
+    if if_match is None:
+        return None
+
+    etags = [etag.removeprefix(WEAK_PREFIX) for etag in _split(if_match)]
+
+    if ANY_ETAG in etags:
+        return None
+
+    return [
+        int(etag[1:-1])
+        for etag in etags
+        if len(etag) > 2 and etag[0] == etag[-1] == '"' and etag[1:-1].isdigit()
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeMarker:
+    """Versão e horário da última alteração de uma coleção."""
+
+    version: int
+    updated_at: datetime
+
+    def etag(self, variant: str | None = None) -> str:
+        return make_etag(self.version, variant)
+
+    @property
+    def last_modified(self) -> str:
+        return format_datetime(self.updated_at.astimezone(UTC), usegmt=True)
+
+    def headers(self, cache_control: str, variant: str | None = None) -> dict[str, str]:
+        """Cabeçalhos de validação e de cache das respostas da coleção."""
+        return {
+            "ETag": self.etag(variant),
+            "Last-Modified": self.last_modified,
+            "Cache-Control": cache_control,
+        }
+
+    def pack(self) -> bytes:
+        """Serializa o marcador para o cache de leitura."""
+        return f"{self.version} {self.updated_at.isoformat()}".encode()
+
+    @classmethod
+    def unpack(cls, value: bytes) -> "ChangeMarker":
+        """Reconstrói um marcador gravado por `pack`."""
+        version, updated_at = value.decode().split(" ", 1)
+
+        return cls(int(version), datetime.fromisoformat(updated_at))
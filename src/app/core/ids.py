@@ -0,0 +1,61 @@
+"""Geração dos IDs das entidades.
+
+Com `ID_STRATEGY=uuid7`, os IDs começam pelo instante de criação em
+milissegundos (RFC 9562) e crescem com o tempo. Novas linhas vão para o fim
+do índice da chave primária em vez de uma folha aleatória, e a ordem por `id`
+passa a ser a ordem de criação.
+"""
+
+import os
+import threading
+from time import time_ns
+from uuid import UUID, uuid4
+
+from app.core.settings import get_settings
+
+# Os 12 bits "rand_a" do UUIDv7 guardam um contador que mantém os IDs
+# crescentes dentro do mesmo milissegundo (método 1 da RFC 9562, seção 6.2).
+COUNTER_MAX = 0xFFF
+RAND_B_MASK = (1 << 62) - 1
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    """Gera um UUIDv7 estritamente crescente dentro do processo.
+
+    Se o contador se esgotar no mesmo milissegundo, ou se o relógio voltar, o
+    instante usado avança um milissegundo em vez de repetir ou recuar.
+    """
+    global _last_timestamp, _counter
+
+    with _lock:
+        timestamp = time_ns() // 1_000_000
+
+        if timestamp > _last_timestamp:
+            _counter = 0
+        elif _counter < COUNTER_MAX:
+            timestamp = _last_timestamp
+            _counter += 1
+        else:
+            timestamp = _last_timestamp + 1
+            _counter = 0
+
+        _last_timestamp = timestamp
+        counter = _counter
+
+    rand_b = int.from_bytes(os.urandom(8)) & RAND_B_MASK
+
+    return UUID(
+        int=(timestamp << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand_b
+    )
+
+
+def new_id() -> UUID:
+    """Gera o ID de uma nova entidade conforme ID_STRATEGY."""
+    if get_settings().ID_STRATEGY == "uuid7":
+        return uuid7()
+
+    return uuid4()
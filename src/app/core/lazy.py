@@ -0,0 +1,26 @@
+"""Re-exportações de pacotes importadas só no primeiro uso."""
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> Callable[[str], object]:
+    """Cria o `__getattr__` de um pacote que importa cada nome sob demanda.
+
+    `exports` associa cada nome ao submódulo que o define, no formato
+    `"submódulo"` ou `"submódulo:atributo"` quando o nome exportado é outro.
+    Assim, importar um nome do pacote carrega apenas o submódulo dele.
+    """
+
+    def __getattr__(name: str) -> object:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        module_name, _, attribute = exports[name].partition(":")
+        value = getattr(import_module(f"{package}.{module_name}"), attribute or name)
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    return __getattr__
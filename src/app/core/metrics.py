@@ -0,0 +1,254 @@
+"""Métricas por requisição e no formato de exposição do Prometheus."""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+QUERY_START_KEY = "metrics_query_start"
+
+type Labels = tuple[str, ...]
+
+
+@dataclass(slots=True)
+class RequestMetrics:
+    """Tempos acumulados durante uma requisição, em segundos."""
+
+    query_count: int = 0
+    db_time: float = 0.0
+    slowest_query_time: float = 0.0
+    slowest_statement: str | None = None
+    serialization_time: float = 0.0
+    compression_time: float = 0.0
+
+    def record_query(self, statement: str, elapsed: float) -> None:
+        """Contabiliza uma consulta SQL executada na requisição."""
+        self.query_count += 1
+        self.db_time += elapsed
+
+        if elapsed > self.slowest_query_time:
+            self.slowest_query_time = elapsed
+            self.slowest_statement = statement
+
+    def handler_time(self, total: float) -> float:
+        """Tempo gasto fora do banco, da serialização e da compressão."""
+        return max(
+            total - self.db_time - self.serialization_time - self.compression_time,
+            0.0,
+        )
+
+
+_request_metrics: ContextVar[RequestMetrics | None] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+def start_request_metrics() -> tuple[RequestMetrics, Token]:
+    """Passa a acumular as métricas da requisição do contexto atual."""
+    metrics = RequestMetrics()
+
+    return metrics, _request_metrics.set(metrics)
+
+
+def stop_request_metrics(token: Token) -> None:
+    """Encerra o acúmulo iniciado por `start_request_metrics`."""
+    _request_metrics.reset(token)
+
+
+def record_serialization(elapsed: float) -> None:
+    """Soma o tempo de serialização da resposta à requisição atual."""
+    metrics = _request_metrics.get()
+
+    if metrics is not None:
+        metrics.serialization_time += elapsed
+
+
+def record_compression(elapsed: float) -> None:
+    """Soma o tempo de compressão da resposta à requisição atual."""
+    metrics = _request_metrics.get()
+
+    if metrics is not None:
+        metrics.compression_time += elapsed
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Registra no engine os eventos que medem cada comando SQL."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _on_cursor_error)
+
+
+def _before_cursor_execute(connection, cursor, statement, *args) -> None:
+    connection.info.setdefault(QUERY_START_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(connection, cursor, statement, *args) -> None:
+    elapsed = perf_counter() - connection.info[QUERY_START_KEY].pop()
+    metrics = _request_metrics.get()
+
+    if metrics is not None:
+        metrics.record_query(statement, elapsed)
+
+
+def _on_cursor_error(context: ExceptionContext) -> None:
+    # `cursor` fica sem valor quando o erro acontece antes de o cursor existir.
+    if context.connection is None or getattr(context, "cursor", None) is None:
+        return
+
+    started = context.connection.info.get(QUERY_START_KEY)
+    if started:
+        started.pop()
+
+
+def _format_labels(names: Sequence[str], values: Labels, **extra: str) -> str:
+    pairs = [*zip(names, values), *extra.items()]
+    if not pairs:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+class Counter:
+    """Contador monotônico com rótulos."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels, amount: float = 1.0) -> None:
+        """Incrementa o contador da combinação de rótulos."""
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> list[str]:
+        """Linhas do contador no formato de texto do Prometheus."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        for labels, value in sorted(self._values.items()):
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, labels)} {value}"
+            )
+
+        return lines
+
+
+class Histogram:
+    """Histograma com buckets fixos e rótulos."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels,
+        buckets: Sequence[float],
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        """Registra uma observação na combinação de rótulos."""
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[labels] = self._sums.get(labels, 0.0) + value
+
+    def render(self) -> list[str]:
+        """Linhas do histograma no formato de texto do Prometheus."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(self.labelnames, labels, le=str(bound))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+
+            series_labels = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{series_labels} {self._sums[labels]}")
+            lines.append(f"{self.name}_count{series_labels} {cumulative}")
+
+        return lines
+
+
+class MetricsRegistry:
+    """Métricas HTTP do processo, expostas em /metrics."""
+
+    def __init__(self) -> None:
+        route_labels = ("method", "route")
+        self.request_duration = Histogram(
+            "http_request_duration_seconds",
+            "Duração das requisições HTTP.",
+            (*route_labels, "status"),
+            DURATION_BUCKETS,
+        )
+        self.db_duration = Histogram(
+            "http_request_db_duration_seconds",
+            "Tempo gasto em comandos SQL por requisição.",
+            route_labels,
+            DURATION_BUCKETS,
+        )
+        self.db_queries = Histogram(
+            "http_request_db_queries",
+            "Comandos SQL executados por requisição.",
+            route_labels,
+            QUERY_COUNT_BUCKETS,
+        )
+        self.query_threshold_exceeded = Counter(
+            "http_request_query_threshold_exceeded_total",
+            "Requisições acima do limite de consultas SQL (possível N+1).",
+            route_labels,
+        )
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        metrics: RequestMetrics,
+        exceeded_query_threshold: bool,
+    ) -> None:
+        """Registra a requisição concluída em todas as métricas."""
+        labels = (method, route)
+        self.request_duration.observe((*labels, str(status)), duration)
+        self.db_duration.observe(labels, metrics.db_time)
+        self.db_queries.observe(labels, metrics.query_count)
+
+        if exceeded_query_threshold:
+            self.query_threshold_exceeded.inc(labels)
+
+    def render(self) -> str:
+        """Todas as métricas no formato de texto do Prometheus."""
+        lines = [
+            *self.request_duration.render(),
+            *self.db_duration.render(),
+            *self.db_queries.render(),
+            *self.query_threshold_exceeded.render(),
+        ]
+
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,67 @@
+"""Negociação de conteúdo pelos cabeçalhos Accept e Accept-Encoding."""
+
+from collections.abc import Sequence
+
+MSGPACK_MEDIA_TYPES = frozenset(
+    {"application/msgpack", "application/x-msgpack", "application/vnd.msgpack"}
+)
+JSON_MEDIA_RANGES = frozenset({"application/json", "application/*", "*/*"})
+
+
+def parse_quality_values(header: str) -> dict[str, float]:
+    """Converte um cabeçalho como `gzip;q=0.8, br` em {valor: q}."""
+    values: dict[str, float] = {}
+
+    for item in header.split(","):
+        value, *parameters = (part.strip() for part in item.split(";"))
+
+        if not value:
+            continue
+
+        quality = 1.0
+        for parameter in parameters:
+            name, _, raw = parameter.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(raw)
+                except ValueError:
+                    quality = 0.0
+
+        values[value.lower()] = max(quality, values.get(value.lower(), 0.0))
+
+    return values
+
+
+def choose_encoding(accept_encoding: str, encodings: Sequence[str]) -> str | None:
+    """Escolhe a codificação aceita pelo cliente com maior q.
+
+    Em caso de empate vale a ordem de preferência de `encodings`.
+    """
+    qualities = parse_quality_values(accept_encoding)
+    default = qualities.get("*", 0.0)
+    best: str | None = None
+    best_quality = 0.0
+
+    for encoding in encodings:
+        quality = qualities.get(encoding, default)
+
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def prefers_msgpack(accept: str | None) -> bool:
+    """Indica se o cliente prefere MessagePack a JSON, pelo Accept."""
+    if not accept:
+        return False
+
+    qualities = parse_quality_values(accept)
+    msgpack_quality = max(
+        qualities.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES
+    )
+    json_quality = max(
+        qualities.get(media_range, 0.0) for media_range in JSON_MEDIA_RANGES
+    )
+
+    return msgpack_quality > 0 and msgpack_quality >= json_quality
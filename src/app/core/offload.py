@@ -0,0 +1,126 @@
+"""Execução de tarefas de CPU fora do event loop, com fila limitada."""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+
+from app.core.settings import get_settings
+from app.exceptions import ExecutorSaturatedException
+
+# Valor de nice dos workers: quanto maior, menor a prioridade.
+WORKER_NICE = 10
+
+
+@dataclass(slots=True)
+class ExecutorStats:
+    """Contadores de uso de um BoundedExecutor."""
+
+    pending: int = 0
+    completed: int = 0
+    rejected: int = 0
+
+
+class BoundedExecutor:
+    """Envia funções a um pool de threads ou processos, limitando a fila.
+
+    Aceita no máximo `max_pending` tarefas entre as em execução e as
+    aguardando um worker; acima disso, recusa a tarefa na hora com
+    ExecutorSaturatedException em vez de acumular latência. Uma tarefa só
+    libera a sua vaga quando termina no pool, mesmo que a requisição que a
+    aguardava tenha sido cancelada.
+    """
+
+    def __init__(self, name: str, executor: Executor, max_pending: int) -> None:
+        self.name = name
+        self.executor = executor
+        self.max_pending = max_pending
+        self._stats = ExecutorStats()
+
+    async def run[**P, T](
+        self, function: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Executa `function` no pool e aguarda o resultado sem bloquear o loop."""
+        if self._stats.pending >= self.max_pending:
+            self._stats.rejected += 1
+            raise ExecutorSaturatedException(self.name)
+
+        loop = asyncio.get_running_loop()
+        future = self.executor.submit(function, *args, **kwargs)
+        self._stats.pending += 1
+        future.add_done_callback(lambda _: self._schedule_release(loop))
+
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> ExecutorStats:
+        """Retorna uma cópia dos contadores atuais."""
+        return ExecutorStats(
+            self._stats.pending, self._stats.completed, self._stats.rejected
+        )
+
+    def shutdown(self) -> None:
+        """Encerra o pool, descartando as tarefas que ainda não começaram."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_release(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Devolve a vaga no event loop; chamado pela thread do pool."""
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            # O loop já foi encerrado e ninguém mais disputa as vagas.
+            pass
+
+    def _release(self) -> None:
+        self._stats.pending -= 1
+        self._stats.completed += 1
+
+
+def lower_worker_priority() -> None:
+    """Reduz a prioridade da thread do worker perante o sistema operacional.
+
+    Com os núcleos ocupados, o escalonador passa a preferir o event loop, que
+    atende as demais requisições. No Linux a prioridade é por thread e é
+    herdada pelas threads que o worker criar.
+    """
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), WORKER_NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+def create_executor(kind: str, workers: int, name: str) -> Executor:
+    """Cria o pool de threads ou de processos subjacente."""
+    if kind == "process":
+        # spawn evita herdar threads e conexões abertas do processo pai.
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=lower_worker_priority,
+        )
+
+    return ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix=name,
+        initializer=lower_worker_priority,
+    )
+
+
+@cache
+def get_password_executor() -> BoundedExecutor:
+    """Retorna o pool de hash de senhas, compartilhado pelo processo."""
+    settings = get_settings()
+    workers = settings.PASSWORD_HASH_WORKERS
+
+    return BoundedExecutor(
+        "password-hash",
+        create_executor(settings.PASSWORD_HASH_EXECUTOR, workers, "password-hash"),
+        max_pending=workers + settings.PASSWORD_HASH_QUEUE_SIZE,
+    )
+
+
+# As threads do pool não sobrevivem ao fork; o filho cria o seu próprio pool.
+os.register_at_fork(after_in_child=get_password_executor.cache_clear)
@@ -0,0 +1,83 @@
+"""Respostas JSON e MessagePack serializadas diretamente em bytes."""
+
+from collections.abc import Iterable
+from operator import attrgetter
+from time import perf_counter
+from typing import Any
+
+import msgpack
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+from app.core.metrics import record_serialization
+from app.core.negotiation import prefers_msgpack
+
+
+class ModelJSONResponse(JSONResponse):
+    """Resposta JSON que serializa o conteúdo direto para bytes.
+
+    Modelos Pydantic já validados, dicionários e listas são serializados pelo
+    núcleo em Rust do Pydantic, e bytes são enviados como estão. Endpoints
+    que retornam esta resposta pulam a segunda validação do `response_model`.
+    """
+
+    etag_variant: str | None = None
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+
+        started = perf_counter()
+        body = to_json(content)
+        record_serialization(perf_counter() - started)
+
+        return body
+
+
+class ModelMsgPackResponse(ModelJSONResponse):
+    """Resposta em MessagePack, mais compacta e rápida de decodificar que JSON.
+
+    O conteúdo é convertido para tipos nativos pelo Pydantic (UUIDs viram
+    texto, como no JSON) e empacotado pela extensão em C do msgpack.
+    """
+
+    media_type = "application/msgpack"
+    etag_variant = "msgpack"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+
+        started = perf_counter()
+        body = msgpack.packb(to_jsonable_python(content))
+        record_serialization(perf_counter() - started)
+
+        return body
+
+
+def negotiate_response_class(accept: str | None) -> type[ModelJSONResponse]:
+    """Escolhe entre JSON e MessagePack pelo cabeçalho Accept."""
+    if prefers_msgpack(accept):
+        return ModelMsgPackResponse
+
+    return ModelJSONResponse
+
+
+class RowSerializer:
+    """Projeta objetos do ORM nos campos de um schema, sem instanciá-lo.
+
+    Gera dicionários prontos para a ModelJSONResponse, evitando criar um
+    modelo Pydantic por linha nas listagens.
+    """
+
+    def __init__(self, schema: type[BaseModel]) -> None:
+        self.fields: tuple[str, ...] = tuple(schema.model_fields)
+        self._getter = attrgetter(*self.fields)
+
+    def to_dicts(self, rows: Iterable[object]) -> list[dict[str, Any]]:
+        """Converte as linhas em dicionários com os campos do schema."""
+        if len(self.fields) == 1:
+            return [{self.fields[0]: self._getter(row)} for row in rows]
+
+        return [dict(zip(self.fields, self._getter(row))) for row in rows]
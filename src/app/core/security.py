@@ -0,0 +1,24 @@
+"""Hash e verificação de senhas com Argon2id.
+
+As funções são síncronas e custosas por definição; devem ser executadas no
+pool de `get_password_executor`, nunca direto no event loop. Ficam no nível
+do módulo para que também possam ser enviadas a um pool de processos.
+"""
+
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+
+_password_hasher = PasswordHasher()
+
+
+def hash_password(password: str) -> str:
+    """Gera o hash Argon2id da senha."""
+    return _password_hasher.hash(password)
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """Confere a senha contra um hash gerado por `hash_password`."""
+    try:
+        return _password_hasher.verify(password_hash, password)
+    except VerifyMismatchError:
+        return False
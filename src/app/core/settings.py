@@ -1,5 +1,8 @@
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cache
+from typing import Annotated, Literal
+
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -9,6 +12,317 @@ class Settings(BaseSettings):
         ...,
         description="URL de conexão com o banco de dados",
     )
+    DB_READ_REPLICA_URLS: Annotated[list[str], NoDecode] = Field(
+        [],
+        description="URLs das réplicas de leitura, separadas por vírgula",
+    )
+    DB_REPLICA_STRATEGY: Literal["round_robin", "least_connections"] = Field(
+        "round_robin",
+        description="Estratégia de escolha da réplica de cada sessão",
+    )
+    DB_REPLICA_CHECK_INTERVAL: float = Field(
+        10.0,
+        description="Segundos entre as verificações de saúde das réplicas",
+        gt=0,
+    )
+    DB_REPLICA_CHECK_TIMEOUT: float = Field(
+        2.0,
+        description="Tempo limite em segundos da verificação de saúde",
+        gt=0,
+    )
+    DB_POOL_SIZE: int = Field(
+        5,
+        description="Conexões mantidas abertas no pool de cada engine",
+        ge=1,
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        10,
+        description="Conexões extras permitidas além de DB_POOL_SIZE",
+        ge=0,
+    )
+    DB_POOL_TIMEOUT: float = Field(
+        30.0,
+        description="Segundos de espera por uma conexão livre do pool",
+        gt=0,
+    )
+    DB_POOL_RECYCLE: int = Field(
+        1_800,
+        description="Idade máxima de uma conexão em segundos (-1 desativa)",
+        ge=-1,
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        True,
+        description="Testa a conexão antes de usá-la, descartando conexões mortas",
+    )
+    DB_POOL_USE_LIFO: bool = Field(
+        False,
+        description="Reutiliza a conexão devolvida mais recentemente (LIFO)",
+    )
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        100,
+        description="Tamanho do cache de prepared statements por conexão asyncpg",
+        ge=0,
+    )
+    DB_POOL_WARMUP_CONNECTIONS: int | None = Field(
+        None,
+        description=(
+            "Conexões abertas e aquecidas por engine na inicialização (vazio "
+            "usa DB_POOL_SIZE; 0 não abre conexões)"
+        ),
+        ge=0,
+    )
+    STARTUP_WARMUP_TIMEOUT: float = Field(
+        30.0,
+        description=(
+            "Segundos máximos de aquecimento na inicialização; depois disso, a "
+            "aplicação fica pronta mesmo sem terminar"
+        ),
+        gt=0,
+    )
+    ID_STRATEGY: Literal["uuid4", "uuid7"] = Field(
+        "uuid7",
+        description=(
+            "Geração dos IDs das entidades: `uuid7` cresce com o tempo e mantém "
+            "as inserções no fim do índice; `uuid4` é totalmente aleatório"
+        ),
+    )
+    EXPORT_CHUNK_SIZE: int = Field(
+        5_000,
+        description="Linhas lidas do cursor do servidor por bloco na exportação",
+        gt=0,
+    )
+    BULK_CHUNK_SIZE: int = Field(
+        1_000,
+        description="Quantidade padrão de itens por comando nas operações em lote",
+        gt=0,
+        le=10_000,
+    )
+    IMPORT_BATCH_SIZE: int = Field(
+        5_000,
+        description="Linhas validadas e gravadas por bloco na importação",
+        gt=0,
+        le=50_000,
+    )
+    IMPORT_MAX_LINE_BYTES: int = Field(
+        65_536,
+        description="Tamanho máximo em bytes de uma linha do arquivo de importação",
+        gt=0,
+    )
+    IMPORT_MAX_REPORTED_REJECTS: int = Field(
+        1_000,
+        description=(
+            "Linhas recusadas detalhadas na resposta da importação; as demais "
+            "entram só na contagem"
+        ),
+        ge=0,
+    )
+    IDEMPOTENCY_TTL_SECONDS: int = Field(
+        86_400,
+        description=(
+            "Segundos em que uma chave de idempotência repete a resposta "
+            "gravada; depois disso, pode ser reutilizada"
+        ),
+        ge=1,
+    )
+    IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS: float = Field(
+        300.0,
+        description="Intervalo entre as limpezas das chaves de idempotência expiradas",
+        gt=0,
+    )
+    IDEMPOTENCY_CLEANUP_BATCH_SIZE: int = Field(
+        1_000,
+        description="Chaves expiradas removidas por comando na limpeza",
+        ge=1,
+    )
+    CACHE_TTL_SECONDS: float = Field(
+        60.0,
+        description="Tempo de vida das entradas do cache de leitura, em segundos",
+        gt=0,
+    )
+    CACHE_MAX_ENTRIES: int = Field(
+        100_000,
+        description="Quantidade máxima de entradas do cache em memória (LRU)",
+        gt=0,
+    )
+    CHANGE_MARKER_TTL_SECONDS: float = Field(
+        1.0,
+        description=(
+            "Tempo em cache do marcador de alterações das coleções; limita por "
+            "quanto tempo outros processos respondem 304 após uma escrita"
+        ),
+        gt=0,
+    )
+    CHANGES_HISTORY_SIZE: int = Field(
+        1_024,
+        description=(
+            "Eventos de alteração guardados por processo para retomar streams "
+            "pelo Last-Event-ID"
+        ),
+        ge=0,
+    )
+    CHANGES_SUBSCRIBER_BUFFER: int = Field(
+        256,
+        description=(
+            "Eventos pendentes por assinante do feed; acima disso, o assinante "
+            "é desconectado"
+        ),
+        ge=1,
+    )
+    CHANGES_MAX_SUBSCRIBERS: int = Field(
+        10_000,
+        description="Assinantes do feed por processo; acima disso, 503",
+        ge=1,
+    )
+    CHANGES_MAX_EVENTS_PER_WRITE: int = Field(
+        100,
+        description=(
+            "Produtos alterados por escrita acima dos quais o feed publica um "
+            "único evento reset em vez de um evento por produto"
+        ),
+        ge=1,
+    )
+    CHANGES_HEARTBEAT_SECONDS: float = Field(
+        15.0,
+        description="Intervalo dos comentários que mantêm o stream vivo",
+        gt=0,
+    )
+    CHANGES_NOTIFY: bool = Field(
+        False,
+        description=(
+            "Distribui os eventos entre os processos com LISTEN/NOTIFY do "
+            "PostgreSQL; necessário com mais de um worker. Desligado por "
+            "padrão porque o NOTIFY serializa os COMMITs das escritas"
+        ),
+    )
+    CHANGES_NOTIFY_CHANNEL: str = Field(
+        "product_changes",
+        description="Canal do LISTEN/NOTIFY usado pelo feed de alterações",
+        pattern=r"^[a-z_][a-z0-9_]*$",
+    )
+    CACHE_CONTROL_PRODUCT_LIST: str = Field(
+        "no-cache",
+        description="Cabeçalho Cache-Control da listagem de produtos",
+    )
+    CACHE_CONTROL_PRODUCT_DETAIL: str = Field(
+        "no-cache",
+        description="Cabeçalho Cache-Control da consulta de um produto",
+    )
+    COMPRESSION_MINIMUM_SIZE: int = Field(
+        1_024,
+        description="Tamanho mínimo em bytes para comprimir uma resposta",
+        ge=0,
+    )
+    COMPRESSION_ENCODINGS: Annotated[list[Literal["zstd", "br", "gzip"]], NoDecode] = (
+        Field(
+            ["zstd", "br", "gzip"],
+            description=(
+                "Codificações oferecidas, separadas por vírgula, em ordem de "
+                "preferência (vazio desativa a compressão)"
+            ),
+        )
+    )
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = Field(
+        "thread",
+        description=(
+            "Pool usado no hash de senhas; o Argon2 libera o GIL, então "
+            "threads bastam na maioria dos casos"
+        ),
+    )
+    PASSWORD_HASH_WORKERS: int = Field(
+        2,
+        description="Workers do pool de hash de senhas, por processo",
+        ge=1,
+    )
+    PASSWORD_HASH_QUEUE_SIZE: int = Field(
+        16,
+        description=(
+            "Hashes aguardando um worker além dos em execução; acima disso, "
+            "a requisição recebe 503"
+        ),
+        ge=0,
+    )
+    SERVER_HOST: str = Field(
+        "0.0.0.0",
+        description="Endereço em que o servidor de produção escuta",
+    )
+    SERVER_PORT: int = Field(
+        8000,
+        description="Porta do servidor de produção",
+        ge=1,
+        le=65_535,
+    )
+    SERVER_WORKERS: int | None = Field(
+        None,
+        description="Processos do servidor de produção (vazio usa um por CPU)",
+        ge=1,
+    )
+    SERVER_BACKLOG: int = Field(
+        2_048,
+        description="Conexões aguardando aceite na fila do socket",
+        ge=1,
+    )
+    SERVER_KEEP_ALIVE: int = Field(
+        5,
+        description="Segundos que uma conexão ociosa fica aberta (keep-alive)",
+        ge=1,
+    )
+    SERVER_LIMIT_CONCURRENCY: int | None = Field(
+        None,
+        description=(
+            "Conexões e requisições simultâneas por worker; acima disso, o "
+            "servidor responde 503 (vazio não limita)"
+        ),
+        ge=1,
+    )
+    SERVER_GRACEFUL_TIMEOUT: int = Field(
+        30,
+        description=(
+            "Segundos de espera pelas requisições em andamento ao encerrar o servidor"
+        ),
+        ge=0,
+    )
+    SERVER_ACCESS_LOG: bool = Field(
+        False,
+        description=(
+            "Ativa o log de acesso do uvicorn, redundante com o log de "
+            "requisições da aplicação"
+        ),
+    )
+    ENABLED_ROUTERS: Annotated[
+        list[Literal["carts", "clients", "metrics"]], NoDecode
+    ] = Field(
+        ["carts", "clients", "metrics"],
+        description=(
+            "Routers opcionais habilitados, separados por vírgula; os módulos "
+            "dos demais não são importados"
+        ),
+    )
+    LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(
+        "INFO",
+        description="Nível dos logs da aplicação",
+    )
+    QUERY_COUNT_WARNING_THRESHOLD: int = Field(
+        20,
+        description=(
+            "Consultas SQL por requisição acima das quais a requisição é "
+            "registrada como possível N+1"
+        ),
+        ge=1,
+    )
+
+    @field_validator(
+        "DB_READ_REPLICA_URLS",
+        "COMPRESSION_ENCODINGS",
+        "ENABLED_ROUTERS",
+        mode="before",
+    )
+    @classmethod
+    def split_comma_separated(cls, value: object) -> object:
+        """Aceita listas como texto separado por vírgulas."""
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(",") if item.strip()]
+
+        return value
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -16,4 +330,7 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """Configurações da aplicação, lidas do ambiente no primeiro uso."""
+    return Settings()
@@ -1,3 +1,27 @@
-from .exceptions import ProductNotFoundException, InvalidProductDataException
+from .exceptions import (
+    CartNotFoundException,
+    ClientAlreadyExistsException,
+    ClientNotFoundException,
+    EmptyCartException,
+    ExecutorSaturatedException,
+    IdempotencyKeyMismatchException,
+    InsufficientStockException,
+    InvalidCursorException,
+    InvalidProductDataException,
+    PreconditionFailedException,
+    ProductNotFoundException,
+)
 
-__all__ = ["ProductNotFoundException", "InvalidProductDataException"]
\ No newline at end of file
+__all__ = [
+    "CartNotFoundException",
+    "ClientAlreadyExistsException",
+    "ClientNotFoundException",
+    "EmptyCartException",
+    "ExecutorSaturatedException",
+    "IdempotencyKeyMismatchException",
+    "InsufficientStockException",
+    "InvalidCursorException",
+    "InvalidProductDataException",
+    "PreconditionFailedException",
+    "ProductNotFoundException",
+]
@@ -18,3 +18,85 @@ class InvalidProductDataException(Exception):
     def __init__(self, message: str) -> None:
         self.message: str = message
         super().__init__(self.message)
+
+
+class InvalidCursorException(Exception):
+    """Exceção lançada quando o cursor de paginação é inválido."""
+
+    def __init__(self, message: str) -> None:
+        self.message: str = message
+        super().__init__(self.message)
+
+
+class InsufficientStockException(Exception):
+    """Exceção lançada quando não há estoque suficiente para uma reserva."""
+
+    def __init__(self, shortages: dict[UUID, tuple[int, int]]) -> None:
+        self.shortages: dict[UUID, tuple[int, int]] = shortages
+        self.message = "Estoque insuficiente para reservar os produtos solicitados."
+        super().__init__(self.message)
+
+
+class PreconditionFailedException(Exception):
+    """Exceção lançada quando a versão do produto não é a esperada pelo If-Match."""
+
+    def __init__(self, product_id: UUID, current_version: int) -> None:
+        self.product_id: UUID = product_id
+        self.current_version: int = current_version
+        self.message = f"Produto com ID {product_id} foi alterado por outra requisição."
+        super().__init__(self.message)
+
+
+class ClientNotFoundException(Exception):
+    """Exceção lançada quando um cliente não é encontrado."""
+
+    def __init__(self, client_id: UUID) -> None:
+        self.client_id: UUID = client_id
+        self.message = f"Cliente com ID {client_id} não foi encontrado."
+        super().__init__(self.message)
+
+
+class ClientAlreadyExistsException(Exception):
+    """Exceção lançada quando o CPF ou o e-mail já pertence a outro cliente."""
+
+    def __init__(self) -> None:
+        self.message = "Já existe um cliente com este CPF ou e-mail."
+        super().__init__(self.message)
+
+
+class CartNotFoundException(Exception):
+    """Exceção lançada quando um carrinho de compras não é encontrado."""
+
+    def __init__(self, cart_id: UUID) -> None:
+        self.cart_id: UUID = cart_id
+        self.message = f"Carrinho com ID {cart_id} não foi encontrado."
+        super().__init__(self.message)
+
+
+class EmptyCartException(Exception):
+    """Exceção lançada ao fechar um carrinho sem itens."""
+
+    def __init__(self, cart_id: UUID) -> None:
+        self.cart_id: UUID = cart_id
+        self.message = f"O carrinho com ID {cart_id} não tem itens."
+        super().__init__(self.message)
+
+
+class ExecutorSaturatedException(Exception):
+    """Exceção lançada quando um pool de trabalho não aceita mais tarefas."""
+
+    def __init__(self, executor_name: str) -> None:
+        self.executor_name: str = executor_name
+        self.message = "Servidor sobrecarregado. Tente novamente em instantes."
+        super().__init__(self.message)
+
+
+class IdempotencyKeyMismatchException(Exception):
+    """Exceção lançada ao reutilizar uma chave de idempotência em outra escrita."""
+
+    def __init__(self, key: str) -> None:
+        self.key: str = key
+        self.message = (
+            "A chave de idempotência já foi usada em uma requisição diferente."
+        )
+        super().__init__(self.message)
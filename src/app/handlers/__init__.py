@@ -1,9 +1,27 @@
 from .exception_handlers import (
+    cart_not_found_exception_handler,
+    client_already_exists_exception_handler,
+    client_not_found_exception_handler,
+    empty_cart_exception_handler,
+    executor_saturated_exception_handler,
+    idempotency_key_mismatch_exception_handler,
+    insufficient_stock_exception_handler,
+    invalid_cursor_exception_handler,
     invalid_product_data_exception_handler,
+    precondition_failed_exception_handler,
     product_not_found_exception_handler,
 )
 
 __all__ = [
+    "cart_not_found_exception_handler",
+    "client_already_exists_exception_handler",
+    "client_not_found_exception_handler",
+    "empty_cart_exception_handler",
+    "executor_saturated_exception_handler",
+    "idempotency_key_mismatch_exception_handler",
+    "insufficient_stock_exception_handler",
+    "invalid_cursor_exception_handler",
     "invalid_product_data_exception_handler",
+    "precondition_failed_exception_handler",
     "product_not_found_exception_handler",
 ]
@@ -2,7 +2,22 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 from starlette import status
 
-from app.exceptions import InvalidProductDataException, ProductNotFoundException
+from app.core.etags import make_etag
+from app.exceptions import (
+    CartNotFoundException,
+    ClientAlreadyExistsException,
+    ClientNotFoundException,
+    EmptyCartException,
+    ExecutorSaturatedException,
+    IdempotencyKeyMismatchException,
+    InsufficientStockException,
+    InvalidCursorException,
+    InvalidProductDataException,
+    PreconditionFailedException,
+    ProductNotFoundException,
+)
+
+RETRY_AFTER_SECONDS = 1
 
 
 async def product_not_found_exception_handler(
@@ -11,7 +26,7 @@ async def product_not_found_exception_handler(
     """Handler para quando o produto não é encontrado."""
     return JSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
-        content={"detail": exception.message, "product_id": exception.product_id},
+        content={"detail": exception.message, "product_id": str(exception.product_id)},
     )
 
 
@@ -23,3 +38,105 @@ async def invalid_product_data_exception_handler(
         status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
         content={"detail": exception.message},
     )
+
+
+async def invalid_cursor_exception_handler(
+    request: Request, exception: InvalidCursorException
+) -> JSONResponse:
+    """Handler para cursores de paginação inválidos."""
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": exception.message},
+    )
+
+
+async def insufficient_stock_exception_handler(
+    request: Request, exception: InsufficientStockException
+) -> JSONResponse:
+    """Handler para reservas sem estoque suficiente."""
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={
+            "detail": exception.message,
+            "items": [
+                {
+                    "product_id": str(product_id),
+                    "requested": requested,
+                    "available": available,
+                }
+                for product_id, (requested, available) in exception.shortages.items()
+            ],
+        },
+    )
+
+
+async def precondition_failed_exception_handler(
+    request: Request, exception: PreconditionFailedException
+) -> JSONResponse:
+    """Handler para escritas com If-Match que não corresponde à versão atual."""
+    return JSONResponse(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        content={"detail": exception.message, "product_id": str(exception.product_id)},
+        headers={"ETag": make_etag(exception.current_version)},
+    )
+
+
+async def client_not_found_exception_handler(
+    request: Request, exception: ClientNotFoundException
+) -> JSONResponse:
+    """Handler para quando o cliente não é encontrado."""
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": exception.message, "client_id": str(exception.client_id)},
+    )
+
+
+async def client_already_exists_exception_handler(
+    request: Request, exception: ClientAlreadyExistsException
+) -> JSONResponse:
+    """Handler para CPF ou e-mail já cadastrado."""
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": exception.message},
+    )
+
+
+async def cart_not_found_exception_handler(
+    request: Request, exception: CartNotFoundException
+) -> JSONResponse:
+    """Handler para quando o carrinho não é encontrado."""
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": exception.message, "cart_id": str(exception.cart_id)},
+    )
+
+
+async def empty_cart_exception_handler(
+    request: Request, exception: EmptyCartException
+) -> JSONResponse:
+    """Handler para o fechamento de um carrinho sem itens."""
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": exception.message, "cart_id": str(exception.cart_id)},
+    )
+
+
+async def executor_saturated_exception_handler(
+    request: Request, exception: ExecutorSaturatedException
+) -> JSONResponse:
+    """Handler para pools de trabalho saturados: pede ao cliente que tente depois."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": exception.message},
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+    )
+
+
+async def idempotency_key_mismatch_exception_handler(
+    request: Request, exception: IdempotencyKeyMismatchException
+) -> JSONResponse:
+    """Handler para chaves de idempotência reutilizadas com outro conteúdo."""
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        content={"detail": exception.message, "idempotency_key": exception.key},
+    )
@@ -0,0 +1,70 @@
+"""Importação de produtos a partir de um arquivo CSV ou NDJSON.
+
+Faz o mesmo que `POST /products/import`, lendo o arquivo em blocos e
+gravando-o direto no banco, sem passar pelo servidor. A importação roda em
+uma única transação: se ela for interrompida, nada é gravado. O resultado
+é impresso em JSON.
+
+Uso:
+
+    PYTHONPATH=src python -m app.importer produtos.csv --batch-size 10000
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import BinaryIO
+
+from app.core import get_cache, get_settings
+from app.core.database import async_session_maker, get_replica_router, session_scope
+from app.schemas import ExportFormat
+from app.services import ProductService
+from app.services.product_import import SUFFIX_FORMATS
+
+READ_SIZE = 1024 * 1024
+
+
+async def read_chunks(file: BinaryIO) -> AsyncIterator[bytes]:
+    """Lê o arquivo em blocos, sem bloquear o event loop."""
+    while chunk := await asyncio.to_thread(file.read, READ_SIZE):
+        yield chunk
+
+
+async def import_file(path: Path, import_format: ExportFormat, batch_size: int) -> str:
+    """Importa o arquivo e retorna o resultado em JSON."""
+    try:
+        async with session_scope(async_session_maker) as session:
+            with path.open("rb") as file:
+                result = await ProductService(session, get_cache()).import_products(
+                    read_chunks(file), import_format, batch_size
+                )
+    finally:
+        await get_replica_router().dispose()
+
+    return result.model_dump_json(indent=2)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Importa produtos de um arquivo")
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        type=ExportFormat,
+        choices=list(ExportFormat),
+        help="Formato do arquivo (padrão: deduzido da extensão)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=get_settings().IMPORT_BATCH_SIZE
+    )
+    arguments = parser.parse_args(argv)
+    import_format = arguments.format or SUFFIX_FORMATS.get(arguments.path.suffix)
+
+    if import_format is None:
+        parser.error("Informe --format: a extensão do arquivo não é conhecida.")
+
+    print(asyncio.run(import_file(arguments.path, import_format, arguments.batch_size)))
+
+
+if __name__ == "__main__":
+    main()
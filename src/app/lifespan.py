@@ -0,0 +1,182 @@
+"""Ciclo de vida da aplicação: aquecimento na inicialização e encerramento limpo."""
+
+import asyncio
+import json
+import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from time import perf_counter
+from uuid import UUID
+
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core import get_cache, get_settings
+from app.core.changes import get_change_broadcaster, listen_for_changes
+from app.core.database import async_session_maker, get_replica_router, session_scope
+from app.core.offload import get_password_executor
+from app.repositories import ProductRepository
+from app.schemas import ProductQueryParams
+from app.services import IdempotencyService, ProductService
+
+logger = logging.getLogger("app.lifespan")
+
+# ID inexistente: as consultas de aquecimento percorrem o caminho completo,
+# mas não retornam linhas.
+NIL_ID = UUID(int=0)
+
+
+async def warm_up_connection(engine: AsyncEngine) -> None:
+    """Abre uma conexão do pool e executa nela as consultas mais frequentes.
+
+    Cada consulta é preparada no cache de statements da conexão (asyncpg) e
+    compilada no cache do SQLAlchemy, compartilhado por todas as conexões.
+    """
+    settings = get_settings()
+
+    async with (
+        engine.connect() as connection,
+        AsyncSession(bind=connection) as session,
+    ):
+        products = ProductRepository(session)
+        await products.find_by_id(NIL_ID)
+        await products.find_by_ids([NIL_ID])
+        await products.find_version(NIL_ID)
+
+        if "clients" in settings.ENABLED_ROUTERS:
+            # Importado aqui para não carregar os módulos de clientes
+            # quando o router deles está desabilitado.
+            from app.repositories import ClientRepository
+
+            await ClientRepository(session).find_by_id(NIL_ID)
+
+        if "carts" in settings.ENABLED_ROUTERS:
+            from app.repositories import CartRepository
+
+            await CartRepository(session).find_lines(NIL_ID)
+
+        service = ProductService(session, get_cache())
+        await service.get_products_marker(fresh=True)
+        await service.list_all_products(ProductQueryParams())
+
+
+async def warm_up() -> int:
+    """Cria os engines, pré-abre e aquece as conexões e inicia os workers de hash.
+
+    As conexões são abertas ao mesmo tempo, para que cada aquecimento use uma
+    conexão diferente; ao final, todas voltam para o pool. Retorna a
+    quantidade de conexões aquecidas.
+    """
+    settings = get_settings()
+    connections = settings.DB_POOL_WARMUP_CONNECTIONS
+
+    if connections is None:
+        connections = settings.DB_POOL_SIZE
+
+    # Conexões além do DB_POOL_SIZE seriam fechadas ao voltar para o pool.
+    connections = min(connections, settings.DB_POOL_SIZE)
+    engines = get_replica_router().engines
+    hash_workers = (
+        settings.PASSWORD_HASH_WORKERS if "clients" in settings.ENABLED_ROUTERS else 0
+    )
+
+    await asyncio.gather(
+        *(warm_up_connection(engine) for engine in engines for _ in range(connections)),
+        *(get_password_executor().run(os.getpid) for _ in range(hash_workers)),
+    )
+
+    return connections * len(engines)
+
+
+async def delete_expired_idempotency_keys() -> None:
+    """Remove periodicamente as chaves de idempotência expiradas.
+
+    Cada bloco é removido em uma transação curta. Roda até ser cancelada.
+    """
+    settings = get_settings()
+    batch_size = settings.IDEMPOTENCY_CLEANUP_BATCH_SIZE
+
+    while True:
+        await asyncio.sleep(settings.IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS)
+        deleted = 0
+        count = batch_size
+
+        try:
+            while count == batch_size:
+                async with session_scope(async_session_maker) as session:
+                    count = await IdempotencyService(session).delete_expired()
+
+                deleted += count
+        except Exception:
+            logger.exception(json.dumps({"event": "idempotency_cleanup_failed"}))
+        else:
+            if deleted:
+                logger.info(
+                    json.dumps(
+                        {"event": "idempotency_keys_deleted", "deleted": deleted}
+                    )
+                )
+
+
+async def shutdown() -> None:
+    """Encerra os streams de alterações, as conexões dos engines e o pool de hash."""
+    if get_change_broadcaster.cache_info().currsize:
+        get_change_broadcaster().close()
+
+    if get_replica_router.cache_info().currsize:
+        await get_replica_router().dispose()
+
+    if get_password_executor.cache_info().currsize:
+        get_password_executor().shutdown()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Aquece a aplicação antes de marcá-la como pronta e a encerra ao final.
+
+    O aquecimento é uma otimização: se falhar ou passar do tempo limite, o
+    erro é registrado e a aplicação fica pronta mesmo assim.
+    """
+    settings = get_settings()
+    app.state.ready = False
+    started = perf_counter()
+
+    try:
+        async with asyncio.timeout(settings.STARTUP_WARMUP_TIMEOUT):
+            connections = await warm_up()
+    except Exception:
+        logger.exception(json.dumps({"event": "warm_up_failed"}))
+    else:
+        logger.info(
+            json.dumps(
+                {
+                    "event": "warm_up_finished",
+                    "connections": connections,
+                    "duration_ms": round((perf_counter() - started) * 1_000, 3),
+                }
+            )
+        )
+
+    background_tasks = [asyncio.create_task(delete_expired_idempotency_keys())]
+
+    # Com a ponte do PostgreSQL, os eventos de todos os processos chegam por LISTEN.
+    if settings.CHANGES_NOTIFY:
+        background_tasks.append(
+            asyncio.create_task(listen_for_changes(get_change_broadcaster()))
+        )
+
+    app.state.ready = True
+
+    try:
+        yield
+    finally:
+        app.state.ready = False
+
+        for task in background_tasks:
+            task.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await task
+
+        await shutdown()
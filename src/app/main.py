@@ -1,19 +1,82 @@
+import logging
+
 from fastapi import FastAPI
 
-from app.exceptions import InvalidProductDataException, ProductNotFoundException
+from app.core import get_settings
+from app.exceptions import (
+    CartNotFoundException,
+    ClientAlreadyExistsException,
+    ClientNotFoundException,
+    EmptyCartException,
+    ExecutorSaturatedException,
+    IdempotencyKeyMismatchException,
+    InsufficientStockException,
+    InvalidCursorException,
+    InvalidProductDataException,
+    PreconditionFailedException,
+    ProductNotFoundException,
+)
 from app.handlers import (
+    cart_not_found_exception_handler,
+    client_already_exists_exception_handler,
+    client_not_found_exception_handler,
+    empty_cart_exception_handler,
+    executor_saturated_exception_handler,
+    idempotency_key_mismatch_exception_handler,
+    insufficient_stock_exception_handler,
+    invalid_cursor_exception_handler,
     invalid_product_data_exception_handler,
+    precondition_failed_exception_handler,
     product_not_found_exception_handler,
 )
+from app.lifespan import lifespan
+from app.middlewares import CompressionMiddleware, TimingMiddleware
 from app.routers import api_router
 
+settings = get_settings()
+
+logging.basicConfig(
+    level=settings.LOG_LEVEL, format="%(levelname)s %(name)s %(message)s"
+)
+
 app = FastAPI(
-    title="Products FastAPI", description="API para gerenciamento de produtos"
+    title="Products FastAPI",
+    description="API para gerenciamento de produtos",
+    lifespan=lifespan,
 )
 
 app.add_exception_handler(ProductNotFoundException, product_not_found_exception_handler)
 app.add_exception_handler(
     InvalidProductDataException, invalid_product_data_exception_handler
 )
+app.add_exception_handler(InvalidCursorException, invalid_cursor_exception_handler)
+app.add_exception_handler(
+    InsufficientStockException, insufficient_stock_exception_handler
+)
+app.add_exception_handler(
+    PreconditionFailedException, precondition_failed_exception_handler
+)
+app.add_exception_handler(ClientNotFoundException, client_not_found_exception_handler)
+app.add_exception_handler(
+    ClientAlreadyExistsException, client_already_exists_exception_handler
+)
+app.add_exception_handler(CartNotFoundException, cart_not_found_exception_handler)
+app.add_exception_handler(EmptyCartException, empty_cart_exception_handler)
+app.add_exception_handler(
+    ExecutorSaturatedException, executor_saturated_exception_handler
+)
+app.add_exception_handler(
+    IdempotencyKeyMismatchException, idempotency_key_mismatch_exception_handler
+)
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    encodings=settings.COMPRESSION_ENCODINGS,
+)
+# Adicionado por último para envolver os demais e medir também a compressão.
+app.add_middleware(
+    TimingMiddleware, query_count_threshold=settings.QUERY_COUNT_WARNING_THRESHOLD
+)
 
-app.include_router(api_router)
\ No newline at end of file
+app.include_router(api_router)
@@ -0,0 +1,4 @@
+from .compression_middleware import CompressionMiddleware
+from .timing_middleware import TimingMiddleware
+
+__all__ = ["CompressionMiddleware", "TimingMiddleware"]
@@ -0,0 +1,131 @@
+from collections.abc import Sequence
+from time import perf_counter
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.compression import COMPRESSORS, Compressor
+from app.core.etags import WEAK_PREFIX
+from app.core.metrics import record_compression
+from app.core.negotiation import choose_encoding
+
+# Eventos do SSE precisam chegar ao cliente assim que são gerados.
+EXCLUDED_MEDIA_TYPES = ("text/event-stream",)
+NOT_MODIFIED = 304
+
+
+class CompressionMiddleware:
+    """Comprime as respostas com a codificação negociada pelo Accept-Encoding.
+
+    Respostas menores que `minimum_size` seguem sem compressão. Respostas em
+    streaming são comprimidas bloco a bloco, e cada bloco é enviado assim que
+    comprimido. Quando há codificação negociada, a ETag passa a ser fraca
+    tanto no 200 quanto no 304, já que os bytes enviados dependem dela.
+    """
+
+    def __init__(
+        self, app: ASGIApp, minimum_size: int, encodings: Sequence[str]
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = tuple(encodings)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        compressor: Compressor | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, compressor
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if start_message is not None:
+                start, start_message = start_message, None
+                compressor = self._start(start, message, encoding)
+                await send(start)
+
+            if compressor is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            started = perf_counter()
+            body = compressor.compress(body) if more_body else compressor.finish(body)
+            record_compression(perf_counter() - started)
+
+            await send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_compressed)
+
+    def _start(
+        self, start: Message, first: Message, encoding: str
+    ) -> Compressor | None:
+        """Ajusta os cabeçalhos e decide se a resposta será comprimida.
+
+        Um corpo completo é comprimido aqui mesmo, para que o Content-Length
+        final vá no início da resposta. Para respostas em streaming, retorna o
+        compressor dos blocos seguintes.
+        """
+        headers = MutableHeaders(scope=start)
+
+        if "content-encoding" in headers:
+            return None
+
+        media_type = headers.get("content-type", "").partition(";")[0].strip()
+        if media_type in EXCLUDED_MEDIA_TYPES:
+            return None
+
+        headers.add_vary_header("Accept-Encoding")
+        # A ETag é enfraquecida antes de decidir a compressão, para que o 304
+        # repita o mesmo validador que o 200 enviaria, seja qual for o tamanho.
+        _weaken_etag(headers)
+
+        if start["status"] == NOT_MODIFIED:
+            return None
+
+        if first["type"] != "http.response.body":
+            return None
+
+        body = first.get("body", b"")
+        streaming = first.get("more_body", False)
+
+        if not streaming and len(body) < self.minimum_size:
+            return None
+
+        headers["Content-Encoding"] = encoding
+
+        if streaming:
+            del headers["Content-Length"]
+            return COMPRESSORS[encoding]()
+
+        compressor = COMPRESSORS[encoding]()
+        started = perf_counter()
+        first["body"] = compressor.finish(body)
+        record_compression(perf_counter() - started)
+        headers["Content-Length"] = str(len(first["body"]))
+
+        return None
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    etag = headers.get("etag")
+
+    if etag and not etag.startswith(WEAK_PREFIX):
+        headers["ETag"] = WEAK_PREFIX + etag
@@ -0,0 +1,141 @@
+import json
+import logging
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    RequestMetrics,
+    metrics_registry,
+    start_request_metrics,
+    stop_request_metrics,
+)
+
+logger = logging.getLogger("app.requests")
+
+UNMATCHED_ROUTE = "<unmatched>"
+STATEMENT_LOG_LENGTH = 500
+
+
+class TimingMiddleware:
+    """Mede o tempo de cada requisição, separando banco, serialização e handler.
+
+    Os tempos até o início da resposta vão no cabeçalho Server-Timing; ao fim
+    da requisição, uma linha de log em JSON e as métricas de /metrics são
+    registradas. Requisições com mais consultas SQL que `query_count_threshold`
+    são registradas como possível N+1.
+    """
+
+    def __init__(self, app: ASGIApp, query_count_threshold: int) -> None:
+        self.app = app
+        self.query_count_threshold = query_count_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics, token = start_request_metrics()
+        started = perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing", server_timing(metrics, perf_counter() - started)
+                )
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_request_metrics(token)
+            self._record(scope, status_code, perf_counter() - started, metrics)
+
+    def _record(
+        self, scope: Scope, status_code: int, duration: float, metrics: RequestMetrics
+    ) -> None:
+        route = route_template(scope)
+        exceeded_query_threshold = metrics.query_count > self.query_count_threshold
+        metrics_registry.observe_request(
+            scope["method"],
+            route,
+            status_code,
+            duration,
+            metrics,
+            exceeded_query_threshold,
+        )
+
+        record = {
+            "method": scope["method"],
+            "route": route,
+            "path": scope["path"],
+            "status": status_code,
+            "duration_ms": round(duration * 1_000, 3),
+            "handler_ms": round(metrics.handler_time(duration) * 1_000, 3),
+            "serialization_ms": round(metrics.serialization_time * 1_000, 3),
+            "compression_ms": round(metrics.compression_time * 1_000, 3),
+            "db_ms": round(metrics.db_time * 1_000, 3),
+            "db_queries": metrics.query_count,
+            "slowest_query_ms": round(metrics.slowest_query_time * 1_000, 3),
+            "slowest_statement": (metrics.slowest_statement or "")[
+                :STATEMENT_LOG_LENGTH
+            ],
+        }
+        logger.info(json.dumps(record, ensure_ascii=False))
+
+        if exceeded_query_threshold:
+            logger.warning(
+                json.dumps(
+                    {
+                        "event": "query_count_threshold_exceeded",
+                        "method": scope["method"],
+                        "route": route,
+                        "db_queries": metrics.query_count,
+                        "threshold": self.query_count_threshold,
+                        "slowest_statement": record["slowest_statement"],
+                    },
+                    ensure_ascii=False,
+                )
+            )
+
+
+def route_template(scope: Scope) -> str:
+    """Template completo da rota atendida, incluindo o prefixo do router.
+
+    Conforme a versão do FastAPI, `route.path` vem com ou sem o prefixo do
+    `include_router`. Como a rota casa com os últimos segmentos do caminho, o
+    que vem antes deles no caminho da requisição é o prefixo.
+    """
+    template = getattr(scope.get("route"), "path", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    if ":path}" in template:
+        return template
+
+    path = scope["path"].removeprefix(scope.get("root_path", ""))
+    prefix = path.rsplit("/", template.count("/"))[0]
+
+    return prefix + template
+
+
+def server_timing(metrics: RequestMetrics, elapsed: float) -> str:
+    """Monta o cabeçalho Server-Timing com os tempos em milissegundos."""
+    return ", ".join(
+        [
+            (
+                f"db;dur={metrics.db_time * 1_000:.3f};"
+                f'desc="{metrics.query_count} queries"'
+            ),
+            f"serialize;dur={metrics.serialization_time * 1_000:.3f}",
+            f"compress;dur={metrics.compression_time * 1_000:.3f}",
+            f"handler;dur={metrics.handler_time(elapsed) * 1_000:.3f}",
+            f"total;dur={elapsed * 1_000:.3f}",
+        ]
+    )
@@ -1,4 +1,6 @@
 from .base_model import Base
+from .change_marker_model import ChangeMarkerModel
+from .idempotency_key_model import IdempotencyKeyModel
 from .product_model import ProductModel
 
-__all__ = ["Base", "ProductModel"]
+__all__ = ["Base", "ChangeMarkerModel", "IdempotencyKeyModel", "ProductModel"]
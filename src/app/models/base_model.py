@@ -1,10 +1,18 @@
-from uuid import uuid4, UUID
+from uuid import UUID
 
+from sqlalchemy import Integer, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from app.core.ids import new_id
+
 
 class Base(DeclarativeBase):
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4, nullable=False
+        PG_UUID(as_uuid=True), primary_key=True, default=new_id, nullable=False
+    )
+    # Incrementada a cada UPDATE; usada no controle de concorrência otimista e
+    # como ETag das respostas.
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text("1")
     )
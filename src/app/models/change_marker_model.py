@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base_model import Base
+
+
+class ChangeMarkerModel(Base):
+    """Marcador de alterações de uma coleção, incrementado a cada escrita nela.
+
+    Permite responder requisições condicionais de listagens sem consultar a
+    coleção inteira.
+    """
+
+    __tablename__ = "tb_change_markers"
+
+    name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    version: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=1, server_default=text("1")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Integer, LargeBinary, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base_model import Base
+
+
+class IdempotencyKeyModel(Base):
+    """Chave de idempotência de uma escrita e a resposta que ela produziu.
+
+    A linha é inserida e preenchida na mesma transação da escrita: só existe
+    depois do COMMIT, sempre com a resposta, e desaparece se a escrita for
+    desfeita.
+    """
+
+    __tablename__ = "tb_idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    # SHA-256 do método, caminho, query string e corpo da requisição.
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[int | None] = mapped_column(Integer)
+    headers: Mapped[dict[str, str] | None] = mapped_column(JSON)
+    body: Mapped[bytes | None] = mapped_column(LargeBinary)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
@@ -1,12 +1,37 @@
-from sqlalchemy import Float, Integer, String
-from sqlalchemy.orm import mapped_column, Mapped
+from sqlalchemy import Float, Index, Integer, String, func, literal_column, text
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models import Base
 
 
 class ProductModel(Base):
     __tablename__ = "tb_products"
+    __table_args__ = (
+        Index("ix_tb_products_name_id", "name", "id"),
+        Index("ix_tb_products_price_id", "price", "id"),
+        Index("ix_tb_products_quantity_id", "quantity", "id"),
+        Index("ix_tb_products_name_c_id", text('(name COLLATE "C")'), "id"),
+        Index(
+            "ix_tb_products_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_tb_products_name_search_vector",
+            text("to_tsvector('simple'::regconfig, name)"),
+            postgresql_using="gin",
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(25), nullable=False)
     price: Mapped[float] = mapped_column(Float, nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+# Expressões usadas pela busca de produtos. Os índices de busca acima repetem as
+# mesmas expressões; qualquer diferença impede o PostgreSQL de usá-los.
+name_sort_key = ProductModel.name.collate("C")
+name_search_vector = func.to_tsvector(
+    literal_column("'simple'::regconfig"), ProductModel.name
+)
@@ -0,0 +1,59 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Integer, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base_model import Base
+from app.models.client_model import ClientModel
+from app.models.product_model import ProductModel
+
+
+class ShoppingCartModel(Base):
+    """Carrinho de compras de um cliente.
+
+    A versão é incrementada a cada alteração nos itens; o UPDATE que a
+    incrementa também bloqueia o carrinho até o fim da transação.
+    """
+
+    __tablename__ = "tb_shopping_carts"
+
+    client_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey(ClientModel.id, ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+class ShoppingCartItemModel(Base):
+    """Item de um carrinho: um produto e a quantidade desejada.
+
+    O preço não é guardado; os totais usam sempre o preço atual do produto.
+    """
+
+    __tablename__ = "tb_shopping_cart_items"
+    __table_args__ = (UniqueConstraint("cart_id", "product_id"),)
+
+    cart_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey(ShoppingCartModel.id, ondelete="CASCADE"),
+        nullable=False,
+    )
+    product_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey(ProductModel.id, ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -1,4 +1,32 @@
-from .product_repository import ProductRepository
-from .base_repository import BaseRepository
+from typing import TYPE_CHECKING
 
-__all__ = ["ProductRepository", "BaseRepository"]
+from app.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base_repository import BaseRepository
+    from .cart_repository import CartRepository
+    from .change_marker_repository import ChangeMarkerRepository
+    from .client_repository import ClientRepository
+    from .idempotency_key_repository import IdempotencyKeyRepository
+    from .product_repository import ProductRepository
+
+__all__ = [
+    "BaseRepository",
+    "CartRepository",
+    "ChangeMarkerRepository",
+    "ClientRepository",
+    "IdempotencyKeyRepository",
+    "ProductRepository",
+]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ProductRepository": "product_repository",
+        "BaseRepository": "base_repository",
+        "CartRepository": "cart_repository",
+        "ChangeMarkerRepository": "change_marker_repository",
+        "ClientRepository": "client_repository",
+        "IdempotencyKeyRepository": "idempotency_key_repository",
+    },
+)
@@ -1,20 +1,45 @@
-from typing import TypeVar, Generic, Type
+from collections.abc import AsyncIterator, Collection, Iterable, Sequence
+from itertools import batched
+from typing import Generic, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import select, update, delete
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ColumnElement,
+    MetaData,
+    Row,
+    Table,
+    any_,
+    column,
+    delete,
+    insert,
+    literal,
+    literal_column,
+    select,
+    text,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
 
 from app.models.base_model import Base
+from app.repositories.cursor import decode_cursor, encode_cursor
+from app.schemas.pagination_schema import SortOrder
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Repository genérico com operações CRUD básicas."""
 
-    def __init__(self, model: Type[ModelType], db_session: AsyncSession) -> None:
+    def __init__(self, model: type[ModelType], db_session: AsyncSession) -> None:
         self.model = model
         self.db_session = db_session
 
@@ -22,23 +47,139 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """Cria e persiste uma nova entidade no banco de dados."""
         new_entity = self.model(**schema.model_dump())
         self.db_session.add(new_entity)
+        await self.db_session.flush()
 
         return new_entity
 
+    async def save_many(
+        self, schemas: Sequence[CreateSchemaType], chunk_size: int
+    ) -> list[ModelType]:
+        """Cria várias entidades com INSERT multi-linha ... RETURNING, em blocos.
+
+        As entidades retornadas seguem a ordem dos schemas recebidos.
+        """
+        entities: list[ModelType] = []
+
+        for chunk in batched(schemas, chunk_size):
+            result = await self.db_session.scalars(
+                insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                [schema.model_dump() for schema in chunk],
+            )
+            entities.extend(result.all())
+
+        return entities
+
     async def find_by_id(self, entity_id: UUID) -> ModelType | None:
         """Busca uma entidade pelo seu ID."""
-        result = await self.db_session.execute(select(self.model).where(self.model.id == entity_id))
+        result = await self.db_session.execute(
+            select(self.model).where(self.model.id == entity_id)
+        )
 
         return result.scalar_one_or_none()
 
-    async def find_all(self) -> list[ModelType]:
-        """Lista todas as entidades."""
-        result = await self.db_session.execute(select(self.model))
+    async def find_by_ids(self, entity_ids: Collection[UUID]) -> dict[UUID, ModelType]:
+        """Busca várias entidades com um único SELECT ... WHERE id = ANY(...).
+
+        Retorna as entidades encontradas por ID; IDs ausentes no resultado não
+        existem no banco de dados.
+        """
+        id_column = self._get_column("id")
+        result = await self.db_session.scalars(
+            select(self.model).where(
+                id_column == any_(literal(list(entity_ids), ARRAY(id_column.type)))
+            )
+        )
 
-        return list(result.scalars().all())
+        return {entity.id: entity for entity in result.all()}
+
+    async def find_all(
+        self,
+        *filters: ColumnElement[bool],
+        limit: int | None = None,
+        cursor: str | None = None,
+        sort_by: str = "id",
+        order: SortOrder = SortOrder.ASC,
+    ) -> tuple[list[ModelType], str | None]:
+        """Lista entidades com paginação keyset sobre (sort_by, id).
+
+        Retorna os itens da página e o cursor da próxima página, ou None
+        quando não há mais itens. Sem `limit`, todas as entidades são listadas.
+        """
+        sort_column = self._get_column(sort_by)
+        id_column = self._get_column("id")
+        descending = order is SortOrder.DESC
+
+        statement = select(self.model).where(*filters)
+
+        if cursor is not None:
+            sort_value, last_id = decode_cursor(
+                cursor, sort_by, order, sort_column.type.python_type
+            )
+
+            if sort_column is id_column:
+                key, boundary = id_column, last_id
+            else:
+                key, boundary = tuple_(sort_column, id_column), (sort_value, last_id)
+
+            statement = statement.where(
+                key < boundary if descending else key > boundary
+            )
+
+        order_by = [id_column] if sort_column is id_column else [sort_column, id_column]
+        statement = statement.order_by(
+            *(column.desc() if descending else column.asc() for column in order_by)
+        )
 
-    async def update(self, entity_id: UUID, schema: UpdateSchemaType) -> ModelType | None:
-        """Atualiza uma entidade existente."""
+        if limit is not None:
+            statement = statement.limit(limit + 1)
+
+        result = await self.db_session.execute(statement)
+        entities = list(result.scalars().all())
+
+        if limit is None or len(entities) <= limit:
+            return entities, None
+
+        del entities[limit:]
+        last_entity = entities[-1]
+        next_cursor = encode_cursor(
+            sort_by, order, getattr(last_entity, sort_by), last_entity.id
+        )
+
+        return entities, next_cursor
+
+    async def stream_all(
+        self,
+        *filters: ColumnElement[bool],
+        columns: Sequence[str],
+        chunk_size: int,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """Percorre as entidades com um cursor no servidor, em blocos de linhas.
+
+        Apenas as colunas informadas são lidas, sem instanciar objetos do ORM,
+        e cada bloco contém no máximo `chunk_size` linhas.
+        """
+        statement = (
+            select(*(self._get_column(name) for name in columns))
+            .where(*filters)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.db_session.stream(statement)
+
+        async for partition in result.partitions():
+            yield partition
+
+    async def update(
+        self,
+        entity_id: UUID,
+        schema: UpdateSchemaType,
+        expected_versions: Collection[int] | None = None,
+    ) -> ModelType | None:
+        """Atualiza uma entidade existente e incrementa a sua versão.
+
+        Com `expected_versions`, a versão é conferida na própria cláusula WHERE,
+        sem bloquear a linha antes: se outra escrita chegou primeiro, nada é
+        atualizado e o retorno é None.
+        """
         update_data = schema.model_dump(exclude_unset=True)
 
         if not update_data:
@@ -46,19 +187,194 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         result = await self.db_session.execute(
             update(self.model)
-            .where(self.model.id == entity_id)
-            .values(**update_data)
+            .where(
+                self.model.id == entity_id,
+                *self._version_filter(expected_versions),
+            )
+            .values(**update_data, version=self.model.version + 1)
             .returning(self.model)
         )
 
         return result.scalar_one_or_none()
 
-    async def delete(self, entity_id: UUID) -> bool:
-        """Deleta uma entidade."""
+    async def update_many(
+        self, items: Sequence[tuple[UUID, UpdateSchemaType]], chunk_size: int
+    ) -> dict[UUID, ModelType]:
+        """Atualiza várias entidades com UPDATE ... FROM (VALUES ...) RETURNING.
+
+        Os itens são agrupados pelo conjunto de campos enviados, de modo que cada
+        bloco vira um único comando. Retorna as entidades atualizadas por ID;
+        IDs ausentes no resultado não existem no banco de dados.
+        """
+        groups: dict[tuple[str, ...], list[tuple]] = {}
+
+        for entity_id, schema in items:
+            update_data = schema.model_dump(exclude_unset=True, exclude={"id"})
+
+            if update_data:
+                groups.setdefault(tuple(update_data), []).append(
+                    (entity_id, *update_data.values())
+                )
+
+        updated: dict[UUID, ModelType] = {}
+
+        for fields, rows in groups.items():
+            for chunk in batched(rows, chunk_size):
+                for entity in await self._update_rows(fields, chunk):
+                    updated[entity.id] = entity
+
+        return updated
+
+    async def delete_many(
+        self, entity_ids: Iterable[UUID], chunk_size: int
+    ) -> set[UUID]:
+        """Deleta várias entidades com DELETE ... WHERE id = ANY(...), em blocos.
+
+        Retorna os IDs efetivamente removidos.
+        """
+        id_column = self._get_column("id")
+        id_array = ARRAY(id_column.type)
+        deleted: set[UUID] = set()
+
+        for chunk in batched(entity_ids, chunk_size):
+            result = await self.db_session.execute(
+                delete(self.model)
+                .where(id_column == any_(literal(list(chunk), id_array)))
+                .returning(id_column)
+            )
+            deleted.update(result.scalars().all())
+
+        return deleted
+
+    async def create_staging_table(self, columns: Sequence[str]) -> Table:
+        """Cria uma tabela temporária com as colunas informadas do modelo.
+
+        A tabela é descartada no fim da transação (ON COMMIT DROP), por isso
+        deve ser criada fora dos SAVEPOINTs que a usam.
+        """
+        staging = Table(
+            f"tmp_{self.model.__tablename__}_staging",
+            MetaData(),
+            *(Column(name, self._get_column(name).type) for name in columns),
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DROP",
+        )
+        connection = await self.db_session.connection()
+        await connection.run_sync(staging.create)
+
+        return staging
+
+    async def copy_upsert(
+        self, staging: Table, rows: Sequence[tuple]
+    ) -> tuple[int, list[UUID]]:
+        """Grava as linhas com COPY na tabela temporária e as mescla com upsert.
+
+        Um único INSERT ... SELECT ... ON CONFLICT (id) DO UPDATE cria as
+        entidades novas e atualiza as existentes, incrementando a versão.
+        A tabela deve ter a coluna `id`, e os IDs das linhas devem ser únicos.
+        Ao final, a tabela temporária é esvaziada. Retorna a quantidade de
+        inserções e os IDs atualizados.
+        """
+        names = list(staging.columns.keys())
+        connection = await self.db_session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            staging.name, records=rows, columns=names
+        )
+
+        statement = pg_insert(self.model).from_select(names, select(staging))
+        result = await self.db_session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[self._get_column("id")],
+                set_={
+                    **{
+                        name: statement.excluded[name] for name in names if name != "id"
+                    },
+                    "version": self.model.version + 1,
+                },
+            ).returning(
+                self._get_column("id"),
+                # xmax é zero nas linhas recém-inseridas.
+                literal_column("xmax = 0", Boolean),
+            )
+        )
+        inserted = 0
+        updated: list[UUID] = []
+
+        for entity_id, was_inserted in result.all():
+            if was_inserted:
+                inserted += 1
+            else:
+                updated.append(entity_id)
+
+        await self.db_session.execute(text(f"TRUNCATE {staging.name}"))
+
+        return inserted, updated
+
+    def savepoint(self) -> AsyncSessionTransaction:
+        """Abre um SAVEPOINT na transação corrente."""
+        return self.db_session.begin_nested()
+
+    async def delete(
+        self, entity_id: UUID, expected_versions: Collection[int] | None = None
+    ) -> bool:
+        """Deleta uma entidade, conferindo a versão quando informada."""
         result = await self.db_session.execute(
             delete(self.model)
-            .where(self.model.id == entity_id)
+            .where(
+                self.model.id == entity_id,
+                *self._version_filter(expected_versions),
+            )
             .returning(self.model)
         )
 
         return bool(result.scalar_one_or_none())
+
+    async def find_version(self, entity_id: UUID) -> int | None:
+        """Retorna a versão atual de uma entidade, ou None se ela não existir."""
+        return await self.db_session.scalar(
+            select(self.model.version).where(self.model.id == entity_id)
+        )
+
+    def _version_filter(
+        self, expected_versions: Collection[int] | None
+    ) -> list[ColumnElement[bool]]:
+        """Condição sobre a versão usada pelas escritas condicionais."""
+        if expected_versions is None:
+            return []
+
+        return [self.model.version.in_(expected_versions)]
+
+    def _get_column(self, name: str) -> Column:
+        """Retorna a coluna da tabela do modelo pelo nome."""
+        column = self.model.__table__.columns.get(name)
+
+        if column is None:
+            raise ValueError(f"{self.model.__name__} não possui a coluna {name!r}.")
+
+        return column
+
+    async def _update_rows(
+        self, fields: tuple[str, ...], rows: Sequence[tuple]
+    ) -> Sequence[ModelType]:
+        """Executa um UPDATE ... FROM (VALUES ...) para um bloco de linhas."""
+        names = ("id", *fields)
+        data = values(
+            *(column(name, self._get_column(name).type) for name in names),
+            name="data",
+        ).data(list(rows))
+
+        result = await self.db_session.scalars(
+            update(self.model)
+            .where(self.model.id == data.c.id)
+            .values(
+                {
+                    **{name: data.c[name] for name in fields},
+                    "version": self.model.version + 1,
+                }
+            )
+            .returning(self.model)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+
+        return result.all()
@@ -0,0 +1,131 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import Row, delete, func, literal, select, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.ids import new_id
+from app.models import ProductModel
+from app.models.shopping_cart_model import ShoppingCartItemModel, ShoppingCartModel
+from app.repositories.base_repository import BaseRepository
+from app.schemas.cart_schema import CartRequest
+
+Cart = ShoppingCartModel
+Item = ShoppingCartItemModel
+
+
+class CartRepository(BaseRepository[ShoppingCartModel, CartRequest, CartRequest]):
+    """Repository dos carrinhos de compras e dos seus itens."""
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        super().__init__(ShoppingCartModel, db_session)
+
+    async def find_lines(self, cart_id: UUID) -> Sequence[Row]:
+        """Lê o carrinho, os itens e os totais em uma única consulta.
+
+        Cada linha traz um item com o preço e o estoque atuais do produto, e as
+        funções de janela repetem em todas elas os totais do carrinho. Um
+        carrinho vazio retorna uma linha com os campos do item nulos; um
+        carrinho inexistente, nenhuma linha.
+        """
+        line_total = ProductModel.price * Item.quantity
+        in_stock = ProductModel.quantity >= Item.quantity
+        statement = (
+            select(
+                Cart.id,
+                Cart.client_id,
+                Cart.version,
+                Cart.updated_at,
+                Item.product_id,
+                ProductModel.name,
+                ProductModel.price.label("unit_price"),
+                Item.quantity,
+                line_total.label("line_total"),
+                ProductModel.quantity.label("available_quantity"),
+                in_stock.label("in_stock"),
+                func.coalesce(func.sum(Item.quantity).over(), 0).label("item_count"),
+                func.coalesce(func.sum(line_total).over(), 0.0).label("subtotal"),
+                func.coalesce(func.bool_and(in_stock).over(), true()).label(
+                    "available"
+                ),
+            )
+            .outerjoin(Item, Item.cart_id == Cart.id)
+            .outerjoin(ProductModel, ProductModel.id == Item.product_id)
+            .where(Cart.id == cart_id)
+            # Os IDs dos itens são gerados em ordem (UUIDv7): é a ordem de inclusão.
+            .order_by(Item.id)
+        )
+        result = await self.db_session.execute(statement)
+
+        return result.all()
+
+    async def touch(self, cart_id: UUID) -> bool:
+        """Incrementa a versão do carrinho antes de alterar os seus itens.
+
+        O UPDATE bloqueia o carrinho até o fim da transação, serializando as
+        alterações e o fechamento. Retorna False se o carrinho não existe.
+        """
+        result = await self.db_session.execute(
+            update(Cart)
+            .where(Cart.id == cart_id)
+            .values(version=Cart.version + 1, updated_at=func.now())
+            .returning(Cart.id)
+        )
+
+        return result.scalar_one_or_none() is not None
+
+    async def save_item(self, cart_id: UUID, product_id: UUID, quantity: int) -> bool:
+        """Inclui um produto no carrinho ou substitui a quantidade dele.
+
+        O INSERT ... SELECT só grava se o produto existir, sem depender de
+        uma violação de chave estrangeira. Retorna False se o produto não
+        existe.
+        """
+        statement = pg_insert(Item).from_select(
+            ["id", "cart_id", "product_id", "quantity"],
+            select(
+                literal(new_id(), Item.id.type),
+                literal(cart_id, Item.cart_id.type),
+                ProductModel.id,
+                literal(quantity, Item.quantity.type),
+            ).where(ProductModel.id == product_id),
+        )
+        result = await self.db_session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[Item.cart_id, Item.product_id],
+                set_={
+                    "quantity": statement.excluded.quantity,
+                    "version": Item.version + 1,
+                },
+            ).returning(Item.id)
+        )
+
+        return result.scalar_one_or_none() is not None
+
+    async def delete_item(self, cart_id: UUID, product_id: UUID) -> bool:
+        """Remove um produto do carrinho. Retorna False se ele não estava lá."""
+        result = await self.db_session.execute(
+            delete(Item)
+            .where(Item.cart_id == cart_id, Item.product_id == product_id)
+            .returning(Item.id)
+        )
+
+        return result.scalar_one_or_none() is not None
+
+    async def take_items(self, cart_id: UUID) -> list[tuple[UUID, int]]:
+        """Esvazia o carrinho e retorna os produtos e as quantidades retirados.
+
+        Os itens voltam na ordem de inclusão. Se a transação for desfeita, o
+        carrinho volta a ter os itens.
+        """
+        result = await self.db_session.execute(
+            delete(Item)
+            .where(Item.cart_id == cart_id)
+            .returning(Item.id, Item.product_id, Item.quantity)
+        )
+
+        return [
+            (product_id, quantity)
+            for _, product_id, quantity in sorted(result.tuples().all())
+        ]
@@ -0,0 +1,62 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Row, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ChangeMarkerModel
+
+
+class ChangeMarkerRepository:
+    """Repository dos marcadores de alteração das coleções."""
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        self.db_session = db_session
+
+    async def touch(self, name: str) -> Row[tuple[int, datetime]]:
+        """Incrementa o marcador da coleção, criando-o na primeira escrita.
+
+        O UPDATE bloqueia a linha do marcador até o fim da transação, então
+        deve rodar sozinho, em autocommit, depois do COMMIT das escritas, e não
+        dentro delas.
+        """
+        now = func.clock_timestamp()
+        statement = insert(ChangeMarkerModel).values(name=name, updated_at=now)
+        result = await self.db_session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ChangeMarkerModel.name],
+                set_={
+                    "version": ChangeMarkerModel.version + 1,
+                    # Nunca volta no tempo, mesmo que o relógio volte.
+                    "updated_at": func.greatest(ChangeMarkerModel.updated_at, now),
+                },
+            ).returning(ChangeMarkerModel.version, ChangeMarkerModel.updated_at)
+        )
+
+        return result.one()
+
+    async def find(self, name: str) -> Row[tuple[int, datetime]] | None:
+        """Retorna a versão e o horário da última alteração da coleção."""
+        result = await self.db_session.execute(
+            select(ChangeMarkerModel.version, ChangeMarkerModel.updated_at).where(
+                ChangeMarkerModel.name == name
+            )
+        )
+
+        return result.one_or_none()
+
+    async def notify(self, channel: str, payloads: Sequence[str]) -> None:
+        """Envia as notificações com NOTIFY na transação corrente.
+
+        O PostgreSQL só as entrega aos processos em LISTEN após o COMMIT, na
+        ordem dos COMMITs, e as descarta se a transação for desfeita.
+        """
+        if payloads:
+            await self.db_session.execute(
+                text(
+                    "SELECT pg_notify(:channel, payload) "
+                    "FROM unnest(CAST(:payloads AS text[])) AS payload"
+                ),
+                {"channel": channel, "payloads": list(payloads)},
+            )
@@ -0,0 +1,52 @@
+"""Codificação de cursores opacos para a paginação keyset."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from app.exceptions import InvalidCursorException
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    return value
+
+
+def _from_json(value: Any, python_type: type) -> Any:
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+
+    return python_type(value)
+
+
+def encode_cursor(sort_by: str, order: str, sort_value: Any, entity_id: UUID) -> str:
+    """Gera o cursor opaco que aponta para depois de (sort_value, entity_id)."""
+    payload = [sort_by, order, _to_json(sort_value), str(entity_id)]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(
+    cursor: str, sort_by: str, order: str, python_type: type
+) -> tuple[Any, UUID]:
+    """Decodifica um cursor e valida se ele pertence à ordenação solicitada."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort_by, cursor_order, sort_value, entity_id = json.loads(raw)
+        sort_value = _from_json(sort_value, python_type)
+        entity_id = UUID(entity_id)
+    except (binascii.Error, ValueError, TypeError) as exception:
+        raise InvalidCursorException("Cursor de paginação inválido.") from exception
+
+    if (cursor_sort_by, cursor_order) != (sort_by, order):
+        raise InvalidCursorException("O cursor não corresponde à ordenação solicitada.")
+
+    return sort_value, entity_id
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+from sqlalchemy import Row, delete, func, null, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import IdempotencyKeyModel
+
+Key = IdempotencyKeyModel
+
+
+class IdempotencyKeyRepository:
+    """Repository das chaves de idempotência das escritas."""
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        self.db_session = db_session
+
+    async def find(self, key: str) -> Row | None:
+        """Retorna a impressão digital e a resposta de uma chave ainda válida."""
+        result = await self.db_session.execute(
+            select(Key.fingerprint, Key.status_code, Key.headers, Key.body).where(
+                Key.key == key, Key.expires_at > func.now()
+            )
+        )
+
+        return result.one_or_none()
+
+    async def claim(self, key: str, fingerprint: str, ttl: timedelta) -> bool:
+        """Reserva a chave para a transação corrente; False se já foi usada.
+
+        Se outra transação reservou a mesma chave e ainda não terminou, o
+        INSERT espera por ela no índice único: requisições repetidas em
+        paralelo executam uma de cada vez. Chaves expiradas são reutilizadas.
+        """
+        statement = insert(Key).values(
+            key=key, fingerprint=fingerprint, expires_at=func.now() + ttl
+        )
+        result = await self.db_session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[Key.key],
+                set_={
+                    "fingerprint": statement.excluded.fingerprint,
+                    "status_code": null(),
+                    "headers": null(),
+                    "body": null(),
+                    "created_at": func.now(),
+                    "expires_at": statement.excluded.expires_at,
+                    "version": Key.version + 1,
+                },
+                where=Key.expires_at <= func.now(),
+            ).returning(Key.id)
+        )
+
+        return result.scalar_one_or_none() is not None
+
+    async def complete(
+        self, key: str, status_code: int, headers: dict[str, str], body: bytes
+    ) -> None:
+        """Grava a resposta produzida pela escrita que reservou a chave."""
+        await self.db_session.execute(
+            update(Key)
+            .where(Key.key == key)
+            .values(
+                status_code=status_code,
+                headers=headers,
+                body=body,
+                version=Key.version + 1,
+            )
+        )
+
+    async def delete_expired(self, limit: int) -> int:
+        """Remove até `limit` chaves expiradas e retorna quantas removeu.
+
+        Linhas bloqueadas por outra limpeza são puladas, então vários
+        processos podem limpar ao mesmo tempo sem esperar uns pelos outros.
+        """
+        expired = (
+            select(Key.id)
+            .where(Key.expires_at <= func.now())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db_session.execute(
+            delete(Key).where(Key.id.in_(expired.scalar_subquery()))
+        )
+
+        return result.rowcount
@@ -1,9 +1,57 @@
-from sqlalchemy import select
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    column,
+    func,
+    literal_column,
+    select,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import ProductModel
-from app.repositories import BaseRepository
-from app.schemas import ProductRequest, ProductUpdate
+from app.models.product_model import name_search_vector, name_sort_key
+from app.repositories.base_repository import BaseRepository
+from app.repositories.cursor import decode_cursor, encode_cursor
+from app.schemas import (
+    ProductFilter,
+    ProductRequest,
+    ProductSearchMode,
+    ProductUpdate,
+    SortOrder,
+)
+from app.schemas.product_schema import MAX_QUANTITY
+
+LIKE_ESCAPE = "/"
+
+
+def _escape_like(term: str) -> str:
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+
+
+def _prefix_condition(prefix: str) -> ColumnElement[bool]:
+    """Converte o prefixo em um intervalo sobre o nome na colação C.
+
+    Na colação C, os nomes que começam com o prefixo formam exatamente o
+    intervalo [prefixo, prefixo com o último caractere incrementado). Ao
+    contrário de LIKE 'prefixo%', o intervalo usa o índice mesmo em planos
+    genéricos de prepared statements.
+    """
+    last_character = ord(prefix[-1])
+
+    if last_character == 0x10FFFF:
+        return name_sort_key.startswith(prefix, autoescape=True)
+
+    upper_bound = prefix[:-1] + chr(last_character + 1)
+    return (name_sort_key >= prefix) & (name_sort_key < upper_bound)
 
 
 class ProductRepository(BaseRepository[ProductModel, ProductRequest, ProductUpdate]):
@@ -14,6 +62,165 @@ class ProductRepository(BaseRepository[ProductModel, ProductRequest, ProductUpda
 
     async def find_by_name(self, name: str) -> ProductModel | None:
         """Busca um produto pelo nome."""
-        result = await self.db_session.execute(select(ProductModel).where(ProductModel.name == name))
+        result = await self.db_session.execute(
+            select(ProductModel).where(ProductModel.name == name)
+        )
 
         return result.scalar_one_or_none()
+
+    async def search(
+        self,
+        term: str,
+        mode: ProductSearchMode,
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list[ProductModel], str | None]:
+        """Busca produtos pelo nome com paginação keyset.
+
+        `prefix` e `contains` ordenam pelo nome na colação C; `fulltext`
+        ordena pela relevância (ts_rank), da maior para a menor.
+        """
+        if mode is ProductSearchMode.FULLTEXT:
+            query = func.websearch_to_tsquery(
+                literal_column("'simple'::regconfig"), term
+            )
+            condition = name_search_vector.bool_op("@@")(query)
+            sort_key = func.ts_rank(name_search_vector, query)
+            order, sort_type = SortOrder.DESC, float
+        else:
+            condition = (
+                _prefix_condition(term)
+                if mode is ProductSearchMode.PREFIX
+                else ProductModel.name.ilike(
+                    f"%{_escape_like(term)}%", escape=LIKE_ESCAPE
+                )
+            )
+            sort_key = name_sort_key
+            order, sort_type = SortOrder.ASC, str
+
+        sort_by = f"search:{mode}"
+        key = tuple_(sort_key, ProductModel.id)
+        statement = select(ProductModel, sort_key).where(condition)
+
+        if cursor is not None:
+            boundary = decode_cursor(cursor, sort_by, order, sort_type)
+            statement = statement.where(
+                key < boundary if order is SortOrder.DESC else key > boundary
+            )
+
+        if order is SortOrder.DESC:
+            statement = statement.order_by(sort_key.desc(), ProductModel.id.desc())
+        else:
+            statement = statement.order_by(sort_key.asc(), ProductModel.id.asc())
+
+        rows = (await self.db_session.execute(statement.limit(limit + 1))).all()
+        products = [product for product, _ in rows[:limit]]
+
+        if len(rows) <= limit:
+            return products, None
+
+        last_product, last_sort_value = rows[limit - 1]
+        next_cursor = encode_cursor(sort_by, order, last_sort_value, last_product.id)
+
+        return products, next_cursor
+
+    async def reserve_stock(
+        self, items: Sequence[tuple[UUID, int]]
+    ) -> dict[UUID, ProductModel]:
+        """Decrementa o estoque dos produtos que têm a quantidade pedida.
+
+        Tudo acontece em um único UPDATE condicional (`quantity >= pedido`),
+        sem ler e regravar a quantidade, então reservas concorrentes nunca
+        vendem além do estoque. Produtos ausentes do resultado não existem ou
+        não têm estoque; nesse caso, cabe ao chamador desfazer a transação.
+        """
+        return await self._adjust_stock(items, reserve=True)
+
+    async def release_stock(
+        self, items: Sequence[tuple[UUID, int]]
+    ) -> dict[UUID, ProductModel]:
+        """Devolve ao estoque as quantidades informadas, em um único UPDATE.
+
+        Produtos cuja quantidade passaria de MAX_QUANTITY ficam de fora do
+        resultado, assim como os inexistentes.
+        """
+        return await self._adjust_stock(items, reserve=False)
+
+    async def find_quantities(self, product_ids: Sequence[UUID]) -> dict[UUID, int]:
+        """Retorna a quantidade em estoque de cada produto existente."""
+        result = await self.db_session.execute(
+            select(ProductModel.id, ProductModel.quantity).where(
+                ProductModel.id.in_(product_ids)
+            )
+        )
+
+        return dict(result.tuples().all())
+
+    async def _adjust_stock(
+        self, items: Sequence[tuple[UUID, int]], reserve: bool
+    ) -> dict[UUID, ProductModel]:
+        if len(items) == 1:
+            ((product_id, quantity),) = items
+            statement = update(ProductModel).where(ProductModel.id == product_id)
+        else:
+            requested = values(
+                column("id", ProductModel.id.type),
+                column("quantity", ProductModel.quantity.type),
+                name="requested",
+            ).data(list(items))
+            # Bloqueia as linhas em ordem de ID antes do UPDATE, para que lotes
+            # concorrentes com produtos em comum não entrem em deadlock.
+            locked = (
+                select(ProductModel.id)
+                .where(ProductModel.id.in_([product_id for product_id, _ in items]))
+                .order_by(ProductModel.id)
+                .with_for_update()
+                .cte("locked")
+            )
+            statement = update(ProductModel).where(
+                ProductModel.id == requested.c.id, ProductModel.id == locked.c.id
+            )
+            quantity = requested.c.quantity
+
+        if reserve:
+            statement = statement.where(ProductModel.quantity >= quantity).values(
+                quantity=ProductModel.quantity - quantity,
+                version=ProductModel.version + 1,
+            )
+        else:
+            statement = statement.where(
+                ProductModel.quantity <= MAX_QUANTITY - quantity
+            ).values(
+                quantity=ProductModel.quantity + quantity,
+                version=ProductModel.version + 1,
+            )
+
+        result = await self.db_session.scalars(
+            statement.returning(ProductModel).execution_options(
+                synchronize_session=False, populate_existing=True
+            )
+        )
+
+        return {product.id: product for product in result.all()}
+
+    @staticmethod
+    def build_filters(product_filter: ProductFilter) -> list[ColumnElement[bool]]:
+        """Converte os filtros da listagem em condições SQL."""
+        filters: list[ColumnElement[bool]] = []
+
+        if product_filter.name_prefix is not None:
+            filters.append(
+                ProductModel.name.startswith(
+                    product_filter.name_prefix, autoescape=True
+                )
+            )
+        if product_filter.min_price is not None:
+            filters.append(ProductModel.price >= product_filter.min_price)
+        if product_filter.max_price is not None:
+            filters.append(ProductModel.price <= product_filter.max_price)
+        if product_filter.min_quantity is not None:
+            filters.append(ProductModel.quantity >= product_filter.min_quantity)
+        if product_filter.max_quantity is not None:
+            filters.append(ProductModel.quantity <= product_filter.max_quantity)
+
+        return filters
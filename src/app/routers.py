@@ -1,7 +1,29 @@
+from importlib import import_module
+
 from fastapi import APIRouter
 
-from app.controllers import router as products
+from app.controllers import health_router, product_router
+from app.core import get_settings
+
+# Módulo do controller e opções de cada router opcional; o módulo só é
+# importado quando o router está em ENABLED_ROUTERS.
+OPTIONAL_ROUTERS: dict[str, tuple[str, dict]] = {
+    "carts": (
+        "app.controllers.cart_controller",
+        {"prefix": "/carts", "tags": ["carts"]},
+    ),
+    "clients": (
+        "app.controllers.client_controller",
+        {"prefix": "/clients", "tags": ["clients"]},
+    ),
+    "metrics": ("app.controllers.metrics_controller", {"tags": ["metrics"]}),
+}
 
 api_router = APIRouter()
 
-api_router.include_router(router=products, prefix="/products", tags=["products"])
+api_router.include_router(router=product_router, prefix="/products", tags=["products"])
+api_router.include_router(router=health_router, prefix="/health", tags=["health"])
+
+for name in get_settings().ENABLED_ROUTERS:
+    module_name, options = OPTIONAL_ROUTERS[name]
+    api_router.include_router(router=import_module(module_name).router, **options)
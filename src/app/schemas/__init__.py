@@ -1,3 +1,150 @@
-from .product_schema import ProductRequest, ProductResponse, ProductUpdate
+from typing import TYPE_CHECKING
 
-__all__ = ["ProductRequest", "ProductResponse", "ProductUpdate"]
\ No newline at end of file
+from app.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bulk_schema import BulkChunkResult, BulkItemStatus, BulkMode
+    from .cart_schema import (
+        CartCheckoutResponse,
+        CartItemRequest,
+        CartLine,
+        CartRequest,
+        CartResponse,
+    )
+    from .client_schema import ClientRequest, ClientResponse, ClientUpdate
+    from .health_schema import (
+        CacheStatsResponse,
+        DatabaseHealthResponse,
+        PoolStatsResponse,
+        ReadinessResponse,
+    )
+    from .pagination_schema import (
+        CursorParams,
+        Page,
+        PaginationParams,
+        RawPage,
+        SortOrder,
+    )
+    from .product_schema import (
+        ExportFormat,
+        ProductBatchGet,
+        ProductBatchGetItem,
+        ProductBatchGetResponse,
+        ProductBulkCreate,
+        ProductBulkDelete,
+        ProductBulkItemResult,
+        ProductBulkResponse,
+        ProductBulkUpdate,
+        ProductBulkUpdateItem,
+        ProductFilter,
+        ProductImportReject,
+        ProductImportResponse,
+        ProductImportRow,
+        ProductQueryParams,
+        ProductRequest,
+        ProductResponse,
+        ProductSearchMode,
+        ProductSearchParams,
+        ProductSortField,
+        ProductUpdate,
+        StockRequest,
+        StockReservation,
+        StockReservationItem,
+    )
+
+__all__ = [
+    "BulkChunkResult",
+    "BulkItemStatus",
+    "BulkMode",
+    "CacheStatsResponse",
+    "CartCheckoutResponse",
+    "CartItemRequest",
+    "CartLine",
+    "CartRequest",
+    "CartResponse",
+    "ClientRequest",
+    "ClientResponse",
+    "ClientUpdate",
+    "CursorParams",
+    "DatabaseHealthResponse",
+    "ExportFormat",
+    "Page",
+    "PaginationParams",
+    "PoolStatsResponse",
+    "ProductBatchGet",
+    "ProductBatchGetItem",
+    "ProductBatchGetResponse",
+    "ProductBulkCreate",
+    "ProductBulkDelete",
+    "ProductBulkItemResult",
+    "ProductBulkResponse",
+    "ProductBulkUpdate",
+    "ProductBulkUpdateItem",
+    "ProductFilter",
+    "ProductImportReject",
+    "ProductImportResponse",
+    "ProductImportRow",
+    "ProductQueryParams",
+    "ProductRequest",
+    "ProductResponse",
+    "ProductSearchMode",
+    "ProductSearchParams",
+    "ProductSortField",
+    "ProductUpdate",
+    "RawPage",
+    "ReadinessResponse",
+    "SortOrder",
+    "StockRequest",
+    "StockReservation",
+    "StockReservationItem",
+]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "BulkChunkResult": "bulk_schema",
+        "BulkItemStatus": "bulk_schema",
+        "BulkMode": "bulk_schema",
+        "CacheStatsResponse": "health_schema",
+        "CartCheckoutResponse": "cart_schema",
+        "CartItemRequest": "cart_schema",
+        "CartLine": "cart_schema",
+        "CartRequest": "cart_schema",
+        "CartResponse": "cart_schema",
+        "ClientRequest": "client_schema",
+        "ClientResponse": "client_schema",
+        "ClientUpdate": "client_schema",
+        "CursorParams": "pagination_schema",
+        "DatabaseHealthResponse": "health_schema",
+        "ExportFormat": "product_schema",
+        "Page": "pagination_schema",
+        "PaginationParams": "pagination_schema",
+        "PoolStatsResponse": "health_schema",
+        "ProductBatchGet": "product_schema",
+        "ProductBatchGetItem": "product_schema",
+        "ProductBatchGetResponse": "product_schema",
+        "ProductBulkCreate": "product_schema",
+        "ProductBulkDelete": "product_schema",
+        "ProductBulkItemResult": "product_schema",
+        "ProductBulkResponse": "product_schema",
+        "ProductBulkUpdate": "product_schema",
+        "ProductBulkUpdateItem": "product_schema",
+        "ProductFilter": "product_schema",
+        "ProductImportReject": "product_schema",
+        "ProductImportResponse": "product_schema",
+        "ProductImportRow": "product_schema",
+        "ProductQueryParams": "product_schema",
+        "ProductRequest": "product_schema",
+        "ProductResponse": "product_schema",
+        "ProductSearchMode": "product_schema",
+        "ProductSearchParams": "product_schema",
+        "ProductSortField": "product_schema",
+        "ProductUpdate": "product_schema",
+        "RawPage": "pagination_schema",
+        "ReadinessResponse": "health_schema",
+        "SortOrder": "pagination_schema",
+        "StockRequest": "product_schema",
+        "StockReservation": "product_schema",
+        "StockReservationItem": "product_schema",
+    },
+)
@@ -0,0 +1,37 @@
+from enum import StrEnum
+from typing import Annotated
+
+from pydantic import Field
+
+from app.schemas.base_schema import BaseSchema
+
+MAX_BULK_ITEMS = 50_000
+
+
+class BulkMode(StrEnum):
+    """Modo transacional das operações em lote."""
+
+    ATOMIC = "atomic"
+    PER_CHUNK = "per_chunk"
+
+
+class BulkItemStatus(StrEnum):
+    """Resultado de um item de uma operação em lote."""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
+    FAILED = "failed"
+
+
+class BulkChunkResult(BaseSchema):
+    """Resultado de um bloco de uma operação em lote."""
+
+    index: Annotated[int, Field(description="Posição do bloco")]
+    start: Annotated[int, Field(description="Índice do primeiro item do bloco")]
+    size: Annotated[int, Field(description="Quantidade de itens do bloco")]
+    succeeded: Annotated[bool, Field(description="Indica se o bloco foi gravado")]
+    detail: Annotated[
+        str | None, Field(description="Motivo da falha do bloco, quando houver")
+    ] = None
@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import Field, NonNegativeFloat, NonNegativeInt, PositiveInt
+
+from app.schemas.base_schema import BaseSchema
+from app.schemas.product_schema import MAX_QUANTITY
+
+
+class CartRequest(BaseSchema):
+    """Dados para criar um carrinho de compras."""
+
+    client_id: Annotated[UUID, Field(description="Cliente dono do carrinho")]
+
+
+class CartItemRequest(BaseSchema):
+    """Quantidade desejada de um produto no carrinho."""
+
+    quantity: Annotated[
+        PositiveInt,
+        Field(description="Quantidade de unidades", examples=[2], le=MAX_QUANTITY),
+    ]
+
+
+class CartLine(BaseSchema):
+    """Item do carrinho com o preço e o estoque atuais do produto."""
+
+    product_id: Annotated[UUID, Field(description="Identificador do produto")]
+    name: Annotated[str, Field(description="Nome do produto")]
+    unit_price: Annotated[float, Field(description="Preço atual do produto")]
+    quantity: Annotated[int, Field(description="Quantidade no carrinho")]
+    line_total: Annotated[float, Field(description="Preço vezes quantidade")]
+    available_quantity: Annotated[
+        int, Field(description="Quantidade do produto em estoque")
+    ]
+    in_stock: Annotated[
+        bool, Field(description="Se o estoque atual cobre a quantidade do item")
+    ]
+
+
+class CartResponse(BaseSchema):
+    """Carrinho com os itens e os totais calculados no banco."""
+
+    id: Annotated[UUID, Field(description="Identificador do carrinho")]
+    client_id: Annotated[UUID, Field(description="Cliente dono do carrinho")]
+    version: Annotated[int, Field(description="Incrementada a cada alteração")]
+    updated_at: Annotated[datetime, Field(description="Última alteração nos itens")]
+    lines: Annotated[
+        list[CartLine], Field(description="Itens, na ordem em que foram adicionados")
+    ]
+    item_count: Annotated[
+        NonNegativeInt, Field(description="Soma das quantidades dos itens")
+    ]
+    subtotal: Annotated[
+        NonNegativeFloat, Field(description="Soma dos totais dos itens")
+    ]
+    available: Annotated[
+        bool, Field(description="Se o estoque atual cobre todos os itens")
+    ]
+
+
+class CartCheckoutResponse(BaseSchema):
+    """Resultado do fechamento de um carrinho."""
+
+    cart_id: Annotated[UUID, Field(description="Identificador do carrinho")]
+    lines: Annotated[
+        list[CartLine],
+        Field(description="Itens baixados do estoque, com o preço cobrado"),
+    ]
+    item_count: Annotated[NonNegativeInt, Field(description="Unidades baixadas")]
+    total: Annotated[NonNegativeFloat, Field(description="Valor total")]
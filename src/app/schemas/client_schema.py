@@ -3,10 +3,13 @@ from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-from pydantic import EmailStr, Field, PositiveInt, AfterValidator
+from pydantic import AfterValidator, EmailStr, Field, PositiveInt
 
 from app.schemas.base_schema import BaseSchema
 
+# Limita o custo da validação e do hash de senhas enviadas por clientes.
+PASSWORD_MAX_LENGTH = 128
+
 
 def validade_cpf(v: str) -> str:
     """Valida CPF"""
@@ -124,6 +127,7 @@ class ClientRequest(ClientBase):
             examples=[
                 "89755Yu@",
             ],
+            max_length=PASSWORD_MAX_LENGTH,
         ),
     ]
 
@@ -154,6 +158,7 @@ class ClientUpdate(BaseSchema):
             examples=[
                 "89755Yu@",
             ],
+            max_length=PASSWORD_MAX_LENGTH,
         ),
     ] = None
     age: Annotated[
@@ -0,0 +1,51 @@
+from typing import Annotated
+
+from pydantic import Field
+
+from app.schemas.base_schema import BaseSchema
+
+
+class CacheStatsResponse(BaseSchema):
+    """Contadores do cache de leitura do processo."""
+
+    hits: Annotated[int, Field(description="Leituras atendidas pelo cache")]
+    misses: Annotated[int, Field(description="Leituras que consultaram o banco")]
+    coalesced: Annotated[
+        int,
+        Field(description="Leituras que aguardaram o carregamento de outra chamada"),
+    ]
+    evictions: Annotated[int, Field(description="Entradas removidas pelo LRU")]
+    expirations: Annotated[int, Field(description="Entradas removidas por TTL")]
+    size: Annotated[
+        int | None, Field(description="Quantidade de entradas armazenadas")
+    ] = None
+
+
+class PoolStatsResponse(BaseSchema):
+    """Estado do pool de conexões de um engine."""
+
+    name: Annotated[str, Field(description="Engine do pool (primary ou replica)")]
+    healthy: Annotated[
+        bool, Field(description="Indica se o engine está recebendo sessões")
+    ]
+    size: Annotated[int, Field(description="Tamanho configurado do pool")]
+    checked_in: Annotated[int, Field(description="Conexões ociosas no pool")]
+    checked_out: Annotated[int, Field(description="Conexões em uso")]
+    overflow: Annotated[
+        int, Field(description="Conexões abertas além do tamanho do pool")
+    ]
+    max_overflow: Annotated[int, Field(description="Limite de conexões extras")]
+
+
+class DatabaseHealthResponse(BaseSchema):
+    """Estado dos pools de conexões com o banco de dados."""
+
+    pools: Annotated[list[PoolStatsResponse], Field(description="Pools por engine")]
+
+
+class ReadinessResponse(BaseSchema):
+    """Indica se o processo terminou a inicialização e aceita tráfego."""
+
+    ready: Annotated[
+        bool, Field(description="False durante o aquecimento e o encerramento")
+    ]
@@ -0,0 +1,62 @@
+from enum import StrEnum
+from typing import Annotated, Any, TypedDict
+
+from pydantic import Field
+
+from app.schemas.base_schema import BaseSchema
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class SortOrder(StrEnum):
+    """Direção de ordenação das listagens."""
+
+    ASC = "asc"
+    DESC = "desc"
+
+
+class CursorParams(BaseSchema):
+    """Parâmetros de paginação por cursor (keyset)."""
+
+    limit: Annotated[
+        int,
+        Field(
+            description="Quantidade máxima de itens por página",
+            ge=1,
+            le=MAX_PAGE_SIZE,
+        ),
+    ] = DEFAULT_PAGE_SIZE
+    cursor: Annotated[
+        str | None,
+        Field(
+            description="Cursor opaco retornado em `next_cursor` pela página anterior",
+            max_length=512,
+        ),
+    ] = None
+
+
+class PaginationParams(CursorParams):
+    """Parâmetros de paginação por cursor com a direção da ordenação."""
+
+    order: Annotated[
+        SortOrder,
+        Field(description="Direção da ordenação"),
+    ] = SortOrder.ASC
+
+
+class Page[ItemType](BaseSchema):
+    """Página de resultados paginada por cursor."""
+
+    items: Annotated[list[ItemType], Field(description="Itens da página")]
+    next_cursor: Annotated[
+        str | None,
+        Field(description="Cursor da próxima página; nulo quando não há mais itens"),
+    ] = None
+
+
+class RawPage(TypedDict):
+    """Página com os itens já projetados em dicionários, pronta para serializar."""
+
+    items: list[dict[str, Any]]
+    next_cursor: str | None
@@ -1,8 +1,26 @@
-from typing import Annotated
+from enum import StrEnum
+from typing import Annotated, Self
+from uuid import UUID
 
-from pydantic import UUID4, Field, PositiveFloat, PositiveInt
+from pydantic import (
+    Field,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    model_validator,
+)
 
 from app.schemas.base_schema import BaseSchema
+from app.schemas.bulk_schema import (
+    MAX_BULK_ITEMS,
+    BulkChunkResult,
+    BulkItemStatus,
+)
+from app.schemas.pagination_schema import CursorParams, PaginationParams
+
+# Maior valor da coluna INTEGER do PostgreSQL.
+MAX_QUANTITY = 2_147_483_647
 
 
 class ProductRequest(BaseSchema):
@@ -36,12 +54,24 @@ class ProductRequest(BaseSchema):
                 10,
                 0,
             ],
+            le=MAX_QUANTITY,
         ),
     ]
 
 
 class ProductResponse(ProductRequest):
-    id: Annotated[UUID4, Field(description="Identificador do produto")]
+    id: Annotated[UUID, Field(description="Identificador do produto")]
+    quantity: Annotated[
+        NonNegativeInt,
+        Field(
+            description="Quantidade do produto; chega a zero com as reservas",
+            examples=[
+                6,
+                10,
+                0,
+            ],
+        ),
+    ]
 
 
 class ProductUpdate(BaseSchema):
@@ -64,5 +94,348 @@ class ProductUpdate(BaseSchema):
                 10,
                 0,
             ],
+            le=MAX_QUANTITY,
+        ),
+    ] = None
+
+
+class ProductSortField(StrEnum):
+    """Campos disponíveis para ordenação da listagem de produtos."""
+
+    ID = "id"
+    NAME = "name"
+    PRICE = "price"
+    QUANTITY = "quantity"
+
+
+class ProductFilter(BaseSchema):
+    """Filtros aplicados no banco de dados à listagem de produtos."""
+
+    name_prefix: Annotated[
+        str | None,
+        Field(
+            description="Prefixo do nome do produto",
+            examples=["Iph"],
+            min_length=1,
+            max_length=25,
+        ),
+    ] = None
+    min_price: Annotated[
+        NonNegativeFloat | None,
+        Field(description="Preço mínimo (inclusivo)", examples=[10.0]),
+    ] = None
+    max_price: Annotated[
+        NonNegativeFloat | None,
+        Field(description="Preço máximo (inclusivo)", examples=[1_000.0]),
+    ] = None
+    min_quantity: Annotated[
+        NonNegativeInt | None,
+        Field(description="Quantidade mínima (inclusiva)", examples=[1]),
+    ] = None
+    max_quantity: Annotated[
+        NonNegativeInt | None,
+        Field(description="Quantidade máxima (inclusiva)", examples=[100]),
+    ] = None
+
+    @model_validator(mode="after")
+    def validate_ranges(self) -> Self:
+        """Garante que os limites mínimos não ultrapassem os máximos."""
+        if (
+            self.min_price is not None
+            and self.max_price is not None
+            and self.min_price > self.max_price
+        ):
+            raise ValueError("min_price não pode ser maior que max_price")
+
+        if (
+            self.min_quantity is not None
+            and self.max_quantity is not None
+            and self.min_quantity > self.max_quantity
+        ):
+            raise ValueError("min_quantity não pode ser maior que max_quantity")
+
+        return self
+
+
+class ProductQueryParams(PaginationParams, ProductFilter):
+    """Parâmetros de consulta da listagem de produtos."""
+
+    sort_by: Annotated[
+        ProductSortField,
+        Field(
+            description=(
+                "Campo usado na ordenação; com IDs UUIDv7, `id` segue a ordem "
+                "de criação"
+            )
+        ),
+    ] = ProductSortField.ID
+
+
+class ProductSearchMode(StrEnum):
+    """Modos de busca de produtos pelo nome."""
+
+    PREFIX = "prefix"
+    CONTAINS = "contains"
+    FULLTEXT = "fulltext"
+
+
+MIN_CONTAINS_LENGTH = 3
+
+
+class ProductSearchParams(CursorParams):
+    """Parâmetros de consulta da busca de produtos."""
+
+    q: Annotated[
+        str,
+        Field(
+            description="Texto buscado no nome do produto",
+            examples=["Note"],
+            min_length=1,
+            max_length=100,
+        ),
+    ]
+    mode: Annotated[
+        ProductSearchMode,
+        Field(
+            description=(
+                "`prefix` busca nomes que começam com o texto; `contains` busca "
+                "o texto em qualquer parte do nome, sem diferenciar maiúsculas; "
+                "`fulltext` busca as palavras e ordena pela relevância"
+            )
+        ),
+    ] = ProductSearchMode.PREFIX
+
+    @model_validator(mode="after")
+    def validate_contains_length(self) -> Self:
+        """Exige um texto mínimo na busca por trecho, que usa trigramas."""
+        if (
+            self.mode is ProductSearchMode.CONTAINS
+            and len(self.q) < MIN_CONTAINS_LENGTH
+        ):
+            raise ValueError(
+                f"A busca `contains` exige ao menos {MIN_CONTAINS_LENGTH} caracteres"
+            )
+
+        return self
+
+
+class ExportFormat(StrEnum):
+    """Formatos disponíveis para a exportação e a importação do catálogo."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """Media type HTTP correspondente ao formato."""
+        if self is ExportFormat.CSV:
+            return "text/csv; charset=utf-8"
+
+        return "application/x-ndjson"
+
+
+class ProductImportRow(ProductRequest):
+    """Linha de um arquivo de importação de produtos."""
+
+    id: Annotated[
+        UUID | None,
+        Field(
+            description=(
+                "Identificador do produto; se já existir, o produto é atualizado"
+            )
         ),
     ] = None
+
+
+class ProductImportReject(BaseSchema):
+    """Linha recusada em uma importação de produtos."""
+
+    line: Annotated[int, Field(description="Número da linha no arquivo")]
+    detail: Annotated[str, Field(description="Motivo da recusa")]
+
+
+class ProductImportResponse(BaseSchema):
+    """Resultado de uma importação de produtos."""
+
+    received: Annotated[int, Field(description="Linhas de produtos recebidas")]
+    inserted: Annotated[int, Field(description="Produtos criados")]
+    updated: Annotated[int, Field(description="Produtos atualizados")]
+    rejected: Annotated[int, Field(description="Linhas recusadas")]
+    rejects: Annotated[
+        list[ProductImportReject],
+        Field(
+            description=(
+                "Linhas recusadas, na ordem do arquivo, até o limite configurado "
+                "em IMPORT_MAX_REPORTED_REJECTS"
+            )
+        ),
+    ]
+
+
+class ProductBulkCreate(BaseSchema):
+    """Schema para criação de produtos em lote."""
+
+    items: Annotated[
+        list[ProductRequest],
+        Field(
+            description="Produtos a serem criados",
+            min_length=1,
+            max_length=MAX_BULK_ITEMS,
+        ),
+    ]
+
+
+class ProductBulkUpdateItem(ProductUpdate):
+    """Item da atualização de produtos em lote."""
+
+    id: Annotated[UUID, Field(description="Identificador do produto")]
+
+    @model_validator(mode="after")
+    def validate_has_changes(self) -> Self:
+        """Garante que o item altere ao menos um campo."""
+        if not self.model_fields_set - {"id"}:
+            raise ValueError("Informe ao menos um campo para atualizar")
+
+        return self
+
+
+class ProductBulkUpdate(BaseSchema):
+    """Schema para atualização de produtos em lote."""
+
+    items: Annotated[
+        list[ProductBulkUpdateItem],
+        Field(
+            description="Produtos a serem atualizados",
+            min_length=1,
+            max_length=MAX_BULK_ITEMS,
+        ),
+    ]
+
+    @model_validator(mode="after")
+    def validate_unique_ids(self) -> Self:
+        """Garante que cada produto apareça uma única vez no lote."""
+        if len({item.id for item in self.items}) != len(self.items):
+            raise ValueError("O lote contém IDs de produto repetidos")
+
+        return self
+
+
+class ProductBulkDelete(BaseSchema):
+    """Schema para remoção de produtos em lote."""
+
+    ids: Annotated[
+        list[UUID],
+        Field(
+            description="Identificadores dos produtos a serem removidos",
+            min_length=1,
+            max_length=MAX_BULK_ITEMS,
+        ),
+    ]
+
+    @model_validator(mode="after")
+    def validate_unique_ids(self) -> Self:
+        """Garante que cada produto apareça uma única vez no lote."""
+        if len(set(self.ids)) != len(self.ids):
+            raise ValueError("O lote contém IDs de produto repetidos")
+
+        return self
+
+
+class ProductBulkItemResult(BaseSchema):
+    """Resultado de um item de uma operação em lote de produtos."""
+
+    index: Annotated[int, Field(description="Posição do item no lote")]
+    id: Annotated[UUID | None, Field(description="Identificador do produto")]
+    status: Annotated[BulkItemStatus, Field(description="Resultado do item")]
+    product: Annotated[
+        ProductResponse | None,
+        Field(description="Produto criado ou atualizado"),
+    ] = None
+
+
+class ProductBulkResponse(BaseSchema):
+    """Resposta das operações em lote de produtos."""
+
+    items: Annotated[
+        list[ProductBulkItemResult],
+        Field(description="Resultados por item, na ordem do lote"),
+    ]
+    chunks: Annotated[
+        list[BulkChunkResult],
+        Field(description="Resultados por bloco gravado"),
+    ]
+
+
+MAX_BATCH_GET_IDS = 1_000
+
+
+class ProductBatchGet(BaseSchema):
+    """Schema para a consulta de vários produtos pelo ID."""
+
+    ids: Annotated[
+        list[UUID],
+        Field(
+            description="Identificadores dos produtos, na ordem desejada",
+            min_length=1,
+            max_length=MAX_BATCH_GET_IDS,
+        ),
+    ]
+
+
+class ProductBatchGetItem(BaseSchema):
+    """Resultado de um ID da consulta em lote."""
+
+    id: Annotated[UUID, Field(description="Identificador consultado")]
+    found: Annotated[bool, Field(description="Indica se o produto existe")]
+    product: Annotated[
+        ProductResponse | None,
+        Field(description="Produto encontrado, ou null"),
+    ] = None
+
+
+class ProductBatchGetResponse(BaseSchema):
+    """Resposta da consulta de vários produtos pelo ID."""
+
+    items: Annotated[
+        list[ProductBatchGetItem],
+        Field(description="Resultados por ID, na ordem da requisição"),
+    ]
+
+
+MAX_RESERVATION_ITEMS = 1_000
+
+
+class StockRequest(BaseSchema):
+    """Quantidade reservada ou liberada do estoque de um produto."""
+
+    quantity: Annotated[
+        PositiveInt,
+        Field(description="Quantidade de unidades", examples=[1], le=MAX_QUANTITY),
+    ]
+
+
+class StockReservationItem(StockRequest):
+    """Item de uma reserva ou liberação de estoque em lote."""
+
+    id: Annotated[UUID, Field(description="Identificador do produto")]
+
+
+class StockReservation(BaseSchema):
+    """Reserva ou liberação de estoque de vários produtos em um único comando."""
+
+    items: Annotated[
+        list[StockReservationItem],
+        Field(
+            description="Produtos e quantidades",
+            min_length=1,
+            max_length=MAX_RESERVATION_ITEMS,
+        ),
+    ]
+
+    @model_validator(mode="after")
+    def validate_unique_ids(self) -> Self:
+        """Garante que cada produto apareça uma única vez no lote."""
+        if len({item.id for item in self.items}) != len(self.items):
+            raise ValueError("O lote contém IDs de produto repetidos")
+
+        return self
@@ -0,0 +1,92 @@
+"""Ponto de entrada de produção: uvicorn com um worker por CPU.
+
+Usa uvloop e httptools quando instalados (`pip install .[server]`). Cada
+worker é um processo novo que importa a aplicação e cria o próprio engine;
+o processo supervisor não importa a aplicação nem abre conexões. Ao receber
+SIGTERM ou SIGINT, os workers deixam de aceitar conexões e aguardam as
+requisições em andamento por até SERVER_GRACEFUL_TIMEOUT segundos. Com mais
+de um worker e `CHANGES_NOTIFY` desligado, um aviso é registrado na partida:
+cada assinante de /products/changes só veria as escritas do próprio worker.
+
+Uso:
+
+    PYTHONPATH=src python -m app.server --workers 4
+"""
+
+import argparse
+import json
+import logging
+import os
+from importlib.util import find_spec
+
+import uvicorn
+
+from app.core.settings import get_settings
+
+APP = "app.main:app"
+
+logger = logging.getLogger("app.server")
+
+
+def default_workers() -> int:
+    """Um worker por CPU disponível para o processo."""
+    return os.process_cpu_count() or 1
+
+
+def event_loop() -> str:
+    """uvloop quando instalado; senão, o loop padrão do asyncio."""
+    return "uvloop" if find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    """Parser HTTP em C (httptools) quando instalado; senão, h11."""
+    return "httptools" if find_spec("httptools") else "h11"
+
+
+def warn_if_changes_stay_in_each_worker(workers: int) -> None:
+    """Avisa quando o feed de alterações não é distribuído entre os workers."""
+    if workers > 1 and not get_settings().CHANGES_NOTIFY:
+        logger.warning(
+            json.dumps(
+                {
+                    "event": "changes_notify_disabled",
+                    "workers": workers,
+                    "detail": (
+                        "os assinantes de /products/changes só recebem as "
+                        "escritas do próprio worker; ative CHANGES_NOTIFY"
+                    ),
+                },
+                ensure_ascii=False,
+            )
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Servidor de produção da API")
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument(
+        "--workers", type=int, default=settings.SERVER_WORKERS or default_workers()
+    )
+    arguments = parser.parse_args(argv)
+    warn_if_changes_stay_in_each_worker(arguments.workers)
+
+    uvicorn.run(
+        APP,
+        host=arguments.host,
+        port=arguments.port,
+        workers=arguments.workers,
+        loop=event_loop(),
+        http=http_protocol(),
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+        access_log=settings.SERVER_ACCESS_LOG,
+        log_level=settings.LOG_LEVEL.lower(),
+    )
+
+
+if __name__ == "__main__":
+    main()
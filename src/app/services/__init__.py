@@ -1,3 +1,21 @@
-from .product_service import ProductService
+from typing import TYPE_CHECKING
 
-__all__ = ["ProductService"]
+from app.core.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .cart_service import CartService
+    from .client_service import ClientService
+    from .idempotency_service import IdempotencyService
+    from .product_service import ProductService
+
+__all__ = ["CartService", "ClientService", "IdempotencyService", "ProductService"]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "CartService": "cart_service",
+        "ClientService": "client_service",
+        "IdempotencyService": "idempotency_service",
+        "ProductService": "product_service",
+    },
+)
@@ -0,0 +1,158 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.exceptions import (
+    CartNotFoundException,
+    ClientNotFoundException,
+    EmptyCartException,
+    ProductNotFoundException,
+)
+from app.repositories import CartRepository
+from app.schemas import (
+    CartCheckoutResponse,
+    CartItemRequest,
+    CartLine,
+    CartRequest,
+    CartResponse,
+    StockReservationItem,
+)
+from app.services.product_service import ProductService
+
+
+def _to_cart_response(rows: Sequence[Row]) -> CartResponse:
+    """Monta o carrinho a partir das linhas de `CartRepository.find_lines`."""
+    first = rows[0]
+
+    return CartResponse(
+        id=first.id,
+        client_id=first.client_id,
+        version=first.version,
+        updated_at=first.updated_at,
+        lines=[
+            CartLine(
+                product_id=row.product_id,
+                name=row.name,
+                unit_price=row.unit_price,
+                quantity=row.quantity,
+                line_total=row.line_total,
+                available_quantity=row.available_quantity,
+                in_stock=row.in_stock,
+            )
+            for row in rows
+            if row.product_id is not None
+        ],
+        item_count=first.item_count,
+        subtotal=first.subtotal,
+        available=first.available,
+    )
+
+
+class CartService:
+    """Camada responsável pela lógica de negócio dos carrinhos de compras.
+
+    Itens, totais e disponibilidade vêm sempre de uma única consulta, com o
+    preço e o estoque atuais dos produtos. O fechamento baixa o estoque pelo
+    `ProductService`, na mesma transação que esvazia o carrinho.
+    """
+
+    def __init__(
+        self, db_session: AsyncSession, product_service: ProductService
+    ) -> None:
+        self.db_session = db_session
+        self.repository: CartRepository = CartRepository(db_session)
+        self.product_service = product_service
+
+    async def create_cart(self, cart_request: CartRequest) -> CartResponse:
+        """Cria um carrinho vazio para um cliente."""
+        try:
+            cart_model = await self.repository.save(cart_request)
+        except IntegrityError as exception:
+            raise ClientNotFoundException(cart_request.client_id) from exception
+
+        return CartResponse(
+            id=cart_model.id,
+            client_id=cart_model.client_id,
+            version=cart_model.version,
+            updated_at=cart_model.updated_at,
+            lines=[],
+            item_count=0,
+            subtotal=0.0,
+            available=True,
+        )
+
+    async def get_cart(self, cart_id: UUID) -> CartResponse:
+        """Busca o carrinho com os itens e os totais."""
+        rows = await self.repository.find_lines(cart_id)
+
+        if not rows:
+            raise CartNotFoundException(cart_id)
+
+        return _to_cart_response(rows)
+
+    async def set_item(
+        self, cart_id: UUID, product_id: UUID, item_request: CartItemRequest
+    ) -> CartResponse:
+        """Inclui um produto no carrinho ou substitui a quantidade dele."""
+        if not await self.repository.touch(cart_id):
+            raise CartNotFoundException(cart_id)
+
+        if not await self.repository.save_item(
+            cart_id, product_id, item_request.quantity
+        ):
+            raise ProductNotFoundException(product_id)
+
+        return await self.get_cart(cart_id)
+
+    async def remove_item(self, cart_id: UUID, product_id: UUID) -> CartResponse:
+        """Remove um produto do carrinho; remover um produto ausente não é erro."""
+        if not await self.repository.touch(cart_id):
+            raise CartNotFoundException(cart_id)
+
+        await self.repository.delete_item(cart_id, product_id)
+
+        return await self.get_cart(cart_id)
+
+    async def checkout(self, cart_id: UUID) -> CartCheckoutResponse:
+        """Fecha o carrinho: baixa o estoque de todos os itens e o esvazia.
+
+        Tudo acontece em uma transação. Se algum produto não tiver estoque,
+        `reserve_stock` lança a exceção, nada é baixado e o carrinho mantém
+        os itens.
+        """
+        if not await self.repository.touch(cart_id):
+            raise CartNotFoundException(cart_id)
+
+        items = await self.repository.take_items(cart_id)
+
+        if not items:
+            raise EmptyCartException(cart_id)
+
+        products = await self.product_service.reserve_stock(
+            [
+                StockReservationItem(id=product_id, quantity=quantity)
+                for product_id, quantity in items
+            ]
+        )
+        lines = [
+            CartLine(
+                product_id=product.id,
+                name=product.name,
+                unit_price=product.price,
+                quantity=quantity,
+                line_total=product.price * quantity,
+                available_quantity=product.quantity,
+                in_stock=True,
+            )
+            for product, (_, quantity) in zip(products, items, strict=True)
+        ]
+
+        return CartCheckoutResponse(
+            cart_id=cart_id,
+            lines=lines,
+            item_count=sum(line.quantity for line in lines),
+            total=sum(line.line_total for line in lines),
+        )
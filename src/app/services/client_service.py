@@ -0,0 +1,70 @@
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.offload import BoundedExecutor
+from app.core.security import hash_password
+from app.exceptions import ClientAlreadyExistsException, ClientNotFoundException
+from app.repositories import ClientRepository
+from app.schemas import ClientRequest, ClientResponse, ClientUpdate
+
+
+class ClientService:
+    """Camada responsável pela lógica de negócio dos clientes.
+
+    O hash das senhas roda no `password_executor`, fora do event loop, e
+    antes de qualquer comando no banco: assim a sessão ainda não retirou uma
+    conexão do pool enquanto espera o hash.
+    """
+
+    def __init__(
+        self, db_session: AsyncSession, password_executor: BoundedExecutor
+    ) -> None:
+        self.db_session = db_session
+        self.repository: ClientRepository = ClientRepository(db_session)
+        self.password_executor = password_executor
+
+    async def create_client(self, client_request: ClientRequest) -> ClientResponse:
+        """Cria um cliente, guardando apenas o hash da senha."""
+        password_hash = await self.password_executor.run(
+            hash_password, client_request.password
+        )
+
+        try:
+            client_model = await self.repository.save(
+                client_request.model_copy(update={"password": password_hash})
+            )
+        except IntegrityError as exception:
+            raise ClientAlreadyExistsException() from exception
+
+        return ClientResponse.model_validate(client_model)
+
+    async def get_client_by_id(self, client_id: UUID) -> ClientResponse:
+        """Busca um cliente pelo ID."""
+        client_model = await self.repository.find_by_id(client_id)
+
+        if not client_model:
+            raise ClientNotFoundException(client_id)
+
+        return ClientResponse.model_validate(client_model)
+
+    async def update_client(
+        self, client_id: UUID, client_update: ClientUpdate
+    ) -> ClientResponse:
+        """Atualiza um cliente, gerando o hash da nova senha quando informada."""
+        if client_update.password is not None:
+            password_hash = await self.password_executor.run(
+                hash_password, client_update.password
+            )
+            client_update = client_update.model_copy(update={"password": password_hash})
+
+        try:
+            client_model = await self.repository.update(client_id, client_update)
+        except IntegrityError as exception:
+            raise ClientAlreadyExistsException() from exception
+
+        if not client_model:
+            raise ClientNotFoundException(client_id)
+
+        return ClientResponse.model_validate(client_model)
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+from fastapi import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import get_settings
+from app.exceptions import IdempotencyKeyMismatchException
+from app.repositories import IdempotencyKeyRepository
+
+# Recalculado a partir do corpo gravado ao repetir a resposta.
+EXCLUDED_HEADERS = frozenset({"content-length"})
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyService:
+    """Camada responsável pelas chaves de idempotência das escritas.
+
+    A chave é reservada e a resposta é gravada na mesma transação da escrita:
+    uma requisição repetida depois do COMMIT recebe a resposta gravada, com uma
+    única consulta, e uma repetida durante a escrita espera por ela. Se a
+    escrita falhar, a chave é liberada junto com o ROLLBACK.
+    """
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        key: str | None = None,
+        fingerprint: str = "",
+    ) -> None:
+        self.repository = IdempotencyKeyRepository(db_session)
+        self.key = key
+        self.fingerprint = fingerprint
+
+    async def replay(self) -> Response | None:
+        """Retorna a resposta gravada para a chave ou a reserva para esta escrita.
+
+        Retorna None quando a escrita deve ser executada: sem chave, ou com a
+        chave reservada para a transação corrente.
+        """
+        if self.key is None:
+            return None
+
+        ttl = timedelta(seconds=get_settings().IDEMPOTENCY_TTL_SECONDS)
+
+        # A chave pode expirar e ser removida entre a reserva e a leitura.
+        while True:
+            stored = await self.repository.find(self.key)
+
+            if stored is None:
+                if await self.repository.claim(self.key, self.fingerprint, ttl):
+                    return None
+
+                stored = await self.repository.find(self.key)
+
+            if stored is not None:
+                break
+
+        if stored.fingerprint != self.fingerprint:
+            raise IdempotencyKeyMismatchException(self.key)
+
+        return Response(
+            content=stored.body,
+            status_code=stored.status_code,
+            headers=stored.headers | {REPLAYED_HEADER: "true"},
+        )
+
+    async def save(self, response: Response) -> Response:
+        """Grava a resposta da escrita na chave reservada e a retorna."""
+        if self.key is not None:
+            await self.repository.complete(
+                self.key,
+                response.status_code,
+                {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name not in EXCLUDED_HEADERS
+                },
+                bytes(response.body),
+            )
+
+        return response
+
+    async def delete_expired(self) -> int:
+        """Remove um bloco de chaves expiradas e retorna quantas removeu."""
+        return await self.repository.delete_expired(
+            get_settings().IDEMPOTENCY_CLEANUP_BATCH_SIZE
+        )
@@ -0,0 +1,298 @@
+"""Leitura e validação dos arquivos CSV e NDJSON de importação de produtos.
+
+Usado por `POST /products/import` e pelo importador de linha de comando
+(`python -m app.importer`); a gravação fica com o ProductService.
+"""
+
+import csv
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+
+from app.exceptions import InvalidProductDataException
+from app.schemas import (
+    ExportFormat,
+    ProductImportReject,
+    ProductImportResponse,
+    ProductImportRow,
+    ProductRequest,
+)
+
+# Linha do arquivo de importação e o seu conteúdo a validar, ou o motivo da
+# recusa, quando a linha já foi recusada na leitura.
+ImportItem = tuple[int, object]
+
+SUFFIX_FORMATS = {
+    ".csv": ExportFormat.CSV,
+    ".ndjson": ExportFormat.NDJSON,
+    ".jsonl": ExportFormat.NDJSON,
+}
+IMPORT_COLUMNS: tuple[str, ...] = ("id", *ProductRequest.model_fields)
+IMPORT_REQUIRED_COLUMNS = frozenset(ProductRequest.model_fields)
+IMPORT_ROWS = TypeAdapter(list[ProductImportRow])
+IMPORT_NDJSON_BATCH = TypeAdapter(list[tuple[ProductImportRow]])
+IMPORT_ROW = TypeAdapter(ProductImportRow)
+
+
+@dataclass(slots=True)
+class ImportTally:
+    """Contagens de uma importação em andamento."""
+
+    max_reported_rejects: int
+    received: int = 0
+    inserted: int = 0
+    updated: int = 0
+    rejected: int = 0
+    rejects: list[ProductImportReject] = field(default_factory=list)
+
+    def reject(self, line: int, detail: str) -> None:
+        """Registra uma linha recusada, detalhando-a até o limite configurado."""
+        self.rejected += 1
+
+        if len(self.rejects) < self.max_reported_rejects:
+            self.rejects.append(ProductImportReject(line=line, detail=detail))
+
+    def to_response(self) -> ProductImportResponse:
+        """Monta a resposta da importação, com as recusas na ordem do arquivo."""
+        return ProductImportResponse(
+            received=self.received,
+            inserted=self.inserted,
+            updated=self.updated,
+            rejected=self.rejected,
+            rejects=sorted(self.rejects, key=lambda reject: reject.line),
+        )
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes], max_line_bytes: int
+) -> AsyncIterator[tuple[int, bytes]]:
+    """Divide um fluxo de bytes em linhas numeradas a partir de 1.
+
+    Só o bloco recebido e a linha incompleta ficam em memória; uma linha
+    maior que `max_line_bytes` interrompe a importação.
+    """
+    number = 0
+    pending = b""
+
+    async for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b"\n")
+
+        for line in lines:
+            number += 1
+
+            if len(line) > max_line_bytes:
+                raise InvalidProductDataException(
+                    f"A linha {number} passa de {max_line_bytes} bytes."
+                )
+
+            yield number, line.removesuffix(b"\r")
+
+        if len(pending) > max_line_bytes:
+            raise InvalidProductDataException(
+                f"A linha {number + 1} passa de {max_line_bytes} bytes."
+            )
+
+    if pending:
+        yield number + 1, pending.removesuffix(b"\r")
+
+
+async def iter_ndjson_items(
+    lines: AsyncIterable[tuple[int, bytes]],
+) -> AsyncIterator[ImportItem]:
+    """Retorna as linhas de um NDJSON que não estão em branco."""
+    async for number, line in lines:
+        if line.strip():
+            yield number, line
+
+
+async def iter_csv_items(
+    lines: AsyncIterable[tuple[int, bytes]], max_line_bytes: int
+) -> AsyncIterator[ImportItem]:
+    """Converte os registros de um CSV com cabeçalho em dicionários.
+
+    Um registro ocupa várias linhas quando há quebras de linha entre aspas.
+    Campos vazios são omitidos, para que valham os padrões do schema.
+    """
+    header: list[str] | None = None
+    parts: list[str] = []
+    start = quotes = 0
+
+    async for number, line in lines:
+        try:
+            text = line.decode()
+        except UnicodeDecodeError:
+            yield start or number, "A linha não está em UTF-8"
+            parts, start, quotes = [], 0, 0
+            continue
+
+        start = start or number
+        parts.append(text)
+        quotes += text.count('"')
+
+        if quotes % 2:
+            if sum(map(len, parts)) > max_line_bytes:
+                raise InvalidProductDataException(
+                    f"O registro da linha {start} tem aspas sem fechamento."
+                )
+            continue
+
+        record, record_start = "\n".join(parts), start
+        parts, start, quotes = [], 0, 0
+
+        if not record.strip():
+            continue
+
+        values = next(csv.reader([record]))
+
+        if header is None:
+            header = parse_csv_header(values)
+        elif len(values) != len(header):
+            yield (
+                record_start,
+                (f"Esperadas {len(header)} colunas, encontradas {len(values)}"),
+            )
+        else:
+            yield (
+                record_start,
+                {name: value for name, value in zip(header, values) if value != ""},
+            )
+
+    if parts:
+        yield start, "O registro tem aspas sem fechamento"
+
+
+def parse_csv_header(values: list[str]) -> list[str]:
+    """Confere as colunas do cabeçalho do CSV de importação."""
+    header = [value.strip().removeprefix("﻿") for value in values]
+
+    if unknown := set(header) - set(IMPORT_COLUMNS):
+        raise InvalidProductDataException(
+            f"Colunas desconhecidas no cabeçalho do CSV: {', '.join(sorted(unknown))}."
+        )
+
+    if missing := IMPORT_REQUIRED_COLUMNS - set(header):
+        raise InvalidProductDataException(
+            f"Colunas ausentes no cabeçalho do CSV: {', '.join(sorted(missing))}."
+        )
+
+    return header
+
+
+def describe_errors(errors: Iterable[ErrorDetails]) -> str:
+    """Descreve os erros de validação de uma linha, com o campo de cada um."""
+    descriptions = []
+
+    for error in errors:
+        location = ".".join(part for part in error["loc"] if isinstance(part, str))
+        descriptions.append(f"{location}: {error['msg']}" if location else error["msg"])
+
+    return "; ".join(descriptions)
+
+
+def validate_ndjson_batch(lines: list[bytes]) -> list[ProductImportRow]:
+    # Cada linha vira uma lista de um elemento, para que uma linha com mais de
+    # um valor JSON seja recusada em vez de deslocar as posições seguintes.
+    rows = IMPORT_NDJSON_BATCH.validate_json(b"[[" + b"],[".join(lines) + b"]]")
+
+    return [row for (row,) in rows]
+
+
+def validate_batch(
+    validate_many: Callable[[list], list[ProductImportRow]], contents: list
+) -> tuple[list[ProductImportRow], dict[int, str]] | None:
+    """Valida um bloco com uma única chamada ao pydantic-core.
+
+    Retorna as linhas válidas e os erros por posição no bloco, ou None se
+    algum erro não puder ser atribuído a uma linha (JSON malformado, por
+    exemplo).
+    """
+    errors: dict[int, list[ErrorDetails]] = {}
+
+    try:
+        return validate_many(contents), {}
+    except ValidationError as exception:
+        for error in exception.errors(include_url=False):
+            position = error["loc"][0] if error["loc"] else None
+
+            if not isinstance(position, int) or position >= len(contents):
+                return None
+
+            errors.setdefault(position, []).append(error)
+
+    try:
+        rows = validate_many(
+            [
+                content
+                for position, content in enumerate(contents)
+                if position not in errors
+            ]
+        )
+    except ValidationError:
+        return None
+
+    return rows, {
+        position: describe_errors(position_errors)
+        for position, position_errors in errors.items()
+    }
+
+
+def validate_import_items(
+    items: list[ImportItem], import_format: ExportFormat, tally: ImportTally
+) -> list[tuple[int, ProductImportRow]]:
+    """Valida um bloco de linhas, recusando só as linhas inválidas.
+
+    O bloco é validado de uma vez; quando os erros não indicam a linha, cada
+    linha do bloco é validada separadamente.
+    """
+    if import_format is ExportFormat.CSV:
+        validate_many = IMPORT_ROWS.validate_python
+        validate_one = IMPORT_ROW.validate_python
+    else:
+        validate_many = validate_ndjson_batch
+        validate_one = IMPORT_ROW.validate_json
+
+    pending: list[ImportItem] = []
+
+    for line, content in items:
+        if isinstance(content, str):
+            tally.reject(line, content)
+        else:
+            pending.append((line, content))
+
+    result = validate_batch(validate_many, [content for _, content in pending])
+
+    if result is not None:
+        rows, errors = result
+
+        for position, detail in errors.items():
+            tally.reject(pending[position][0], detail)
+
+        lines = [
+            line for position, (line, _) in enumerate(pending) if position not in errors
+        ]
+
+        return list(zip(lines, rows, strict=True))
+
+    validated: list[tuple[int, ProductImportRow]] = []
+
+    for line, content in pending:
+        try:
+            validated.append((line, validate_one(content)))
+        except ValidationError as exception:
+            tally.reject(line, describe_errors(exception.errors(include_url=False)))
+
+    return validated
+
+
+def read_import_items(
+    chunks: AsyncIterable[bytes], import_format: ExportFormat, max_line_bytes: int
+) -> AsyncIterator[ImportItem]:
+    """Lê os itens de um arquivo de importação recebido em blocos de bytes."""
+    lines = iter_lines(chunks, max_line_bytes)
+
+    if import_format is ExportFormat.CSV:
+        return iter_csv_items(lines, max_line_bytes)
+
+    return iter_ndjson_items(lines)
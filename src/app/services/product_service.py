@@ -1,53 +1,705 @@
-from app.exceptions import ProductNotFoundException
+import csv
+import io
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from datetime import UTC, datetime
+from itertools import batched
+from typing import NoReturn
 from uuid import UUID
 
+from pydantic_core import to_json
+from sqlalchemy import Row, Table
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.repositories import ProductRepository
-from app.schemas import ProductRequest, ProductUpdate, ProductResponse
+from app.core import get_settings, on_commit, use_primary
+from app.core.cache import ReadThroughCache
+from app.core.changes import (
+    ChangeAction,
+    ChangeEvent,
+    encode_notifications,
+    get_change_broadcaster,
+)
+from app.core.database import async_session_maker, session_scope
+from app.core.etags import ChangeMarker
+from app.core.ids import new_id
+from app.core.responses import RowSerializer
+from app.exceptions import (
+    InsufficientStockException,
+    InvalidProductDataException,
+    PreconditionFailedException,
+    ProductNotFoundException,
+)
+from app.models import ProductModel
+from app.repositories import ChangeMarkerRepository, ProductRepository
+from app.schemas import (
+    BulkChunkResult,
+    BulkItemStatus,
+    BulkMode,
+    ExportFormat,
+    ProductBulkCreate,
+    ProductBulkDelete,
+    ProductBulkItemResult,
+    ProductBulkResponse,
+    ProductBulkUpdate,
+    ProductBulkUpdateItem,
+    ProductImportResponse,
+    ProductImportRow,
+    ProductQueryParams,
+    ProductRequest,
+    ProductResponse,
+    ProductSearchParams,
+    ProductUpdate,
+    RawPage,
+    StockReservationItem,
+)
+from app.schemas.product_schema import MAX_QUANTITY
+from app.services.product_import import (
+    IMPORT_COLUMNS,
+    ImportTally,
+    read_import_items,
+    validate_import_items,
+)
+
+BulkOutcome = tuple[UUID | None, BulkItemStatus, ProductModel | None]
+ImportRecord = tuple[UUID, str, float, int]
+
+EXPORT_FIELDS: tuple[str, ...] = tuple(ProductResponse.model_fields)
+PRODUCT_SERIALIZER = RowSerializer(ProductResponse)
+
+PRODUCTS_MARKER = "products"
+PRODUCTS_MARKER_CACHE_KEY = f"marker:{PRODUCTS_MARKER}"
+UNCHANGED_MARKER = ChangeMarker(0, datetime(1970, 1, 1, tzinfo=UTC))
+CHANGED_STATUSES = frozenset(
+    {BulkItemStatus.CREATED, BulkItemStatus.UPDATED, BulkItemStatus.DELETED}
+)
+
+
+def _encode_ndjson(rows: Sequence[Row]) -> bytes:
+    """Serializa um bloco de linhas como JSON delimitado por quebras de linha."""
+    return b"".join(to_json(row._asdict()) + b"\n" for row in rows)
+
+
+def _encode_csv(rows: Sequence[Row]) -> bytes:
+    """Serializa um bloco de linhas como CSV."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+
+    return buffer.getvalue().encode()
+
+
+def _encode_csv_header() -> bytes:
+    """Gera o cabeçalho do CSV de exportação."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_FIELDS)
+
+    return buffer.getvalue().encode()
+
+
+def _cache_key(product_id: UUID) -> str:
+    """Chave do produto no cache de leitura."""
+    return f"product:{product_id}"
+
+
+def _pack_cached(version: int, payload: bytes) -> bytes:
+    """Grava a versão antes do JSON, para responder ETags sem decodificá-lo."""
+    return b"%d\n" % version + payload
+
+
+def _unpack_cached(value: bytes) -> tuple[bytes, int]:
+    """Separa o JSON e a versão de um valor gravado por `_pack_cached`."""
+    version, _, payload = value.partition(b"\n")
+
+    return payload, int(version)
+
+
+def _encode_batch_item(product_id: UUID, cached: bytes | None) -> bytes:
+    """Monta um item da consulta em lote reaproveitando o JSON em cache."""
+    if cached is None:
+        return b'{"id":"%s","found":false,"product":null}' % str(product_id).encode()
+
+    payload, _ = _unpack_cached(cached)
+
+    return b'{"id":"%s","found":true,"product":%s}' % (
+        str(product_id).encode(),
+        payload,
+    )
+
+
+async def _abatched[T](items: AsyncIterable[T], size: int) -> AsyncIterator[list[T]]:
+    """Agrupa os itens de um iterador assíncrono em listas de até `size` itens."""
+    batch: list[T] = []
+
+    async for item in items:
+        batch.append(item)
+
+        if len(batch) == size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def _import_record(row: ProductImportRow) -> ImportRecord:
+    """Converte uma linha validada no registro gravado com COPY."""
+    return row.id or new_id(), row.name, row.price, row.quantity
+
+
+def _split_repeated_ids(
+    records: list[tuple[int, ImportRecord]],
+) -> Iterator[list[tuple[int, ImportRecord]]]:
+    """Divide o bloco antes de cada ID repetido, mantendo a ordem das linhas.
+
+    Um upsert não pode alterar a mesma linha duas vezes; gravando as partes
+    em sequência, a última ocorrência de cada ID prevalece.
+    """
+    part: list[tuple[int, ImportRecord]] = []
+    seen: set[UUID] = set()
+
+    for line, record in records:
+        if record[0] in seen:
+            yield part
+            part, seen = [], set()
+
+        part.append((line, record))
+        seen.add(record[0])
+
+    if part:
+        yield part
+
+
+def _change_event(action: ChangeAction, product: ProductResponse) -> ChangeEvent:
+    return ChangeEvent.create(action, to_json(product))
+
+
+def _deleted_event(product_id: UUID) -> ChangeEvent:
+    return ChangeEvent.create("deleted", to_json({"id": product_id}))
+
+
+def _bulk_item_id(item: object) -> UUID | None:
+    """Retorna o ID de um item de lote, quando ele já possui um."""
+    if isinstance(item, UUID):
+        return item
+
+    return getattr(item, "id", None)
 
 
 class ProductService:
     """Camada responsável pela lógica de negócio dos produtos."""
 
-    def __init__(self, db_session: AsyncSession) -> None:
+    def __init__(self, db_session: AsyncSession, cache: ReadThroughCache) -> None:
+        self.db_session = db_session
         self.repository: ProductRepository = ProductRepository(db_session)
+        self.change_markers = ChangeMarkerRepository(db_session)
+        self.cache = cache
 
     async def create_product(self, product_request: ProductRequest) -> ProductResponse:
         """Cria um produto."""
         product_model = await self.repository.save(product_request)
+        product = ProductResponse.model_validate(product_model)
+        await self._mark_changed([_change_event("created", product)])
 
-        return ProductResponse.model_validate(product_model)
+        return product
 
     async def get_product_by_id(self, product_id: UUID) -> ProductResponse:
-        """Busca um produto pelo ID."""
-        product_model = await self.repository.find_by_id(product_id)
+        """Busca um produto pelo ID, passando pelo cache de leitura."""
+        payload, _ = await self.get_product_json(product_id)
 
-        if not product_model:
+        return ProductResponse.model_validate_json(payload)
+
+    async def get_product_json(self, product_id: UUID) -> tuple[bytes, int]:
+        """Busca um produto pelo ID já serializado em JSON, com a sua versão.
+
+        O cache é preenchido a partir do primário, para que o atraso de
+        replicação não grave valores antigos no cache.
+        """
+
+        async def load() -> bytes | None:
+            use_primary(self.db_session)
+            product_model = await self.repository.find_by_id(product_id)
+
+            if not product_model:
+                return None
+
+            return _pack_cached(
+                product_model.version,
+                to_json(ProductResponse.model_validate(product_model)),
+            )
+
+        value = await self.cache.get_or_load(_cache_key(product_id), load)
+
+        if value is None:
             raise ProductNotFoundException(product_id)
 
-        return ProductResponse.model_validate(product_model)
+        return _unpack_cached(value)
+
+    async def get_products_batch_json(self, product_ids: Sequence[UUID]) -> bytes:
+        """Busca vários produtos pelo ID e monta a resposta JSON, na ordem pedida.
+
+        Os produtos fora do cache são lidos do primário com uma única consulta.
+        IDs que outra requisição do processo já está carregando aguardam esse
+        carregamento em vez de consultá-los de novo.
+        """
+        ids_by_key = {_cache_key(product_id): product_id for product_id in product_ids}
+
+        async def load(keys: list[str]) -> dict[str, bytes]:
+            use_primary(self.db_session)
+            products = await self.repository.find_by_ids(
+                [ids_by_key[key] for key in keys]
+            )
+
+            return {
+                _cache_key(product_id): _pack_cached(
+                    product_model.version,
+                    to_json(ProductResponse.model_validate(product_model)),
+                )
+                for product_id, product_model in products.items()
+            }
+
+        values = await self.cache.get_many_or_load(ids_by_key, load)
+        items = (
+            _encode_batch_item(product_id, values.get(_cache_key(product_id)))
+            for product_id in product_ids
+        )
+
+        return b'{"items":[' + b",".join(items) + b"]}"
+
+    async def get_products_marker(self, fresh: bool = False) -> ChangeMarker:
+        """Retorna o marcador de alterações da coleção de produtos.
+
+        Sem `fresh`, o marcador vem do cache, que expira rapidamente. Com
+        `fresh`, é lido do banco pela mesma sessão (e réplica) que fará a
+        listagem; lido antes dela, o marcador nunca é mais novo que os dados.
+        """
+
+        async def load() -> bytes:
+            row = await self.change_markers.find(PRODUCTS_MARKER)
+            marker = ChangeMarker(*row) if row else UNCHANGED_MARKER
+
+            return marker.pack()
+
+        if fresh:
+            return ChangeMarker.unpack(await load())
+
+        value = await self.cache.get_or_load(
+            PRODUCTS_MARKER_CACHE_KEY,
+            load,
+            ttl=get_settings().CHANGE_MARKER_TTL_SECONDS,
+        )
+
+        return ChangeMarker.unpack(value)
+
+    async def list_all_products(self, query_params: ProductQueryParams) -> RawPage:
+        """Lista os produtos de forma paginada, filtrada e ordenada.
+
+        Os itens são projetados direto das linhas do ORM, sem criar um
+        ProductResponse por produto.
+        """
+        products_model, next_cursor = await self.repository.find_all(
+            *self.repository.build_filters(query_params),
+            limit=query_params.limit,
+            cursor=query_params.cursor,
+            sort_by=query_params.sort_by,
+            order=query_params.order,
+        )
+
+        return RawPage(
+            items=PRODUCT_SERIALIZER.to_dicts(products_model),
+            next_cursor=next_cursor,
+        )
+
+    async def search_products(self, search_params: ProductSearchParams) -> RawPage:
+        """Busca produtos pelo nome, por prefixo, trecho ou texto completo."""
+        products_model, next_cursor = await self.repository.search(
+            search_params.q,
+            search_params.mode,
+            limit=search_params.limit,
+            cursor=search_params.cursor,
+        )
+
+        return RawPage(
+            items=PRODUCT_SERIALIZER.to_dicts(products_model),
+            next_cursor=next_cursor,
+        )
 
-    async def list_all_products(self) -> list[ProductResponse]:
-        """Lista todos os produtos."""
-        products_model = await self.repository.find_all()
+    async def export_products(
+        self, export_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        """Exporta todo o catálogo em blocos, lendo de um cursor no servidor."""
+        if export_format is ExportFormat.CSV:
+            encode = _encode_csv
+            yield _encode_csv_header()
+        else:
+            encode = _encode_ndjson
 
-        return [ProductResponse.model_validate(product) for product in products_model]
+        async for rows in self.repository.stream_all(
+            columns=EXPORT_FIELDS, chunk_size=get_settings().EXPORT_CHUNK_SIZE
+        ):
+            yield encode(rows)
 
     async def update_product(
-        self, product_id: UUID, product_request: ProductUpdate
-    ) -> ProductResponse:
-        """Atualiza um produto existente."""
-        product_model = await self.repository.update(product_id, product_request)
+        self,
+        product_id: UUID,
+        product_request: ProductUpdate,
+        expected_versions: Collection[int] | None = None,
+    ) -> tuple[ProductResponse, int]:
+        """Atualiza um produto existente e retorna a sua nova versão.
+
+        Com `expected_versions`, a atualização só acontece se o produto ainda
+        estiver em uma dessas versões.
+        """
+        product_model = await self.repository.update(
+            product_id, product_request, expected_versions
+        )
 
         if not product_model:
-            raise ProductNotFoundException(product_id)
+            await self._raise_write_failed(product_id, expected_versions)
+
+        product = ProductResponse.model_validate(product_model)
+        await self._invalidate([product_id])
+        await self._mark_changed([_change_event("updated", product)])
 
-        return ProductResponse.model_validate(product_model)
+        return product, product_model.version
 
-    async def delete_product(self, product_id: UUID) -> None:
-        """Deleta um produto pelo ID."""
-        deleted = await self.repository.delete(product_id)
+    async def delete_product(
+        self, product_id: UUID, expected_versions: Collection[int] | None = None
+    ) -> None:
+        """Deleta um produto pelo ID, conferindo a versão quando informada."""
+        deleted = await self.repository.delete(product_id, expected_versions)
 
         if not deleted:
-            raise ProductNotFoundException(product_id)
+            await self._raise_write_failed(product_id, expected_versions)
+
+        await self._invalidate([product_id])
+        await self._mark_changed([_deleted_event(product_id)])
+
+    async def reserve_stock(
+        self, items: Sequence[StockReservationItem]
+    ) -> list[ProductResponse]:
+        """Reserva estoque de um ou mais produtos, sem vender além do disponível.
+
+        Cada quantidade é decrementada por um UPDATE condicional, sem leitura
+        prévia. Se algum produto não tiver estoque suficiente, nada é reservado.
+        """
+        requested = {item.id: item.quantity for item in items}
+        reserved = await self.repository.reserve_stock(list(requested.items()))
+
+        if len(reserved) < len(requested):
+            missing = [
+                product_id for product_id in requested if product_id not in reserved
+            ]
+            available = await self.repository.find_quantities(missing)
+
+            for product_id in missing:
+                if product_id not in available:
+                    raise ProductNotFoundException(product_id)
+
+            raise InsufficientStockException(
+                {
+                    product_id: (requested[product_id], available[product_id])
+                    for product_id in missing
+                }
+            )
+
+        products = [ProductResponse.model_validate(reserved[item.id]) for item in items]
+        await self._invalidate(reserved)
+        await self._mark_changed(
+            [_change_event("updated", product) for product in products]
+        )
+
+        return products
+
+    async def release_stock(
+        self, items: Sequence[StockReservationItem]
+    ) -> list[ProductResponse]:
+        """Devolve ao estoque quantidades reservadas de um ou mais produtos.
+
+        Se algum produto passaria da quantidade máxima em estoque, nada é
+        liberado.
+        """
+        released = await self.repository.release_stock(
+            [(item.id, item.quantity) for item in items]
+        )
+
+        if len(released) < len(items):
+            missing = [item.id for item in items if item.id not in released]
+            available = await self.repository.find_quantities(missing)
+
+            for product_id in missing:
+                if product_id not in available:
+                    raise ProductNotFoundException(product_id)
+
+            raise InvalidProductDataException(
+                "A liberação ultrapassa a quantidade máxima em estoque "
+                f"({MAX_QUANTITY})."
+            )
+
+        products = [ProductResponse.model_validate(released[item.id]) for item in items]
+        await self._invalidate(released)
+        await self._mark_changed(
+            [_change_event("updated", product) for product in products]
+        )
+
+        return products
+
+    async def bulk_create_products(
+        self, bulk_create: ProductBulkCreate, mode: BulkMode, chunk_size: int
+    ) -> ProductBulkResponse:
+        """Cria produtos em lote."""
+
+        async def create(chunk: Sequence[ProductRequest]) -> list[BulkOutcome]:
+            products_model = await self.repository.save_many(chunk, chunk_size)
+
+            return [
+                (product.id, BulkItemStatus.CREATED, product)
+                for product in products_model
+            ]
+
+        return await self._run_bulk(bulk_create.items, mode, chunk_size, create)
+
+    async def bulk_update_products(
+        self, bulk_update: ProductBulkUpdate, mode: BulkMode, chunk_size: int
+    ) -> ProductBulkResponse:
+        """Atualiza preço e/ou quantidade de produtos em lote."""
+
+        async def update(chunk: Sequence[ProductBulkUpdateItem]) -> list[BulkOutcome]:
+            updated = await self.repository.update_many(
+                [(item.id, item) for item in chunk], chunk_size
+            )
+            await self._invalidate(updated)
+
+            return [
+                (item.id, BulkItemStatus.UPDATED, updated[item.id])
+                if item.id in updated
+                else (item.id, BulkItemStatus.NOT_FOUND, None)
+                for item in chunk
+            ]
+
+        return await self._run_bulk(bulk_update.items, mode, chunk_size, update)
+
+    async def bulk_delete_products(
+        self, bulk_delete: ProductBulkDelete, mode: BulkMode, chunk_size: int
+    ) -> ProductBulkResponse:
+        """Deleta produtos em lote."""
+
+        async def delete(chunk: Sequence[UUID]) -> list[BulkOutcome]:
+            deleted = await self.repository.delete_many(chunk, chunk_size)
+            await self._invalidate(deleted)
+
+            return [
+                (product_id, BulkItemStatus.DELETED, None)
+                if product_id in deleted
+                else (product_id, BulkItemStatus.NOT_FOUND, None)
+                for product_id in chunk
+            ]
+
+        return await self._run_bulk(bulk_delete.ids, mode, chunk_size, delete)
+
+    async def _run_bulk[T](
+        self,
+        items: Sequence[T],
+        mode: BulkMode,
+        chunk_size: int,
+        operation: Callable[[Sequence[T]], Awaitable[list[BulkOutcome]]],
+    ) -> ProductBulkResponse:
+        """Executa uma operação em lote em uma única transação ou por bloco.
+
+        No modo atômico qualquer erro desfaz o lote inteiro. No modo por bloco,
+        cada bloco roda em um SAVEPOINT próprio e a falha de um bloco não
+        impede a gravação dos demais.
+        """
+        chunks = list(batched(items, chunk_size))
+        outcomes: list[BulkOutcome] = []
+        chunk_results: list[BulkChunkResult] = []
+
+        if mode is BulkMode.ATOMIC:
+            outcomes = await operation(items)
+
+        for index, chunk in enumerate(chunks):
+            detail: str | None = None
+
+            if mode is BulkMode.PER_CHUNK:
+                try:
+                    async with self.repository.savepoint():
+                        outcomes.extend(await operation(chunk))
+                except SQLAlchemyError as exception:
+                    detail = str(exception.__cause__ or exception)
+                    outcomes.extend(
+                        (_bulk_item_id(item), BulkItemStatus.FAILED, None)
+                        for item in chunk
+                    )
+
+            chunk_results.append(
+                BulkChunkResult(
+                    index=index,
+                    start=index * chunk_size,
+                    size=len(chunk),
+                    succeeded=detail is None,
+                    detail=detail,
+                )
+            )
+
+        results = [
+            ProductBulkItemResult(
+                index=index,
+                id=item_id,
+                status=item_status,
+                product=ProductResponse.model_validate(product) if product else None,
+            )
+            for index, (item_id, item_status, product) in enumerate(outcomes)
+        ]
+        events = [
+            _deleted_event(result.id)
+            if result.status is BulkItemStatus.DELETED
+            else _change_event(result.status.value, result.product)
+            for result in results
+            if result.status in CHANGED_STATUSES
+        ]
+
+        if events:
+            await self._mark_changed(events)
+
+        return ProductBulkResponse(items=results, chunks=chunk_results)
+
+    async def import_products(
+        self,
+        chunks: AsyncIterable[bytes],
+        import_format: ExportFormat,
+        batch_size: int,
+    ) -> ProductImportResponse:
+        """Importa produtos de um CSV ou NDJSON recebido em blocos de bytes.
+
+        Cada bloco de linhas é validado de uma vez, gravado com COPY em uma
+        tabela temporária e mesclado no catálogo com upsert pelo ID. Linhas
+        inválidas são recusadas sem interromper a importação.
+        """
+        tally = ImportTally(get_settings().IMPORT_MAX_REPORTED_REJECTS)
+        staging = await self.repository.create_staging_table(IMPORT_COLUMNS)
+        items = read_import_items(
+            chunks, import_format, get_settings().IMPORT_MAX_LINE_BYTES
+        )
+
+        async for batch in _abatched(items, batch_size):
+            tally.received += len(batch)
+            records = [
+                (line, _import_record(row))
+                for line, row in validate_import_items(batch, import_format, tally)
+            ]
+
+            for part in _split_repeated_ids(records):
+                await self._merge_import_records(staging, part, tally)
+
+        if tally.inserted or tally.updated:
+            # Os IDs inseridos não são conhecidos: o feed pede que os clientes
+            # recarreguem os produtos.
+            await self._mark_changed([ChangeEvent.create("reset")])
+
+        return tally.to_response()
+
+    async def _merge_import_records(
+        self,
+        staging: Table,
+        records: list[tuple[int, ImportRecord]],
+        tally: ImportTally,
+    ) -> None:
+        """Mescla um bloco validado no catálogo dentro de um SAVEPOINT.
+
+        Se o banco recusar o bloco, ele é dividido ao meio até isolar as linhas
+        recusadas, que são reportadas com o erro do banco.
+        """
+        try:
+            async with self.repository.savepoint():
+                inserted, updated = await self.repository.copy_upsert(
+                    staging, [record for _, record in records]
+                )
+        except SQLAlchemyError as exception:
+            if len(records) == 1:
+                tally.reject(records[0][0], str(exception.__cause__ or exception))
+                return
+
+            middle = len(records) // 2
+            await self._merge_import_records(staging, records[:middle], tally)
+            await self._merge_import_records(staging, records[middle:], tally)
+            return
+
+        tally.inserted += inserted
+        tally.updated += len(updated)
+        await self._invalidate(updated)
+
+    async def _raise_write_failed(
+        self, product_id: UUID, expected_versions: Collection[int] | None
+    ) -> NoReturn:
+        """Distingue produto inexistente de versão diferente da esperada."""
+        if expected_versions is not None:
+            current_version = await self.repository.find_version(product_id)
+
+            if current_version is not None:
+                raise PreconditionFailedException(product_id, current_version)
+
+        raise ProductNotFoundException(product_id)
+
+    async def _mark_changed(self, events: Sequence[ChangeEvent]) -> None:
+        """Registra uma alteração na coleção de produtos e publica os eventos.
+
+        O marcador é incrementado só depois do COMMIT, fora da transação:
+        dentro dela, o bloqueio da sua linha serializaria todas as escritas de
+        produtos até o COMMIT. Incrementado depois dos dados, ele nunca é mais
+        novo que eles.
+        """
+        on_commit(self.db_session, self._touch_marker)
+
+        if len(events) > get_settings().CHANGES_MAX_EVENTS_PER_WRITE:
+            events = [ChangeEvent.create("reset")]
+
+        await self._publish(events)
+
+    async def _touch_marker(self) -> None:
+        """Incrementa o marcador da coleção com um único comando em autocommit.
+
+        A linha do marcador fica bloqueada só durante o comando, sem esperar
+        pela ida e volta de um COMMIT.
+        """
+        async with session_scope(async_session_maker, autocommit=True) as session:
+            await ChangeMarkerRepository(session).touch(PRODUCTS_MARKER)
+
+        await self.cache.invalidate(PRODUCTS_MARKER_CACHE_KEY)
+
+    async def _publish(self, events: Sequence[ChangeEvent]) -> None:
+        """Publica os eventos no feed de alterações somente após o COMMIT.
+
+        Com a ponte do PostgreSQL, os eventos seguem com NOTIFY na transação
+        e chegam a todos os processos, inclusive este, pelo LISTEN.
+        """
+        if get_settings().CHANGES_NOTIFY:
+            await self.change_markers.notify(
+                get_settings().CHANGES_NOTIFY_CHANNEL, encode_notifications(events)
+            )
+            return
+
+        async def publish() -> None:
+            get_change_broadcaster().publish(events)
+
+        on_commit(self.db_session, publish)
+
+    async def _invalidate(self, product_ids: Iterable[UUID]) -> None:
+        """Invalida os produtos no cache agora e novamente após o COMMIT.
+
+        A segunda invalidação descarta valores antigos lidos por outras
+        requisições enquanto a transação de escrita ainda estava aberta.
+        """
+        keys = [_cache_key(product_id) for product_id in product_ids]
+
+        if not keys:
+            return
+
+        await self.cache.invalidate(*keys)
+        on_commit(self.db_session, lambda: self.cache.invalidate(*keys))
@@ -5,3 +5,95 @@ from invoke import task
 def run(context):
     """Inicia o servidor FastAPI"""
     context.run("PYTHONPATH=src uvicorn app.main:app --reload")
+
+
+@task(
+    help={
+        "workers": "Processos do servidor (padrão: SERVER_WORKERS ou um por CPU)",
+        "host": "Endereço de escuta (padrão: SERVER_HOST)",
+        "port": "Porta de escuta (padrão: SERVER_PORT)",
+    },
+)
+def serve(context, workers=None, host=None, port=None):
+    """Inicia o servidor de produção com vários workers"""
+    arguments = [
+        f"--{name} {value}"
+        for name, value in (("workers", workers), ("host", host), ("port", port))
+        if value is not None
+    ]
+
+    context.run(f"PYTHONPATH=src python -m app.server {' '.join(arguments)}")
+
+
+@task(
+    iterable=["suite"],
+    help={
+        "suite": "Suíte a executar: http, repository, service ou schemas (repetível)",
+        "rows": "Quantidade de produtos carregados antes das medições",
+        "requests": "Requisições por endpoint nos cenários HTTP",
+        "concurrency": "Workers concorrentes nos cenários HTTP",
+        "iterations": "Chamadas por cenário nas suítes de camadas",
+        "output": "Arquivo JSON com os resultados",
+        "baseline": "Resultado anterior usado na comparação",
+        "threshold": "Piora relativa tolerada antes de falhar (0.2 = 20%)",
+    },
+)
+def bench(
+    context,
+    suite=None,
+    rows=10_000,
+    requests=500,
+    concurrency=10,
+    iterations=1_000,
+    output="benchmarks/results/latest.json",
+    baseline=None,
+    threshold=0.2,
+):
+    """Executa os benchmarks da API e compara com um resultado anterior"""
+    arguments = [
+        f"--rows {rows}",
+        f"--requests {requests}",
+        f"--concurrency {concurrency}",
+        f"--iterations {iterations}",
+        f"--output {output}",
+        f"--threshold {threshold}",
+        *(f"--suite {name}" for name in suite or []),
+    ]
+    if baseline:
+        arguments.append(f"--baseline {baseline}")
+
+    context.run(f"PYTHONPATH=src python -m benchmarks run {' '.join(arguments)}")
+
+
+@task(
+    help={
+        "repeat": "Processos usados na medição das importações",
+        "top": "Quantidade de módulos e pacotes listados",
+        "imports_only": "Mede só as importações, sem iniciar o servidor",
+    },
+)
+def startup_profile(context, repeat=5, top=20, imports_only=False):
+    """Mostra o tempo de importação por módulo e até a primeira requisição"""
+    arguments = [f"--repeat {repeat}", f"--top {top}"]
+    if imports_only:
+        arguments.append("--imports-only")
+
+    context.run(f"PYTHONPATH=src python -m benchmarks.startup {' '.join(arguments)}")
+
+
+@task(
+    help={
+        "path": "Arquivo CSV ou NDJSON com os produtos",
+        "format": "csv ou ndjson (padrão: deduzido da extensão)",
+        "batch_size": "Linhas gravadas por vez (padrão: IMPORT_BATCH_SIZE)",
+    },
+)
+def import_products(context, path, format=None, batch_size=None):
+    """Importa produtos de um arquivo CSV ou NDJSON com COPY e upsert"""
+    arguments = [path]
+    if format:
+        arguments.append(f"--format {format}")
+    if batch_size:
+        arguments.append(f"--batch-size {batch_size}")
+
+    context.run(f"PYTHONPATH=src python -m app.importer {' '.join(arguments)}")
@@ -0,0 +1,132 @@
+import os
+import random
+from collections.abc import AsyncIterator
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+
+# As configurações exigem DB_URL já na importação. Sem ele, os testes que não
+# usam o banco rodam normalmente e os demais são ignorados.
+if "DB_URL" not in os.environ and not Path(".env").exists():
+    os.environ["DB_URL"] = "postgresql+asyncpg://postgres@localhost:5432/products"
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.database import (
+    async_session_maker,
+    get_engine,
+    get_replica_router,
+    session_scope,
+)
+from app.main import app
+from app.models import IdempotencyKeyModel, ProductModel
+from app.models.client_model import ClientModel
+from app.repositories import ProductRepository
+from app.schemas import ProductRequest
+
+NAME_PREFIX = "test-"
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[None]:
+    """Banco de DB_URL com as migrações aplicadas; sem ele, o teste é ignorado.
+
+    Os produtos, os clientes e as chaves de idempotência criados pelos testes
+    têm o prefixo `test-` e são removidos ao final, com os carrinhos.
+    """
+    try:
+        async with get_engine().connect() as connection:
+            await connection.execute(select(ProductModel.id).limit(1))
+    except (OSError, SQLAlchemyError) as error:
+        await get_replica_router().dispose()
+        pytest.skip(f"banco de dados indisponível: {error}")
+
+    try:
+        yield
+    finally:
+        async with session_scope(async_session_maker) as session:
+            await session.execute(
+                delete(ProductModel).where(ProductModel.name.startswith(NAME_PREFIX))
+            )
+            await session.execute(
+                delete(ClientModel).where(ClientModel.name.startswith(NAME_PREFIX))
+            )
+            await session.execute(
+                delete(IdempotencyKeyModel).where(
+                    IdempotencyKeyModel.key.startswith(NAME_PREFIX)
+                )
+            )
+
+        # As conexões pertencem ao loop de eventos deste teste.
+        await get_replica_router().dispose()
+
+
+@pytest.fixture
+async def client(database: None) -> AsyncIterator[AsyncClient]:
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+async def _create_products(count: int, quantity: int, label: str) -> list[UUID]:
+    async with session_scope(async_session_maker) as session:
+        products = await ProductRepository(session).save_many(
+            [
+                ProductRequest(
+                    name=f"{NAME_PREFIX}{label}-{index}", price=1.0, quantity=quantity
+                )
+                for index in range(count)
+            ],
+            chunk_size=1_000,
+        )
+
+    return [product.id for product in products]
+
+
+@pytest.fixture
+def create_products(database: None):
+    """Cria produtos de teste com `quantity` unidades e retorna os seus IDs."""
+    return _create_products
+
+
+def _random_cpf() -> str:
+    """CPF aleatório com os dígitos verificadores corretos."""
+    digits = [random.randrange(10) for _ in range(9)]
+
+    for length in (9, 10):
+        total = sum(digit * (length + 1 - index) for index, digit in enumerate(digits))
+        digits.append(total * 10 % 11 % 10)
+
+    return "".join(map(str, digits))
+
+
+@pytest.fixture
+def create_client(database: None):
+    """Cria um cliente de teste direto no banco e retorna o seu ID."""
+
+    async def create() -> UUID:
+        async with session_scope(async_session_maker) as session:
+            client = ClientModel(
+                name=f"{NAME_PREFIX}client",
+                cpf=_random_cpf(),
+                email=f"{NAME_PREFIX}{uuid4().hex}@example.com",
+                password="unused",
+                age=30,
+                sex="F",
+                address="Rua de Teste, 1",
+            )
+            session.add(client)
+            await session.flush()
+
+            return client.id
+
+    return create
@@ -0,0 +1,61 @@
+"""Consulta de vários produtos pelo ID em uma requisição."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.product_schema import MAX_BATCH_GET_IDS
+from tests.conftest import NAME_PREFIX
+
+pytestmark = pytest.mark.anyio
+
+
+async def batch_get(client, ids) -> list[dict]:
+    response = await client.post(
+        "/products/batch-get", json={"ids": [str(product_id) for product_id in ids]}
+    )
+    assert response.status_code == 200
+
+    return response.json()["items"]
+
+
+async def test_batch_get_keeps_the_request_order_and_reports_missing(
+    client, create_products
+):
+    first, second, third = await create_products(3, 5, "batch")
+    missing = uuid4()
+    # Um produto já em cache e os demais lidos do banco.
+    await client.get(f"/products/{second}")
+
+    items = await batch_get(client, [third, missing, second, first, second])
+
+    assert [(item["id"], item["found"]) for item in items] == [
+        (str(third), True),
+        (str(missing), False),
+        (str(second), True),
+        (str(first), True),
+        (str(second), True),
+    ]
+    assert items[1]["product"] is None
+    assert items[0]["product"]["name"] == f"{NAME_PREFIX}batch-2"
+
+
+async def test_batch_get_reflects_writes(client, create_products):
+    first, second = await create_products(2, 5, "batch-write")
+    await batch_get(client, [first, second])
+
+    await client.patch(f"/products/{first}", json={"quantity": 9})
+    await client.delete(f"/products/{second}")
+
+    items = await batch_get(client, [first, second])
+    assert items[0]["product"]["quantity"] == 9
+    assert items[1]["found"] is False
+
+
+@pytest.mark.parametrize("count", [0, MAX_BATCH_GET_IDS + 1])
+async def test_batch_get_limits_the_number_of_ids(client, count):
+    response = await client.post(
+        "/products/batch-get", json={"ids": [str(uuid4()) for _ in range(count)]}
+    )
+
+    assert response.status_code == 422
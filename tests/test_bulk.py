@@ -0,0 +1,133 @@
+"""Operações em lote sobre produtos."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.product_schema import MAX_QUANTITY
+from tests.conftest import NAME_PREFIX
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("mode", ["atomic", "per_chunk"])
+async def test_bulk_update_changes_every_item_and_bumps_versions(
+    client, create_products, mode
+):
+    first, second = await create_products(2, 5, f"bulk-{mode}")
+    before = await client.get(f"/products/{first}")
+
+    response = await client.patch(
+        "/products/bulk",
+        params={"mode": mode, "chunk_size": 1},
+        json={
+            "items": [
+                {"id": str(first), "quantity": 9},
+                {"id": str(second), "price": 2.5},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["status"] for item in items] == ["updated", "updated"]
+    assert items[0]["product"]["quantity"] == 9
+    assert items[1]["product"]["price"] == 2.5
+    assert all(chunk["succeeded"] for chunk in response.json()["chunks"])
+
+    after = await client.get(f"/products/{first}")
+    assert after.json()["quantity"] == 9
+    assert after.headers["ETag"] != before.headers["ETag"]
+
+
+async def test_updates_above_the_maximum_quantity_are_rejected(client, create_products):
+    (product_id,) = await create_products(1, 5, "update-limit")
+    quantity = MAX_QUANTITY + 1
+
+    single = await client.patch(f"/products/{product_id}", json={"quantity": quantity})
+    bulk = await client.patch(
+        "/products/bulk",
+        json={"items": [{"id": str(product_id), "quantity": quantity}]},
+    )
+
+    assert (single.status_code, bulk.status_code) == (422, 422)
+    response = await client.get(f"/products/{product_id}")
+    assert response.json()["quantity"] == 5
+
+
+@pytest.mark.parametrize("mode", ["atomic", "per_chunk"])
+async def test_bulk_create_returns_products_in_request_order(client, mode):
+    names = [f"{NAME_PREFIX}create-{mode}-{index}" for index in range(3)]
+
+    response = await client.post(
+        "/products/bulk",
+        params={"mode": mode, "chunk_size": 2},
+        json={"items": [{"name": name, "price": 1.0, "quantity": 1} for name in names]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["status"] for item in body["items"]] == ["created"] * 3
+    assert [item["product"]["name"] for item in body["items"]] == names
+    assert [chunk["size"] for chunk in body["chunks"]] == [2, 1]
+
+    for item in body["items"]:
+        product = await client.get(f"/products/{item['id']}")
+        assert product.status_code == 200
+
+
+async def test_bulk_update_reports_missing_products(client, create_products):
+    (product_id,) = await create_products(1, 5, "update-missing")
+    missing = uuid4()
+
+    response = await client.patch(
+        "/products/bulk",
+        json={
+            "items": [
+                {"id": str(missing), "quantity": 1},
+                {"id": str(product_id), "quantity": 2},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [(item["id"], item["status"]) for item in items] == [
+        (str(missing), "not_found"),
+        (str(product_id), "updated"),
+    ]
+
+
+async def test_bulk_delete_removes_products_and_reports_missing(
+    client, create_products
+):
+    first, second = await create_products(2, 5, "delete")
+    missing = uuid4()
+
+    response = await client.request(
+        "DELETE",
+        "/products/bulk",
+        json={"ids": [str(first), str(missing), str(second)]},
+    )
+
+    assert response.status_code == 200
+    assert [item["status"] for item in response.json()["items"]] == [
+        "deleted",
+        "not_found",
+        "deleted",
+    ]
+    assert (await client.get(f"/products/{first}")).status_code == 404
+
+
+async def test_bulk_rejects_repeated_ids(client):
+    product_id = str(uuid4())
+
+    update = await client.patch(
+        "/products/bulk",
+        json={"items": [{"id": product_id, "quantity": 1}] * 2},
+    )
+    delete = await client.request(
+        "DELETE", "/products/bulk", json={"ids": [product_id, product_id]}
+    )
+
+    assert (update.status_code, delete.status_code) == (422, 422)
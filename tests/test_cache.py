@@ -0,0 +1,144 @@
+"""Leituras depois de uma escrita nunca ficam antigas dentro do processo."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.core import on_commit
+from app.core.cache import InMemoryCache, ReadThroughCache
+from app.core.database import async_session_maker, session_scope
+from app.services.product_service import ProductService, _cache_key
+
+pytestmark = pytest.mark.anyio
+
+
+def make_cache() -> ReadThroughCache:
+    return ReadThroughCache(InMemoryCache(max_entries=100), ttl=60)
+
+
+def constant(value: bytes):
+    async def load() -> bytes:
+        return value
+
+    return load
+
+
+async def test_invalidation_during_load_discards_the_loaded_value():
+    cache = make_cache()
+    loading, release = asyncio.Event(), asyncio.Event()
+
+    async def load_old_row() -> bytes:
+        loading.set()
+        await release.wait()
+        return b"old"
+
+    reader = asyncio.create_task(cache.get_or_load("k", load_old_row))
+    await loading.wait()
+    await cache.invalidate("k")
+    release.set()
+
+    assert await reader == b"old"
+    assert await cache.backend.get("k") is None
+    assert await cache.get_or_load("k", constant(b"new")) == b"new"
+
+
+async def test_invalidation_during_batch_load_discards_only_that_key():
+    cache = make_cache()
+    loading, release = asyncio.Event(), asyncio.Event()
+
+    async def load_old_rows(keys: list[str]) -> dict[str, bytes]:
+        loading.set()
+        await release.wait()
+        return {key: b"old" for key in keys}
+
+    reader = asyncio.create_task(cache.get_many_or_load(["a", "b"], load_old_rows))
+    await loading.wait()
+    await cache.invalidate("a")
+    release.set()
+
+    assert await reader == {"a": b"old", "b": b"old"}
+    assert await cache.backend.get("a") is None
+    assert await cache.backend.get("b") == b"old"
+
+
+async def test_commit_invalidates_values_cached_during_the_write():
+    cache = make_cache()
+    product_id = uuid4()
+    key = _cache_key(product_id)
+
+    async with session_scope(async_session_maker) as session:
+        await ProductService(session, cache)._invalidate([product_id])
+        # Antes do COMMIT, outra requisição ainda lê e guarda a linha antiga.
+        await cache.get_or_load(key, constant(b"old"))
+        assert await cache.backend.get(key) == b"old"
+
+    assert await cache.backend.get(key) is None
+    assert await cache.get_or_load(key, constant(b"new")) == b"new"
+
+
+async def test_rollback_discards_commit_callbacks():
+    cache = make_cache()
+    product_id = uuid4()
+    key = _cache_key(product_id)
+    calls: list[str] = []
+
+    async def record() -> None:
+        calls.append("after_commit")
+
+    with pytest.raises(RuntimeError):
+        async with session_scope(async_session_maker) as session:
+            on_commit(session, record)
+            await ProductService(session, cache)._invalidate([product_id])
+            await cache.get_or_load(key, constant(b"current"))
+            raise RuntimeError
+
+    assert calls == []
+    # Sem o COMMIT, o valor lido durante a escrita continua correto.
+    assert await cache.backend.get(key) == b"current"
+
+
+async def test_concurrent_misses_share_a_single_load():
+    cache = make_cache()
+    release = asyncio.Event()
+    loads = 0
+
+    async def load() -> bytes:
+        nonlocal loads
+        loads += 1
+        await release.wait()
+        return b"value"
+
+    readers = [asyncio.create_task(cache.get_or_load("k", load)) for _ in range(50)]
+    # Deixa todas as leituras chegarem ao lock da chave antes de liberar a carga.
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*readers) == [b"value"] * 50
+    assert loads == 1
+    stats = await cache.stats()
+    assert (stats.misses, stats.coalesced) == (1, 49)
+
+
+async def test_batch_load_waits_for_keys_already_loading():
+    cache = make_cache()
+    release = asyncio.Event()
+    requested: list[list[str]] = []
+
+    async def load_one() -> bytes:
+        await release.wait()
+        return b"a"
+
+    async def load_many(keys: list[str]) -> dict[str, bytes]:
+        requested.append(keys)
+        return {key: key.encode() for key in keys}
+
+    single = asyncio.create_task(cache.get_or_load("a", load_one))
+    await asyncio.sleep(0)
+    batch = asyncio.create_task(cache.get_many_or_load(["a", "b"], load_many))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await single == b"a"
+    assert await batch == {"a": b"a", "b": b"b"}
+    assert requested == [["b"]]
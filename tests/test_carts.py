@@ -0,0 +1,104 @@
+"""Carrinhos de compras: totais calculados no banco e fechamento atômico."""
+
+from uuid import uuid4
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def cart_id(client, create_client) -> str:
+    response = await client.post(
+        "/carts/", json={"client_id": str(await create_client())}
+    )
+    assert response.status_code == 201
+
+    return response.json()["id"]
+
+
+async def put_item(client, cart_id: str, product_id, quantity: int) -> dict:
+    response = await client.put(
+        f"/carts/{cart_id}/items/{product_id}", json={"quantity": quantity}
+    )
+    assert response.status_code == 200
+
+    return response.json()
+
+
+async def test_totals_use_the_current_price_and_stock(client, create_products, cart_id):
+    first, second = await create_products(2, 5, "cart-totals")
+    await put_item(client, cart_id, first, 2)
+    await put_item(client, cart_id, second, 1)
+    cart = await put_item(client, cart_id, second, 3)
+
+    assert [line["product_id"] for line in cart["lines"]] == [str(first), str(second)]
+    assert (cart["item_count"], cart["subtotal"], cart["available"]) == (5, 5.0, True)
+
+    await client.patch(f"/products/{first}", json={"price": 2.5, "quantity": 1})
+    cart = (await client.get(f"/carts/{cart_id}")).json()
+
+    assert cart["lines"][0]["line_total"] == 5.0
+    assert cart["lines"][0]["in_stock"] is False
+    assert (cart["subtotal"], cart["available"]) == (8.0, False)
+
+
+async def test_checkout_takes_the_stock_and_empties_the_cart(
+    client, create_products, cart_id
+):
+    (product_id,) = await create_products(1, 5, "cart-checkout")
+    await put_item(client, cart_id, product_id, 2)
+
+    response = await client.post(f"/carts/{cart_id}/checkout")
+
+    assert response.status_code == 200
+    assert (response.json()["item_count"], response.json()["total"]) == (2, 2.0)
+    assert (await client.get(f"/products/{product_id}")).json()["quantity"] == 3
+    assert (await client.get(f"/carts/{cart_id}")).json()["lines"] == []
+
+
+async def test_checkout_without_stock_leaves_cart_and_stock_intact(
+    client, create_products, cart_id
+):
+    enough, short = await create_products(2, 1, "cart-short")
+    await put_item(client, cart_id, enough, 1)
+    before = await put_item(client, cart_id, short, 2)
+
+    response = await client.post(f"/carts/{cart_id}/checkout")
+
+    assert response.status_code == 409
+    assert [item["product_id"] for item in response.json()["items"]] == [str(short)]
+    after = (await client.get(f"/carts/{cart_id}")).json()
+    assert after["lines"] == before["lines"]
+    for product_id in (enough, short):
+        product = await client.get(f"/products/{product_id}")
+        assert product.json()["quantity"] == 1
+
+
+async def test_checkout_of_an_empty_cart_is_a_conflict(client, cart_id):
+    response = await client.post(f"/carts/{cart_id}/checkout")
+
+    assert response.status_code == 409
+
+
+async def test_removing_an_item_updates_the_totals(client, create_products, cart_id):
+    first, second = await create_products(2, 5, "cart-remove")
+    await put_item(client, cart_id, first, 1)
+    await put_item(client, cart_id, second, 2)
+
+    response = await client.delete(f"/carts/{cart_id}/items/{first}")
+
+    assert response.status_code == 200
+    assert [line["product_id"] for line in response.json()["lines"]] == [str(second)]
+    assert response.json()["item_count"] == 2
+
+
+async def test_unknown_cart_client_and_product_are_not_found(client, cart_id):
+    assert (await client.get(f"/carts/{uuid4()}")).status_code == 404
+    assert (
+        await client.post("/carts/", json={"client_id": str(uuid4())})
+    ).status_code == 404
+    response = await client.put(
+        f"/carts/{cart_id}/items/{uuid4()}", json={"quantity": 1}
+    )
+    assert response.status_code == 404
@@ -0,0 +1,47 @@
+"""O marcador de alterações da listagem não serializa as escritas de produtos."""
+
+import asyncio
+
+import pytest
+
+from app.core import get_cache
+from app.core.database import async_session_maker, session_scope
+from app.schemas import StockReservationItem
+from app.services import ProductService
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_write_does_not_wait_for_another_products_open_transaction(
+    client, create_products
+):
+    first, second = await create_products(2, 5, "marker-lock")
+
+    async with session_scope(async_session_maker) as session:
+        await ProductService(session, get_cache()).reserve_stock(
+            [StockReservationItem(id=first, quantity=1)]
+        )
+
+        # A escrita em `first` segue aberta; só a linha dele está bloqueada.
+        async with asyncio.timeout(5):
+            response = await client.post(
+                f"/products/{second}/reserve", json={"quantity": 1}
+            )
+
+        assert response.status_code == 200
+
+
+async def test_list_etag_changes_after_a_write(client, create_products):
+    (product_id,) = await create_products(1, 5, "marker-etag")
+    before = await client.get("/products/")
+
+    response = await client.post(
+        f"/products/{product_id}/reserve", json={"quantity": 1}
+    )
+    assert response.status_code == 200
+
+    after = await client.get(
+        "/products/", headers={"If-None-Match": before.headers["ETag"]}
+    )
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before.headers["ETag"]
@@ -0,0 +1,44 @@
+"""Compressão negociada pelo Accept-Encoding e a ETag das respostas."""
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "identity"])
+async def test_not_modified_repeats_the_etag_of_the_full_response(
+    client, create_products, encoding
+):
+    (product_id,) = await create_products(1, 5, "compress-etag")
+    headers = {"Accept-Encoding": encoding}
+
+    # A consulta de um produto fica abaixo do tamanho mínimo de compressão.
+    full = await client.get(f"/products/{product_id}", headers=headers)
+    assert full.status_code == 200
+    assert "content-encoding" not in full.headers
+
+    cached = await client.get(
+        f"/products/{product_id}",
+        headers={**headers, "If-None-Match": full.headers["ETag"]},
+    )
+
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == full.headers["ETag"]
+
+
+async def test_compressed_and_not_modified_responses_share_a_weak_etag(
+    client, create_products
+):
+    await create_products(20, 5, "compress-list")
+    headers = {"Accept-Encoding": "gzip"}
+
+    full = await client.get("/products/", headers=headers)
+    assert full.headers["Content-Encoding"] == "gzip"
+
+    cached = await client.get(
+        "/products/", headers={**headers, "If-None-Match": full.headers["ETag"]}
+    )
+
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == full.headers["ETag"]
+    assert full.headers["ETag"].startswith("W/")
@@ -0,0 +1,75 @@
+"""Chaves de idempotência nas escritas de produtos."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from tests.conftest import NAME_PREFIX
+
+pytestmark = pytest.mark.anyio
+
+
+def new_key() -> dict[str, str]:
+    return {"Idempotency-Key": f"{NAME_PREFIX}{uuid4()}"}
+
+
+def new_product(label: str) -> dict:
+    return {"name": f"{NAME_PREFIX}{label}", "price": 1.0, "quantity": 5}
+
+
+async def count_named(client, name: str) -> int:
+    response = await client.get("/products/", params={"name_prefix": name})
+
+    return len(response.json()["items"])
+
+
+async def test_repeated_request_replays_the_stored_response(client):
+    headers, product = new_key(), new_product("idem-replay")
+
+    first = await client.post("/products/", json=product, headers=headers)
+    second = await client.post("/products/", json=product, headers=headers)
+
+    assert (first.status_code, second.status_code) == (201, 201)
+    assert second.json() == first.json()
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert await count_named(client, product["name"]) == 1
+
+
+async def test_reusing_a_key_for_another_request_is_rejected(client):
+    headers = new_key()
+
+    first = await client.post(
+        "/products/", json=new_product("idem-first"), headers=headers
+    )
+    second = await client.post(
+        "/products/", json=new_product("idem-second"), headers=headers
+    )
+
+    assert (first.status_code, second.status_code) == (201, 422)
+    assert await count_named(client, f"{NAME_PREFIX}idem-second") == 0
+
+
+async def test_concurrent_requests_with_one_key_write_once(client):
+    headers, product = new_key(), new_product("idem-race")
+
+    responses = await asyncio.gather(
+        *(client.post("/products/", json=product, headers=headers) for _ in range(5))
+    )
+
+    assert {response.status_code for response in responses} == {201}
+    assert len({response.json()["id"] for response in responses}) == 1
+    assert await count_named(client, product["name"]) == 1
+
+
+async def test_failed_write_releases_the_key(client, create_products):
+    (product_id,) = await create_products(1, 1, "idem-retry")
+    headers, path = new_key(), f"/products/{product_id}/reserve"
+
+    refused = await client.post(path, json={"quantity": 2}, headers=headers)
+    await client.post(f"/products/{product_id}/release", json={"quantity": 1})
+    retried = await client.post(path, json={"quantity": 2}, headers=headers)
+
+    assert (refused.status_code, retried.status_code) == (409, 200)
+    assert retried.json()["quantity"] == 0
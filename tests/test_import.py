@@ -0,0 +1,79 @@
+"""Importação de produtos a partir de CSV e NDJSON."""
+
+import json
+
+import pytest
+
+from app.services.product_import import iter_csv_items, iter_lines
+from tests.conftest import NAME_PREFIX
+
+pytestmark = pytest.mark.anyio
+
+
+async def chunks_of(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def test_csv_records_span_chunks_and_quoted_line_breaks():
+    data = b'name,price,quantity\r\n"a\nb",1.5,2\r\nc,2,3\r\nd,1\r\n'
+    lines = iter_lines(chunks_of(data, 3), max_line_bytes=100)
+
+    items = [item async for item in iter_csv_items(lines, max_line_bytes=100)]
+
+    assert items == [
+        (2, {"name": "a\nb", "price": "1.5", "quantity": "2"}),
+        (4, {"name": "c", "price": "2", "quantity": "3"}),
+        (5, "Esperadas 3 colunas, encontradas 2"),
+    ]
+
+
+async def test_csv_import_creates_products_and_rejects_invalid_rows(client):
+    csv = (
+        "name,price,quantity\n"
+        f"{NAME_PREFIX}csv-1,10.5,3\n"
+        f"{NAME_PREFIX}csv-2,-1,3\n"
+        f"{NAME_PREFIX}csv-3,2\n"
+    )
+
+    response = await client.post(
+        "/products/import",
+        params={"format": "csv"},
+        content=csv.encode(),
+        headers={"Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["received"], body["inserted"], body["rejected"]) == (3, 1, 2)
+    assert [reject["line"] for reject in body["rejects"]] == [3, 4]
+    assert "price" in body["rejects"][0]["detail"]
+
+
+async def test_ndjson_import_upserts_existing_ids(client, create_products):
+    (product_id,) = await create_products(1, 5, "ndjson-existing")
+    lines = [
+        {
+            "id": str(product_id),
+            "name": f"{NAME_PREFIX}ndjson-new",
+            "price": 3.0,
+            "quantity": 8,
+        },
+        {"name": f"{NAME_PREFIX}ndjson-created", "price": 1.0, "quantity": 1},
+        {"name": f"{NAME_PREFIX}ndjson-bad", "price": "free", "quantity": 1},
+    ]
+    ndjson = "\n".join(json.dumps(line) for line in lines) + "\nnot json\n"
+
+    response = await client.post(
+        "/products/import",
+        content=ndjson.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["received"], body["inserted"], body["updated"]) == (4, 1, 1)
+    assert [reject["line"] for reject in body["rejects"]] == [3, 4]
+
+    product = (await client.get(f"/products/{product_id}")).json()
+    assert (product["name"], product["quantity"]) == (f"{NAME_PREFIX}ndjson-new", 8)
@@ -0,0 +1,48 @@
+"""As métricas separam as rotas pelo template completo, com o prefixo."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.core.metrics import metrics_registry
+from app.middlewares.timing_middleware import UNMATCHED_ROUTE, route_template
+
+
+def scope_for(path: str, template: str | None) -> dict:
+    route = SimpleNamespace(path=template) if template is not None else None
+    return {"path": path, "root_path": "", "route": route}
+
+
+@pytest.mark.parametrize(
+    ("path", "template", "expected"),
+    [
+        # Rotas com o prefixo do include_router no template.
+        ("/products/1", "/products/{product_id}", "/products/{product_id}"),
+        # Rotas com o template relativo ao router.
+        ("/products/1", "/{product_id}", "/products/{product_id}"),
+        ("/clients/1", "/{client_id}", "/clients/{client_id}"),
+        (
+            "/carts/1/items/2",
+            "/{cart_id}/items/{product_id}",
+            "/carts/{cart_id}/items/{product_id}",
+        ),
+        ("/products/", "/", "/products/"),
+        (
+            "/products/1/reserve",
+            "/{product_id}/reserve",
+            "/products/{product_id}/reserve",
+        ),
+        ("/nowhere", None, UNMATCHED_ROUTE),
+    ],
+)
+def test_route_template_includes_the_router_prefix(path, template, expected):
+    assert route_template(scope_for(path, template)) == expected
+
+
+@pytest.mark.anyio
+async def test_metrics_label_routes_with_their_prefix(client):
+    response = await client.get(f"/products/{uuid4()}")
+    assert response.status_code == 404
+
+    assert 'route="/products/{product_id}"' in metrics_registry.render()
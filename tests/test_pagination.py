@@ -0,0 +1,91 @@
+"""Paginação por cursor, filtros e ordenação da listagem de produtos."""
+
+import pytest
+
+from tests.conftest import NAME_PREFIX
+
+pytestmark = pytest.mark.anyio
+
+PRICES = [3.0, 1.0, 2.0, 2.0, 5.0]
+
+
+@pytest.fixture
+async def products(client) -> list[dict]:
+    """Produtos com o prefixo `test-page-`, com empate no preço 2.0."""
+    response = await client.post(
+        "/products/bulk",
+        json={
+            "items": [
+                {"name": f"{NAME_PREFIX}page-{index}", "price": price, "quantity": 1}
+                for index, price in enumerate(PRICES)
+            ]
+        },
+    )
+
+    return [item["product"] for item in response.json()["items"]]
+
+
+async def walk(client, **params) -> list[dict]:
+    """Percorre todas as páginas seguindo `next_cursor`."""
+    items: list[dict] = []
+    cursor = None
+
+    while True:
+        response = await client.get(
+            "/products/",
+            params={**params, **({"cursor": cursor} if cursor else {})},
+        )
+        assert response.status_code == 200
+        page = response.json()
+        items += page["items"]
+        cursor = page["next_cursor"]
+
+        if cursor is None:
+            return items
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_cursor_pages_cover_every_product_once_in_order(client, products, order):
+    items = await walk(
+        client,
+        name_prefix=f"{NAME_PREFIX}page-",
+        sort_by="price",
+        order=order,
+        limit=2,
+    )
+
+    expected = sorted(products, key=lambda product: (product["price"], product["id"]))
+    if order == "desc":
+        expected.reverse()
+    assert [item["id"] for item in items] == [product["id"] for product in expected]
+
+
+async def test_filters_apply_before_pagination(client, products):
+    items = await walk(
+        client,
+        name_prefix=f"{NAME_PREFIX}page-",
+        min_price=2,
+        max_price=3,
+        limit=1,
+    )
+
+    assert sorted(item["price"] for item in items) == [2.0, 2.0, 3.0]
+
+
+async def test_invalid_cursors_are_rejected(client, products):
+    params = {"name_prefix": f"{NAME_PREFIX}page-", "limit": 2}
+    first = (await client.get("/products/", params=params)).json()
+
+    malformed = await client.get("/products/", params={**params, "cursor": "!!"})
+    other_sort = await client.get(
+        "/products/",
+        params={**params, "sort_by": "price", "cursor": first["next_cursor"]},
+    )
+
+    assert (malformed.status_code, other_sort.status_code) == (400, 400)
+
+
+async def test_inverted_ranges_are_rejected(client):
+    response = await client.get("/products/", params={"min_price": 5, "max_price": 1})
+
+    assert response.status_code == 422
@@ -0,0 +1,90 @@
+"""Busca de produtos pelo nome nos modos prefix, contains e fulltext."""
+
+import pytest
+
+from tests.conftest import NAME_PREFIX
+
+pytestmark = pytest.mark.anyio
+
+NAMES = ["zq Blue Mug", "zq Red Mug", "zq Blue Cap", "zq 100%_off"]
+
+
+@pytest.fixture
+async def products(client) -> None:
+    response = await client.post(
+        "/products/bulk",
+        json={
+            "items": [
+                {"name": f"{NAME_PREFIX}{name}", "price": 1.0, "quantity": 1}
+                for name in NAMES
+            ]
+        },
+    )
+    assert response.status_code == 200
+
+
+async def search(client, q: str, mode: str, **params) -> list[str]:
+    """Nomes encontrados em todas as páginas da busca, sem o prefixo de teste."""
+    names: list[str] = []
+    cursor = None
+
+    while True:
+        response = await client.get(
+            "/products/search",
+            params={
+                "q": q,
+                "mode": mode,
+                **params,
+                **({"cursor": cursor} if cursor else {}),
+            },
+        )
+        assert response.status_code == 200
+        page = response.json()
+        names += [item["name"].removeprefix(NAME_PREFIX) for item in page["items"]]
+        cursor = page["next_cursor"]
+
+        if cursor is None:
+            return names
+
+
+@pytest.mark.parametrize(
+    ("q", "expected"),
+    [
+        ("zq B", ["zq Blue Cap", "zq Blue Mug"]),
+        ("zq 100%", ["zq 100%_off"]),
+        ("zq _", []),
+    ],
+)
+async def test_prefix_search_matches_the_start_of_the_name(
+    client, products, q, expected
+):
+    assert await search(client, f"{NAME_PREFIX}{q}", "prefix", limit=1) == expected
+
+
+@pytest.mark.parametrize(
+    ("q", "expected"),
+    [
+        ("MUG", ["zq Blue Mug", "zq Red Mug"]),
+        ("%_o", ["zq 100%_off"]),
+    ],
+)
+async def test_contains_search_ignores_case_and_escapes_wildcards(
+    client, products, q, expected
+):
+    assert await search(client, q, "contains", limit=1) == expected
+
+
+async def test_fulltext_search_requires_every_word(client, products):
+    assert await search(client, "blue mug", "fulltext") == ["zq Blue Mug"]
+    assert sorted(await search(client, "zq blue", "fulltext", limit=1)) == [
+        "zq Blue Cap",
+        "zq Blue Mug",
+    ]
+
+
+async def test_short_contains_search_is_rejected(client):
+    response = await client.get(
+        "/products/search", params={"q": "mu", "mode": "contains"}
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,21 @@
+"""O servidor avisa quando o feed de alterações fica restrito a cada worker."""
+
+import pytest
+
+from app.core import get_settings
+from app.server import warn_if_changes_stay_in_each_worker
+
+
+@pytest.mark.parametrize(
+    ("workers", "notify", "warned"),
+    [(4, False, True), (4, True, False), (1, False, False)],
+)
+def test_warns_about_changes_only_with_workers_and_without_notify(
+    workers, notify, warned, caplog, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "CHANGES_NOTIFY", notify)
+
+    with caplog.at_level("WARNING", logger="app.server"):
+        warn_if_changes_stay_in_each_worker(workers)
+
+    assert ("changes_notify_disabled" in caplog.text) is warned
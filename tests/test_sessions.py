@@ -0,0 +1,67 @@
+"""As escritas confirmam a transação antes de enviar a resposta."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+
+from app.core import get_cache
+from app.core.database import RoutingSession
+from app.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_write_commits_and_invalidates_before_the_response(
+    create_products, monkeypatch
+):
+    (product_id,) = await create_products(1, 5, "commit-order")
+    events: list[str] = []
+    cache = get_cache()
+    invalidate = cache.invalidate
+
+    async def record_invalidate(*keys: str) -> None:
+        events.append("invalidate")
+        await invalidate(*keys)
+
+    def record_commit(_session) -> None:
+        events.append("commit")
+
+    async def recording_app(scope, receive, send):
+        async def record_send(message) -> None:
+            if message["type"] == "http.response.start":
+                events.append("response")
+            await send(message)
+
+        await app(scope, receive, record_send)
+
+    monkeypatch.setattr(cache, "invalidate", record_invalidate)
+    event.listen(RoutingSession, "after_commit", record_commit)
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=recording_app), base_url="http://test"
+        ) as client:
+            response = await client.patch(
+                f"/products/{product_id}", json={"quantity": 7}
+            )
+    finally:
+        event.remove(RoutingSession, "after_commit", record_commit)
+
+    assert response.status_code == 200
+    assert events[-1] == "response"
+    assert "invalidate" in events[events.index("commit") :]
+
+
+async def test_read_after_write_sees_the_write(client, create_products):
+    (product_id,) = await create_products(1, 5, "read-after-write")
+
+    # Aquece o cache com a versão anterior à escrita.
+    before = await client.get(f"/products/{product_id}")
+    assert before.json()["quantity"] == 5
+
+    response = await client.patch(f"/products/{product_id}", json={"quantity": 7})
+    assert response.status_code == 200
+
+    response = await client.get(f"/products/{product_id}")
+    assert response.json()["quantity"] == 7
+    assert response.headers["ETag"] != before.headers["ETag"]
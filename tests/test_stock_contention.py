@@ -0,0 +1,129 @@
+"""Reservas concorrentes nunca vendem além do estoque."""
+
+import asyncio
+import random
+from collections import Counter
+from time import perf_counter
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.database import async_session_maker, session_scope
+from app.repositories import ProductRepository
+from app.schemas.product_schema import MAX_QUANTITY
+
+pytestmark = pytest.mark.anyio
+
+RESERVERS = 200
+STOCK = 100
+# As reservas de um produto disputado esperam pelo bloqueio da linha dele, mas
+# devem manter pelo menos metade do throughput da mesma carga espalhada por
+# produtos distintos. Com o banco local o bloqueio dura bem menos que o
+# processamento da requisição; com latência alta até o banco, a fila em uma
+# única linha domina e a razão cai naturalmente.
+MIN_HOT_SKU_THROUGHPUT_RATIO = 0.5
+
+
+async def reserve_all(
+    client: AsyncClient, requests: list[tuple[str, dict]]
+) -> tuple[Counter[int], float]:
+    """Envia as reservas ao mesmo tempo; retorna os status e o tempo total."""
+    started = perf_counter()
+    responses = await asyncio.gather(
+        *(client.post(path, json=payload) for path, payload in requests)
+    )
+
+    return Counter(response.status_code for response in responses), (
+        perf_counter() - started
+    )
+
+
+def reserve_each(product_ids: list[UUID]) -> list[tuple[str, dict]]:
+    return [
+        (f"/products/{product_id}/reserve", {"quantity": 1})
+        for product_id in product_ids
+    ]
+
+
+async def find_quantities(product_ids: list[UUID]) -> dict[UUID, int]:
+    async with session_scope(async_session_maker, read_only=True) as session:
+        return await ProductRepository(session).find_quantities(product_ids)
+
+
+async def test_hot_sku_never_oversells(client, create_products):
+    (product_id,) = await create_products(1, STOCK, "hot")
+
+    statuses, _ = await reserve_all(client, reserve_each([product_id] * RESERVERS))
+
+    assert statuses == Counter({200: STOCK, 409: RESERVERS - STOCK})
+    assert await find_quantities([product_id]) == {product_id: 0}
+
+
+async def test_batch_reservations_in_any_order_never_oversell(client, create_products):
+    pair = await create_products(2, STOCK, "pair")
+    generator = random.Random(42)
+    requests = []
+
+    # Ordens diferentes exercitam o bloqueio em ordem de ID contra deadlocks.
+    for _ in range(RESERVERS):
+        items = [{"id": str(product_id), "quantity": 1} for product_id in pair]
+        generator.shuffle(items)
+        requests.append(("/products/reserve", {"items": items}))
+
+    statuses, _ = await reserve_all(client, requests)
+
+    assert statuses == Counter({200: STOCK, 409: RESERVERS - STOCK})
+    assert await find_quantities(pair) == dict.fromkeys(pair, 0)
+
+
+@pytest.mark.parametrize("action", ["reserve", "release"])
+async def test_quantities_above_the_column_limit_are_rejected(
+    client, create_products, action
+):
+    (product_id,) = await create_products(1, 5, f"limit-{action}")
+
+    response = await client.post(
+        f"/products/{product_id}/{action}", json={"quantity": 10**12}
+    )
+
+    assert response.status_code == 422
+    assert await find_quantities([product_id]) == {product_id: 5}
+
+
+async def test_release_past_the_maximum_quantity_changes_nothing(
+    client, create_products
+):
+    first, second = await create_products(2, 5, "overflow")
+
+    response = await client.post(
+        "/products/release",
+        json={
+            "items": [
+                {"id": str(first), "quantity": 1},
+                {"id": str(second), "quantity": MAX_QUANTITY - 1},
+            ]
+        },
+    )
+
+    assert response.status_code == 422
+    assert await find_quantities([first, second]) == {first: 5, second: 5}
+
+
+async def test_hot_sku_is_not_much_slower_than_distinct_skus(client, create_products):
+    (hot,) = await create_products(1, RESERVERS, "hot-rps")
+    spread = await create_products(RESERVERS, 1, "spread-rps")
+    # Abre as conexões do pool antes das medições.
+    await reserve_all(client, reserve_each(await create_products(20, 1, "warmup")))
+
+    hot_statuses, hot_elapsed = await reserve_all(
+        client, reserve_each([hot] * RESERVERS)
+    )
+    spread_statuses, spread_elapsed = await reserve_all(client, reserve_each(spread))
+
+    assert hot_statuses == spread_statuses == Counter({200: RESERVERS})
+    # Mesma quantidade de reservas: a razão dos tempos é a dos throughputs.
+    ratio = spread_elapsed / hot_elapsed
+    assert ratio >= MIN_HOT_SKU_THROUGHPUT_RATIO, (
+        f"produto disputado com {ratio:.0%} do throughput de produtos distintos"
+    )